@@ -0,0 +1,147 @@
+# ===========================================================================
+# Entry Point ASGI de la Aplicacion
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: API (Presentacion)
+# Compatible: Docker / servidores ASGI (hypercorn, uvicorn)
+# ===========================================================================
+#
+# POR QUE UNA APP ASGI:
+# - api/index.py (WSGI) ocupa un thread por request mientras espera a la BD
+# - Esta app atiende las mismas rutas con handlers async: mientras un
+#   request espera a la BD, el worker sigue atendiendo otros
+# - La app WSGI sigue siendo la de Vercel y la de siempre; esta es opcional
+#
+# LIMITE REAL DE CONCURRENCIA (por worker):
+# - ALUMNO_REPOSITORY=postgres: driver async; las esperas a la BD no
+#   ocupan threads (tope: PG_POOL_MAX_SIZE conexiones a la vez)
+# - supabase (default) y sqlite: el cliente es sincronico y cada llamada
+#   corre en un thread (ThreadedAlumnoRepository). Con supabase hay como
+#   mucho SUPABASE_HTTP_MAX_CONNECTIONS (20) llamadas a la BD en vuelo;
+#   los demas requests esperan en cola
+#
+# EJECUCION:
+#   hypercorn api.asgi:app --bind 0.0.0.0:8000
+#   uvicorn api.asgi:app --host 0.0.0.0 --port 8000
+#
+# ===========================================================================
+
+"""
+Entry point ASGI (Quart) con las mismas rutas que api/index.py.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Agregar directorio raiz al path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+# Cargar variables de entorno (ANTES de importar config; ver api/index.py)
+if (ROOT_DIR / '.env').exists():
+    from dotenv import load_dotenv
+    load_dotenv(ROOT_DIR / '.env')
+
+from typing import Optional
+
+from quart import Quart, send_from_directory
+
+from api.async_routes import async_api_bp
+from api.json_provider import AlumnoJSONProvider
+from application.async_alumno_service import (
+    AsyncAlumnoService,
+    create_async_alumno_service
+)
+
+
+def create_asgi_app(alumno_service: Optional[AsyncAlumnoService] = None) -> Quart:
+    """
+    Factory function para crear la aplicacion ASGI.
+    
+    POR QUE EL SERVICIO SE CREA AL ARRANCAR (before_serving):
+    - El pool async de conexiones pertenece al event loop del servidor
+    - Se crea una vez por worker y se cierra al apagar (after_serving)
+    
+    Args:
+        alumno_service: Servicio ya construido (tests); si es None se crea
+            con create_async_alumno_service() al arrancar
+    
+    Returns:
+        Aplicacion Quart configurada
+    """
+    app = Quart(
+        __name__,
+        static_folder=str(ROOT_DIR / 'static'),
+        static_url_path='/static'
+    )
+    
+    app.config['JSON_SORT_KEYS'] = False
+    app.json = AlumnoJSONProvider(app)
+    
+    config = None
+    try:
+        from infrastructure.config import get_config
+        config = get_config()
+        app.config['SECRET_KEY'] = config.FLASK_SECRET_KEY
+    except Exception:
+        # Sin .env (ej: solo ejecutando tests)
+        app.config['SECRET_KEY'] = 'dev-secret-key'
+    
+    # Fuera del try por el mismo motivo que en api/index.py
+    if config is not None:
+        from api.middleware.auth import configure_jwks
+        configure_jwks(config)
+    
+    if alumno_service is not None:
+        app.extensions['async_alumno_service'] = alumno_service
+    
+    @app.before_serving
+    async def iniciar_servicio():
+        """Crea el servicio (y su pool) dentro del event loop."""
+        if 'async_alumno_service' not in app.extensions:
+            app.extensions['async_alumno_service'] = await create_async_alumno_service()
+    
+    @app.after_serving
+    async def cerrar_servicio():
+        """Cierra las conexiones del servicio al apagar."""
+        servicio = app.extensions.pop('async_alumno_service', None)
+        if servicio is not None:
+            await servicio.cerrar()
+    
+    app.register_blueprint(async_api_bp)
+    
+    @app.route('/')
+    async def index():
+        """Sirve la pagina principal del frontend."""
+        return await send_from_directory(app.static_folder, 'index.html')
+    
+    @app.route('/<path:path>')
+    async def serve_static(path):
+        """Sirve archivos estaticos o retorna index.html."""
+        static_file = ROOT_DIR / 'static' / path
+        if static_file.exists():
+            return await send_from_directory(app.static_folder, path)
+        return await send_from_directory(app.static_folder, 'index.html')
+    
+    return app
+
+
+# Variable que buscan hypercorn/uvicorn: api.asgi:app
+app = create_asgi_app()
+
+
+# ===========================================================================
+# ENTRY POINT PARA EJECUCION LOCAL
+# ===========================================================================
+
+if __name__ == '__main__':
+    port = int(os.getenv('PORT', 5000))
+    
+    print("=" * 60)
+    print("  APP DIDACTICA CRUD - Servidor Local (ASGI)")
+    print("=" * 60)
+    print(f"  API: http://localhost:{port}/api/health")
+    print("=" * 60)
+    
+    app.run(host='0.0.0.0', port=port)
@@ -0,0 +1,385 @@
+# ===========================================================================
+# Rutas de la API (ASGI)
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: API (Presentacion)
+# ===========================================================================
+#
+# POR QUE RUTAS ASYNC:
+# - En api/routes.py cada request ocupa un thread de gunicorn mientras
+#   espera a Supabase: con --workers 2, pocas consultas lentas saturan
+# - Aca cada handler hace "await" y el event loop atiende otros requests
+#   mientras tanto (cuantos pueden esperar a la BD a la vez depende del
+#   backend: ver "LIMITE REAL DE CONCURRENCIA" en api/asgi.py)
+#
+# MISMO CONTRATO QUE api/routes.py:
+# - Mismas URLs, parametros, codigos HTTP y formato de errores
+# - El parseo de parametros y de CSV y el armado de resultados se
+#   reutilizan de alli
+#
+# ===========================================================================
+
+"""
+Rutas async de la API REST para gestionar Alumnos (Quart).
+"""
+
+# Configuracion de path
+import sys
+from pathlib import Path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import os
+
+from quart import Blueprint, Response, current_app, jsonify, request
+
+from api.json_provider import dumps
+from api.middleware.async_auth import require_auth_async
+from api.routes import (
+    _con_validadores,
+    _estado_salud,
+    _no_modificado,
+    _parse_campos_arg,
+    _parse_csv,
+    _parse_int_arg,
+    _parse_precondicion,
+    _respuesta_no_modificado,
+    _resultado_to_dict,
+    _validadores_alumno,
+    _validadores_listado
+)
+from application.alumno_service import (
+    ESTADO_CREADO,
+    ESTADO_DNI_DUPLICADO,
+    ESTADO_ERROR_VALIDACION
+)
+from application.async_alumno_service import AsyncAlumnoService
+from domain.exceptions import (
+    DomainException,
+    ValidacionError,
+    AlumnoNoEncontrado,
+    DNIDuplicado,
+    ModificacionConcurrente
+)
+
+
+async_api_bp = Blueprint('api', __name__, url_prefix='/api')
+
+
+# ===========================================================================
+# ENDPOINTS PUBLICOS
+# ===========================================================================
+
+@async_api_bp.route('/health', methods=['GET'])
+async def health_check():
+    """Health check (publico). Ver api/routes.py."""
+    return jsonify(_estado_salud()), 200
+
+
+@async_api_bp.route('/config', methods=['GET'])
+async def get_config():
+    """Configuracion publica del frontend. Ver api/routes.py."""
+    return jsonify({
+        'supabase_url': os.getenv('SUPABASE_URL', ''),
+        'supabase_key': os.getenv('SUPABASE_KEY', ''),
+        'session_timeout': int(os.getenv('SESSION_TIMEOUT_SECONDS', '900'))
+    }), 200
+
+
+# ===========================================================================
+# ENDPOINTS CRUD (Protegidos)
+# ===========================================================================
+
+@async_api_bp.route('/alumnos', methods=['GET'])
+@require_auth_async
+async def listar_alumnos():
+    """Listar alumnos (HU-002), con limit/after/fields e If-None-Match opcionales."""
+    try:
+        service = _get_alumno_service()
+        campos = _parse_campos_arg(request.args)
+        paginado = 'limit' in request.args or 'after' in request.args
+        
+        # Version ANTES que los datos (ver listar_alumnos en api/routes.py)
+        version = await service.obtener_version_alumnos()
+        firma = await service.obtener_firma_alumnos() if version is None else None
+        etag, ultima = _validadores_listado(version, firma, request.query_string)
+        if _no_modificado(request, etag):
+            return _respuesta_no_modificado(current_app.response_class, etag, ultima)
+        
+        if campos is not None and not paginado:
+            cuerpo = await service.listar_alumnos_campos(campos)
+        
+        elif campos is not None:
+            filas, next_cursor = await service.listar_alumnos_campos_paginado(
+                campos,
+                limite=_parse_int_arg(request.args, 'limit'),
+                cursor=request.args.get('after') or None
+            )
+            cuerpo = {'items': filas, 'next_cursor': next_cursor}
+        
+        elif not paginado:
+            cuerpo = await service.listar_alumnos(version)
+        
+        else:
+            alumnos, next_cursor = await service.listar_alumnos_paginado(
+                limite=_parse_int_arg(request.args, 'limit'),
+                cursor=request.args.get('after') or None
+            )
+            cuerpo = {'items': alumnos, 'next_cursor': next_cursor}
+        
+        return _con_validadores(jsonify(cuerpo), etag, ultima), 200
+    
+    except Exception as e:
+        return _respuesta_error(e)
+
+
+@async_api_bp.route('/alumnos', methods=['POST'])
+@require_auth_async
+async def crear_alumno():
+    """Crear un nuevo alumno (HU-001)."""
+    try:
+        data = await request.get_json(silent=True)
+        
+        if not data:
+            return jsonify({'error': 'Body JSON requerido'}), 400
+        
+        service = _get_alumno_service()
+        alumno = await service.crear_alumno(
+            nombre=data.get('nombre', ''),
+            apellido=data.get('apellido', ''),
+            dni=data.get('dni', '')
+        )
+        
+        return jsonify(alumno), 201
+    
+    except Exception as e:
+        return _respuesta_error(e)
+
+
+@async_api_bp.route('/alumnos/batch', methods=['POST'])
+@require_auth_async
+async def importar_alumnos():
+    """Importar muchos alumnos (JSON o CSV) en una sola peticion."""
+    try:
+        filas = await _leer_filas_importacion()
+        
+        service = _get_alumno_service()
+        resultados = await service.crear_alumnos_lote(
+            filas,
+            tamano_lote=_parse_int_arg(request.args, 'chunk_size')
+        )
+        
+        resumen = {'total': len(resultados)}
+        for estado in (ESTADO_CREADO, ESTADO_DNI_DUPLICADO, ESTADO_ERROR_VALIDACION):
+            resumen[estado] = sum(1 for r in resultados if r['estado'] == estado)
+        
+        return jsonify({
+            'resumen': resumen,
+            'resultados': [_resultado_to_dict(r) for r in resultados]
+        }), 200
+    
+    except Exception as e:
+        return _respuesta_error(e)
+
+
+@async_api_bp.route('/alumnos/search', methods=['GET'])
+@require_auth_async
+async def buscar_alumnos():
+    """Buscar alumnos por apellido, nombre o DNI."""
+    try:
+        service = _get_alumno_service()
+        alumnos = await service.buscar(
+            request.args.get('q', ''),
+            limite=_parse_int_arg(request.args, 'limit')
+        )
+        
+        return jsonify(alumnos), 200
+    
+    except Exception as e:
+        return _respuesta_error(e)
+
+
+@async_api_bp.route('/alumnos/export', methods=['GET'])
+@require_auth_async
+async def exportar_alumnos():
+    """Exportar todos los alumnos como stream (ndjson o json)."""
+    formato = request.args.get('format', 'ndjson')
+    
+    if formato not in ('ndjson', 'json'):
+        return jsonify({
+            'error': "Formato no soportado. Use 'ndjson' o 'json'",
+            'codigo': 'VALIDATION_ERROR',
+            'campo': 'format'
+        }), 400
+    
+    try:
+        alumnos = _get_alumno_service().exportar_alumnos()
+        
+        # Leer el primer alumno antes de responder (500 en vez de 200 truncado)
+        primero = await anext(alumnos, None)
+    
+    except Exception as e:
+        return _respuesta_error(e)
+    
+    if formato == 'ndjson':
+        cuerpo = _stream_ndjson(primero, alumnos)
+        mimetype = 'application/x-ndjson'
+    else:
+        cuerpo = _stream_json_array(primero, alumnos)
+        mimetype = 'application/json'
+    
+    return Response(cuerpo, mimetype=mimetype), 200
+
+
+@async_api_bp.route('/alumnos/<id>', methods=['GET'])
+@require_auth_async
+async def obtener_alumno(id):
+    """Obtener un alumno por ID, con fields e If-None-Match opcionales."""
+    try:
+        service = _get_alumno_service()
+        campos = _parse_campos_arg(request.args)
+        
+        if campos is not None:
+            return jsonify(await service.obtener_alumno_campos(id, campos)), 200
+        
+        alumno = await service.obtener_alumno(id)
+        
+        etag, ultima = _validadores_alumno(alumno)
+        if _no_modificado(request, etag, ultima):
+            return _respuesta_no_modificado(current_app.response_class, etag, ultima)
+        
+        return _con_validadores(jsonify(alumno), etag, ultima), 200
+    
+    except Exception as e:
+        return _respuesta_error(e)
+
+
+@async_api_bp.route('/alumnos/<id>', methods=['PUT'])
+@require_auth_async
+async def actualizar_alumno(id):
+    """Actualizar un alumno (HU-003), con precondicion If-Match opcional."""
+    try:
+        data = await request.get_json(silent=True)
+        
+        if not data:
+            return jsonify({'error': 'Body JSON requerido'}), 400
+        
+        service = _get_alumno_service()
+        alumno = await service.actualizar_alumno(
+            id=id,
+            nombre=data.get('nombre', ''),
+            apellido=data.get('apellido', ''),
+            dni=data.get('dni', ''),
+            updated_at_esperado=_parse_precondicion(request.headers, data)
+        )
+        
+        return jsonify(alumno), 200
+    
+    except Exception as e:
+        return _respuesta_error(e)
+
+
+@async_api_bp.route('/alumnos/<id>', methods=['DELETE'])
+@require_auth_async
+async def eliminar_alumno(id):
+    """Eliminar un alumno (HU-004)."""
+    try:
+        await _get_alumno_service().eliminar_alumno(id)
+        
+        return '', 204
+    
+    except Exception as e:
+        return _respuesta_error(e)
+
+
+# ===========================================================================
+# UTILIDADES DE REQUEST
+# ===========================================================================
+
+def _get_alumno_service() -> AsyncAlumnoService:
+    """
+    Obtiene el AsyncAlumnoService de la app.
+    
+    Lo crea create_asgi_app() al arrancar (dentro del event loop).
+    """
+    return current_app.extensions['async_alumno_service']
+
+
+async def _leer_filas_importacion() -> list:
+    """Lee las filas a importar desde un array JSON o un CSV."""
+    archivos = await request.files
+    archivo = archivos.get('file')
+    
+    if archivo is not None:
+        return _parse_csv(archivo.read())
+    
+    if request.mimetype == 'text/csv':
+        return _parse_csv(await request.get_data())
+    
+    data = await request.get_json(silent=True)
+    
+    if not isinstance(data, list):
+        raise ValidacionError(
+            "Se esperaba un array JSON de alumnos o un archivo CSV",
+            campo="alumnos"
+        )
+    
+    return data
+
+
+# ===========================================================================
+# SERIALIZACION EN STREAM
+# ===========================================================================
+
+async def _stream_ndjson(primero, alumnos):
+    """Genera una linea JSON por alumno."""
+    if primero is None:
+        return
+    
+    yield dumps(primero) + '\n'
+    async for alumno in alumnos:
+        yield dumps(alumno) + '\n'
+
+
+async def _stream_json_array(primero, alumnos):
+    """Genera un array JSON valido enviado elemento por elemento."""
+    yield '['
+    if primero is not None:
+        yield dumps(primero)
+        async for alumno in alumnos:
+            yield ',' + dumps(alumno)
+    yield ']'
+
+
+# ===========================================================================
+# MANEJO DE ERRORES
+# ===========================================================================
+
+# Excepcion de dominio -> codigo HTTP (igual que en api/routes.py)
+CODIGOS_HTTP = (
+    (ValidacionError, 400),
+    (AlumnoNoEncontrado, 404),
+    (DNIDuplicado, 409),
+    (ModificacionConcurrente, 412),
+)
+
+
+def _respuesta_error(error: Exception):
+    """
+    Traduce una excepcion a respuesta JSON.
+    
+    Returns:
+        Tupla (Response, codigo HTTP)
+    """
+    for tipo, codigo in CODIGOS_HTTP:
+        if isinstance(error, tipo):
+            return jsonify(error.to_dict()), codigo
+    
+    if isinstance(error, DomainException):
+        return jsonify(error.to_dict()), 500
+    
+    return jsonify({
+        'error': 'Error interno del servidor',
+        'codigo': 'INTERNAL_ERROR',
+        'detalle': str(error)
+    }), 500
@@ -9,7 +9,7 @@
 # ARQUITECTURA MULTIPLATAFORMA:
 # - Local: Ejecutar con python api/index.py
 # - Vercel: Expone variable 'app' que Vercel detecta automaticamente
-# - Docker: Ejecutar con gunicorn api.index:app
+# - Docker: Ejecutar con gunicorn api.index:app (config en gunicorn.conf.py)
 #
 # REGLA CRITICA:
 # - load_dotenv() DEBE ejecutarse ANTES de cualquier import que use config
@@ -46,8 +46,11 @@ ROOT_DIR = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT_DIR))
 
 # Cargar variables de entorno
-from dotenv import load_dotenv
-load_dotenv()
+# POR QUE SOLO SI EXISTE .env: en Vercel/Docker las variables ya vienen del
+# entorno y importar python-dotenv seria costo de arranque sin uso
+if (ROOT_DIR / '.env').exists():
+    from dotenv import load_dotenv
+    load_dotenv(ROOT_DIR / '.env')
 
 
 # ===========================================================================
@@ -56,7 +59,9 @@ load_dotenv()
 
 from flask import Flask, send_from_directory
 
+from api.json_provider import AlumnoJSONProvider
 from api.routes import api_bp
+from application.service_registry import ServiceRegistry
 
 
 # ===========================================================================
@@ -84,7 +89,12 @@ def create_app() -> Flask:
     # Configuracion
     app.config['JSON_SORT_KEYS'] = False  # Mantener orden de keys
     
+    # JSON con orjson si esta instalado y que sabe codificar Alumno
+    # (ver api/json_provider.py)
+    app.json = AlumnoJSONProvider(app)
+    
     # Importar config solo si esta disponible
+    config = None
     try:
         from infrastructure.config import get_config
         config = get_config()
@@ -95,9 +105,28 @@ def create_app() -> Flask:
         app.config['SECRET_KEY'] = 'dev-secret-key'
         app.config['DEBUG'] = True
     
+    # Claves publicas para JWT asimetricos (si hay JWKS configurado)
+    # POR QUE FUERA DEL try: un error aca (ej: falta PyJWT) debe verse al
+    # arrancar, no convertirse en SECRET_KEY de desarrollo y DEBUG=True
+    if config is not None:
+        from api.middleware.auth import configure_jwks
+        configure_jwks(config)
+    
+    # Registro de servicios (uno por app, compartido entre threads)
+    # POR QUE EN app.extensions:
+    # - Es el lugar estandar de Flask para estado de extensiones
+    # - Cada app creada (ej: en tests) tiene su propio registro
+    app.extensions['service_registry'] = ServiceRegistry()
+    
     # Registrar blueprints
     app.register_blueprint(api_bp)
     
+    # Precalentar cliente, servicio y verificador JWT (ver api/prewarm.py)
+    # POR QUE OPCIONAL: abre una conexion a la BD al importar la app
+    if config is not None and config.PREWARM_ON_START:
+        from api.prewarm import precalentar
+        precalentar(app)
+    
     # Ruta para servir el frontend
     @app.route('/')
     def index():
@@ -0,0 +1,151 @@
+# ===========================================================================
+# Proveedor JSON de la API
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: API (Presentacion)
+# ===========================================================================
+#
+# POR QUE UN PROVEEDOR PROPIO:
+# - jsonify() usa json de la stdlib: listar miles de alumnos se iba en
+#   armar la lista de to_dict() y en el encoder en Python
+# - Si orjson esta instalado se usa (codifica directo a bytes, en C);
+#   si no, se sigue usando la stdlib con el mismo resultado
+# - Sabe codificar Alumno: las rutas pasan la lista de entidades y no
+#   arman una copia en dicts antes de serializar
+# - Las fechas salen siempre en ISO8601 (Flask usa RFC 822 para datetime;
+#   ninguna ruta mandaba datetime sueltos)
+#
+# USO (ver create_app en api/index.py y api/asgi.py):
+#   app.json = AlumnoJSONProvider(app)
+#   return jsonify(alumnos)
+#
+# ===========================================================================
+
+"""
+JSON provider de Flask/Quart con orjson opcional y soporte de Alumno.
+"""
+
+# Configuracion de path para pruebas atomicas
+import sys
+from pathlib import Path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import json
+from datetime import date
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+from domain.entities.alumno import Alumno
+
+# orjson es opcional: sin el se usa la stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """
+    Convierte lo que el encoder no conoce.
+    
+    Alumno se convierte fila por fila mientras se codifica (el dict dura
+    lo que tarda en escribirse). Las fechas sueltas salen en ISO8601,
+    como las de Alumno; el resto como lo hace Flask (UUID, Decimal,
+    dataclasses).
+    """
+    if isinstance(obj, Alumno):
+        return obj.to_dict()
+    if isinstance(obj, date):
+        return obj.isoformat()
+    return DefaultJSONProvider.default(obj)
+
+
+def _default_orjson(obj: Any) -> Any:
+    """
+    Como _default, pero deja las fechas de Alumno como datetime.
+    
+    POR QUE: orjson escribe datetime en C con el mismo texto que
+    isoformat(); formatearlas en Python era la mitad del costo de listar.
+    """
+    if isinstance(obj, Alumno):
+        return obj.to_dict(formatear_fechas=False)
+    return DefaultJSONProvider.default(obj)
+
+
+if orjson is not None:
+    _OPCIONES = orjson.OPT_NON_STR_KEYS
+    
+    def dumps(obj: Any) -> str:
+        """Serializa a texto JSON (con orjson)."""
+        return orjson.dumps(obj, default=_default_orjson, option=_OPCIONES).decode()
+else:
+    def dumps(obj: Any) -> str:
+        """Serializa a texto JSON (con la stdlib)."""
+        return json.dumps(obj, default=_default, ensure_ascii=False, separators=(',', ':'))
+
+
+class AlumnoJSONProvider(DefaultJSONProvider):
+    """
+    Proveedor JSON de la app (app.json).
+    
+    Atributos:
+        rapido: True si codifica con orjson
+    
+    POR QUE sort_keys = False:
+    - create_app pide JSON_SORT_KEYS = False, pero Flask 3 ya no lee esa
+      clave: el orden es el de los dicts (el mismo de to_dict())
+    """
+    
+    default = staticmethod(_default)
+    sort_keys = False
+    rapido = orjson is not None
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Texto JSON; con argumentos propios de json.dumps usa la stdlib."""
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return dumps(obj)
+    
+    def response(self, *args: Any, **kwargs: Any):
+        """
+        Respuesta de jsonify().
+        
+        POR QUE SOBREESCRIBIR:
+        - La version de Flask arma un str y lo vuelve a codificar;
+          con orjson el cuerpo sale en bytes de una vez
+        """
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        
+        obj = self._prepare_response_obj(args, kwargs)
+        opciones = _OPCIONES | orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            opciones |= orjson.OPT_INDENT_2
+        
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default_orjson, option=opciones),
+            mimetype=self.mimetype
+        )
+
+
+# ===========================================================================
+# PRUEBA ATOMICA
+# ===========================================================================
+if __name__ == "__main__":
+    from flask import Flask
+    
+    print("=== Prueba de AlumnoJSONProvider ===\n")
+    print(f"[OK] orjson disponible: {AlumnoJSONProvider.rapido}")
+    
+    alumno = Alumno.from_db_row("abc-1", "Ana", "Lopez", "1", None, None)
+    print(f"[OK] dumps: {dumps([alumno])}")
+    
+    app = Flask(__name__)
+    app.json = AlumnoJSONProvider(app)
+    with app.app_context():
+        respuesta = app.json.response([alumno])
+        print(f"[OK] response: {respuesta.mimetype} {respuesta.get_data()!r}")
+    
+    print("\n=== Todas las pruebas pasaron ===")
@@ -0,0 +1,54 @@
+# ===========================================================================
+# Middleware de Autenticacion (ASGI)
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: API (Presentacion)
+# Patron: Decorator
+# ===========================================================================
+#
+# POR QUE UN DECORADOR APARTE:
+# - La app ASGI usa Quart: su request/g no son los de Flask
+# - La validacion del JWT es la misma (auth._autenticar), incluido el
+#   cache de tokens y el JWKS
+#
+# ===========================================================================
+
+"""
+Version async de require_auth para los endpoints de la app ASGI.
+"""
+
+# Configuracion de path
+import sys
+from pathlib import Path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from functools import wraps
+
+from quart import g, jsonify, request
+
+from api.middleware import auth
+
+
+def require_auth_async(f):
+    """
+    Decorador async que requiere autenticacion JWT.
+    
+    Mismas validaciones y mismas respuestas 401 que require_auth.
+    Si pasa, g.current_user y g.jwt_token quedan disponibles.
+    
+    Patron: Decorator
+    """
+    @wraps(f)
+    async def decorated_function(*args, **kwargs):
+        try:
+            payload, token = auth._autenticar(request.headers.get('Authorization'))
+        except Exception as e:
+            return jsonify(auth._error_autenticacion(e)), 401
+        
+        g.current_user = payload
+        g.jwt_token = token
+        
+        return await f(*args, **kwargs)
+    
+    return decorated_function
@@ -32,16 +32,33 @@ Valida JWT de Supabase y extrae informacion del usuario.
 # Configuracion de path
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-import jwt
+import logging
+import os
 from functools import wraps
 from flask import request, jsonify, g
 from datetime import datetime, timezone
+from threading import Lock
+from typing import Optional
 
+from api.middleware.token_cache import TokenCache
 from domain.exceptions import AuthenticationError, SessionExpiredError
 
 
+logger = logging.getLogger(__name__)
+
+# Cache de tokens verificados (singleton por proceso, se crea al primer uso)
+_token_cache: Optional[TokenCache] = None
+_token_cache_lock = Lock()
+
+# Claves publicas para RS256/ES256 (None si no hay JWKS configurado)
+# POR QUE NO LAZY: cargarlas en el primer request seria una descarga
+# en el camino del request; se cargan al crear la app (configure_jwks)
+_jwks_store = None
+
+
 def require_auth(f):
     """
     Decorador que requiere autenticacion JWT.
@@ -76,46 +93,67 @@ def require_auth(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         try:
-            # 1. Obtener header Authorization
-            auth_header = request.headers.get('Authorization')
-            
-            if not auth_header:
-                raise AuthenticationError("Token de autenticacion requerido")
-            
-            # 2. Extraer token del header
-            token = _extract_token(auth_header)
-            
-            # 3. Validar y decodificar JWT
-            payload = _validate_jwt(token)
+            payload, token = _autenticar(request.headers.get('Authorization'))
             
-            # 4. Verificar expiracion
-            _check_expiration(payload)
-            
-            # 5. Guardar usuario en contexto de Flask
+            # Guardar usuario en contexto de Flask
             g.current_user = payload
             g.jwt_token = token
             
-            # 6. Ejecutar la funcion original
+            # Ejecutar la funcion original
             return f(*args, **kwargs)
             
-        except SessionExpiredError as e:
-            # Sesion expirada: codigo especifico para que el frontend redirija
-            return jsonify(e.to_dict()), 401
-            
-        except AuthenticationError as e:
-            return jsonify(e.to_dict()), 401
-            
         except Exception as e:
-            # Error inesperado en autenticacion
-            return jsonify({
-                'error': 'Error de autenticacion',
-                'codigo': 'AUTH_ERROR',
-                'detalle': str(e)
-            }), 401
+            return jsonify(_error_autenticacion(e)), 401
     
     return decorated_function
 
 
+def _autenticar(auth_header: Optional[str]):
+    """
+    Valida el header Authorization completo.
+    
+    Compartido por require_auth (Flask) y require_auth_async (ASGI).
+    
+    Validaciones:
+    1. Header Authorization presente
+    2. Formato "Bearer <token>"
+    3. JWT valido (firma correcta)
+    4. JWT no expirado
+    
+    Returns:
+        Tupla (payload, token)
+    
+    Raises:
+        AuthenticationError: Si falta el header o el token es invalido
+        SessionExpiredError: Si el token expiro
+    """
+    if not auth_header:
+        raise AuthenticationError("Token de autenticacion requerido")
+    
+    token = _extract_token(auth_header)
+    payload = _validate_jwt(token)
+    _check_expiration(payload)
+    
+    return payload, token
+
+
+def _error_autenticacion(error: Exception) -> dict:
+    """
+    Arma el body del 401 para un error de autenticacion.
+    
+    SESSION_EXPIRED tiene codigo propio para que el frontend redirija.
+    """
+    if isinstance(error, (SessionExpiredError, AuthenticationError)):
+        return error.to_dict()
+    
+    # Error inesperado en autenticacion
+    return {
+        'error': 'Error de autenticacion',
+        'codigo': 'AUTH_ERROR',
+        'detalle': str(error)
+    }
+
+
 def _extract_token(auth_header: str) -> str:
     """
     Extrae el token del header Authorization.
@@ -152,17 +190,52 @@ def _validate_jwt(token: str) -> dict:
     Raises:
         AuthenticationError: Si el token es invalido
         SessionExpiredError: Si el token expiro
+    
+    POR QUE CONSULTAR EL CACHE PRIMERO:
+    - Un token ya verificado y no vencido no necesita otra verificacion
+      de firma (ver TokenCache)
+    - Si vencio, el cache lo descarta y jwt.decode lanza la expiracion
+    """
+    cache = get_token_cache()
+    payload = cache.get(token)
+    
+    if payload is not None:
+        return payload
+    
+    payload = _decode_jwt(token)
+    cache.put(token, payload)
+    
+    return payload
+
+
+def _decode_jwt(token: str) -> dict:
     """
+    Verifica la firma de un JWT de Supabase y lo decodifica.
+    
+    Args:
+        token: JWT a validar
+    
+    Returns:
+        Payload del JWT decodificado
+    
+    Raises:
+        AuthenticationError: Si el token es invalido
+        SessionExpiredError: Si el token expiro
+    """
+    # POR QUE IMPORT LOCAL: PyJWT (y cryptography) solo se cargan en el
+    # camino de autenticacion; /api/health y los estaticos no los pagan
+    import jwt
+    
     try:
-        from infrastructure.config import get_config
-        config = get_config()
+        clave, algoritmo = _resolver_clave(token)
         
         # Decodificar con verificacion de firma
-        # POR QUE HS256: Es el algoritmo que usa Supabase
+        # POR QUE UN SOLO ALGORITMO: el que corresponde a la clave elegida
+        # (evita que un token HS256 se verifique con una clave publica)
         payload = jwt.decode(
             token,
-            config.SUPABASE_JWT_SECRET,
-            algorithms=['HS256'],
+            clave,
+            algorithms=[algoritmo],
             options={
                 'verify_exp': True,  # Verificar expiracion
                 'verify_iat': True,  # Verificar issued at
@@ -178,6 +251,168 @@ def _validate_jwt(token: str) -> dict:
         raise AuthenticationError(f"Token invalido: {e}")
 
 
+def _resolver_clave(token: str):
+    """
+    Elige la clave de verificacion segun el header del JWT.
+    
+    - HS256: secreto compartido SUPABASE_JWT_SECRET (esquema historico)
+    - RS256/ES256: clave publica del JWKS buscada por 'kid'
+    
+    Args:
+        token: JWT a verificar
+    
+    Returns:
+        Tupla (clave, algoritmo)
+    
+    Raises:
+        AuthenticationError: Si el algoritmo no esta soportado o el 'kid'
+            no esta en el JWKS cargado
+    """
+    import jwt
+    
+    header = jwt.get_unverified_header(token)
+    algoritmo = header.get('alg')
+    
+    if algoritmo == 'HS256':
+        from infrastructure.config import get_config
+        return get_config().SUPABASE_JWT_SECRET, algoritmo
+    
+    if algoritmo in ('RS256', 'ES256'):
+        if _jwks_store is None:
+            raise AuthenticationError("Tokens asimetricos no habilitados (falta SUPABASE_JWKS_URL)")
+        
+        clave = _jwks_store.get_key(header.get('kid'))
+        if clave is None or clave.algorithm_name != algoritmo:
+            raise AuthenticationError("Token firmado con una clave desconocida")
+        
+        return clave.key, algoritmo
+    
+    raise AuthenticationError(f"Algoritmo de firma no soportado: {algoritmo}")
+
+
+def configure_jwks(config) -> None:
+    """
+    Carga el JWKS y arranca su refresco si SUPABASE_JWKS_URL esta definido.
+    
+    Se llama una vez desde create_app(). Si la primera carga falla, la app
+    arranca igual: los tokens asimetricos se rechazan hasta que un
+    refresco en segundo plano lo logre.
+    
+    Args:
+        config: Instancia de Config
+    """
+    global _jwks_store
+    
+    if not config.SUPABASE_JWKS_URL:
+        return
+    
+    from infrastructure.jwks_key_store import JWKSKeyStore
+    
+    store = JWKSKeyStore(
+        config.SUPABASE_JWKS_URL,
+        intervalo_refresco=config.JWKS_REFRESH_SECONDS
+    )
+    
+    try:
+        store.cargar()
+    except Exception as e:
+        store.ultimo_error = str(e)
+        logger.warning("No se pudo cargar el JWKS: %s", e)
+    
+    store.iniciar_refresco()
+    set_jwks_store(store)
+
+
+def set_jwks_store(store) -> None:
+    """
+    Reemplaza el almacen de claves publicas (None lo desactiva).
+    
+    Args:
+        store: JWKSKeyStore ya cargado, o None
+    """
+    global _jwks_store
+    
+    anterior = _jwks_store
+    _jwks_store = store
+    
+    if anterior is not None and anterior is not store:
+        anterior.detener_refresco()
+
+
+def get_token_cache() -> TokenCache:
+    """
+    Retorna el cache de tokens verificados del proceso.
+    
+    El tamano sale de JWT_CACHE_MAX_SIZE (0 lo desactiva). Si no hay
+    configuracion, se usa el default de TokenCache.
+    
+    Returns:
+        Instancia unica de TokenCache
+    """
+    global _token_cache
+    
+    if _token_cache is None:
+        with _token_cache_lock:
+            if _token_cache is None:
+                try:
+                    from infrastructure.config import get_config
+                    _token_cache = TokenCache(max_size=get_config().JWT_CACHE_MAX_SIZE)
+                except EnvironmentError:
+                    _token_cache = TokenCache()
+    
+    return _token_cache
+
+
+def precalentar_jwt() -> None:
+    """
+    Importa PyJWT y sus backends de cryptography y crea el cache de tokens.
+    
+    POR QUE: _decode_jwt importa jwt recien en el primer request
+    autenticado (~95 ms con cryptography); precalentar() lo llama al
+    arrancar el worker para sacar ese costo del primer request.
+    """
+    import jwt
+    import jwt.algorithms
+    
+    if jwt.algorithms.has_crypto:
+        # RS256/ES256 (JWKS): cargan los modulos de rsa y ec de cryptography
+        jwt.algorithms.get_default_algorithms()
+    
+    get_token_cache()
+
+
+def reset_token_cache() -> None:
+    """
+    Descarta el cache de tokens (solo para testing).
+    
+    El proximo request vuelve a crearlo con la configuracion actual.
+    """
+    global _token_cache
+    with _token_cache_lock:
+        _token_cache = None
+
+
+def _despues_de_fork() -> None:
+    """
+    Rearma el estado de autenticacion en el proceso hijo de un fork.
+    
+    POR QUE:
+    - Un lock tomado por otro thread del padre quedaria tomado en el hijo
+    - El thread de refresco del JWKS no sobrevive al fork
+    """
+    global _token_cache, _token_cache_lock
+    
+    _token_cache_lock = Lock()
+    _token_cache = None
+    
+    if _jwks_store is not None:
+        _jwks_store.despues_de_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_despues_de_fork)
+
+
 def _check_expiration(payload: dict) -> None:
     """
     Verifica manualmente la expiracion del token.
@@ -0,0 +1,183 @@
+# ===========================================================================
+# Cache de Tokens Verificados
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: API (Presentacion)
+# Patron: Cache LRU con vencimiento
+# ===========================================================================
+#
+# POR QUE CACHEAR TOKENS VERIFICADOS:
+# - El frontend manda el mismo JWT cientos de veces por sesion
+# - Cada request repetia la verificacion HMAC y el parseo de claims
+# - Un token ya verificado no cambia: su payload vale hasta su 'exp'
+#
+# POLITICA DEL CACHE:
+# - Clave: SHA-256 del token (el token en claro no queda en memoria)
+# - Cada entrada vence en el 'exp' del propio token
+# - LRU: si se llena, se descarta el menos usado
+#
+# NOTA MULTI-PROCESO:
+# - El cache es por proceso (cada worker de gunicorn tiene el suyo)
+# - Solo guarda tokens validos; un token invalido nunca entra
+#
+# ===========================================================================
+
+"""
+Cache LRU de payloads de JWT ya verificados.
+
+Evita repetir la verificacion de firma de un token mientras no venza.
+"""
+
+# Configuracion de path para pruebas atomicas
+import sys
+from pathlib import Path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Optional, Tuple
+
+
+class TokenCache:
+    """
+    Cache de payloads de JWT verificados.
+    
+    Metricas:
+    - hits: tokens resueltos sin verificar la firma
+    - misses: tokens que hubo que verificar
+    - evictions: entradas descartadas por tamano o por vencimiento
+    
+    Patron: Cache LRU + vencimiento por entrada
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 1024,
+        reloj: Callable[[], float] = time.time
+    ):
+        """
+        Inicializa el cache.
+        
+        Args:
+            max_size: Cantidad maxima de tokens en cache
+            reloj: Fuente de tiempo en segundos epoch, como 'exp'
+                (inyectable para tests)
+        """
+        self._max_size = max_size
+        self._reloj = reloj
+        
+        # digest -> (payload, exp)
+        self._cache: 'OrderedDict[str, Tuple[dict, float]]' = OrderedDict()
+        self._lock = Lock()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, token: str) -> Optional[dict]:
+        """
+        Busca el payload de un token ya verificado.
+        
+        Args:
+            token: JWT tal como llego en el header
+        
+        Returns:
+            Copia del payload, o None si no esta o ya vencio
+        """
+        clave = _digest(token)
+        
+        with self._lock:
+            entrada = self._cache.get(clave)
+            
+            if entrada is None:
+                self.misses += 1
+                return None
+            
+            payload, exp = entrada
+            if self._reloj() >= exp:
+                del self._cache[clave]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            
+            self._cache.move_to_end(clave)
+            self.hits += 1
+            
+            # POR QUE COPIA: el endpoint no debe poder alterar la entrada
+            return dict(payload)
+    
+    def put(self, token: str, payload: dict) -> None:
+        """
+        Guarda el payload de un token recien verificado.
+        
+        Tokens sin 'exp' numerico no se guardan (no sabriamos cuando vencen).
+        
+        Args:
+            token: JWT verificado
+            payload: Payload decodificado
+        """
+        exp = payload.get('exp')
+        
+        if self._max_size <= 0 or not isinstance(exp, (int, float)):
+            return
+        
+        with self._lock:
+            clave = _digest(token)
+            self._cache[clave] = (dict(payload), float(exp))
+            self._cache.move_to_end(clave)
+            
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+    
+    def estadisticas(self) -> dict:
+        """
+        Retorna las metricas del cache.
+        
+        Returns:
+            Diccionario con hits, misses, evictions, size y hit_rate
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._cache),
+                'hit_rate': self.hits / total if total else 0.0
+            }
+    
+    def limpiar(self) -> None:
+        """Vacia el cache (no resetea las metricas)."""
+        with self._lock:
+            self._cache.clear()
+
+
+def _digest(token: str) -> str:
+    """Clave del cache: SHA-256 del token."""
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+# ===========================================================================
+# PRUEBA ATOMICA
+# ===========================================================================
+if __name__ == "__main__":
+    print("=== Prueba de TokenCache ===\n")
+    
+    cache = TokenCache(max_size=2)
+    
+    # Test 1: Miss y luego hit
+    cache.get("token-a")
+    cache.put("token-a", {'sub': 'user-1', 'exp': time.time() + 3600})
+    print(f"[OK] Hit: {cache.get('token-a')}")
+    
+    # Test 2: Token vencido no se sirve
+    cache.put("token-b", {'sub': 'user-2', 'exp': time.time() - 1})
+    print(f"[OK] Vencido: {cache.get('token-b')}")
+    
+    print(f"[OK] Estadisticas: {cache.estadisticas()}")
+    
+    print("\n=== Todas las pruebas pasaron ===")
@@ -0,0 +1,173 @@
+# ===========================================================================
+# Perfil de Arranque (Cold Start)
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: API (Presentacion) - herramienta de desarrollo
+# ===========================================================================
+#
+# POR QUE MEDIR EL ARRANQUE:
+# - En Vercel cada cold start importa api/index.py antes de responder
+#   el primer request (incluso /api/health y los estaticos)
+# - Un import pesado agregado "de paso" (ej: jwt o supabase a nivel de
+#   modulo) sube ese costo sin que nadie lo note
+# - Este comando lo mide con python -X importtime y falla si se pasa
+#   del presupuesto o si se carga un modulo que debe ser lazy
+#
+# USO:
+#   python api/perfil_arranque.py
+#   python api/perfil_arranque.py --presupuesto-ms 200 --top 20
+#   python api/perfil_arranque.py --modulo api.asgi
+#
+# ===========================================================================
+
+"""
+Mide el costo de importar el entry point, por modulo y por paquete.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+# Modulos que el arranque NO debe importar (se cargan en su primer uso)
+# - jwt: solo en el camino de autenticacion (api/middleware/auth.py)
+# - supabase/httpx: al crear el repositorio (application/alumno_service.py)
+# - psycopg/sqlite3: solo con ALUMNO_REPOSITORY=postgres/sqlite
+MODULOS_LAZY = ('jwt', 'supabase', 'httpx', 'psycopg', 'sqlite3')
+
+# Presupuesto por defecto del import del entry point (milisegundos)
+PRESUPUESTO_MS = 200
+
+
+def medir_importacion(modulo: str) -> List[Tuple[str, int, int]]:
+    """
+    Importa el modulo en un interprete nuevo con -X importtime.
+    
+    POR QUE UN PROCESO NUEVO:
+    - En este proceso los modulos ya estan cargados: el import seria gratis
+    
+    Args:
+        modulo: Modulo a importar (ej: 'api.index')
+    
+    Returns:
+        Lista de (nombre, propio_us, acumulado_us) en orden de carga,
+        sin el arranque del interprete (site), que es igual para cualquier app
+    """
+    resultado = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {modulo}'],
+        cwd=ROOT_DIR,
+        env={**os.environ, 'PREWARM_ON_START': '0'},
+        capture_output=True,
+        text=True
+    )
+    
+    if resultado.returncode != 0:
+        raise RuntimeError(f"No se pudo importar {modulo}:\n{resultado.stderr}")
+    
+    filas = parsear_importtime(resultado.stderr)
+    inicio = max((i + 1 for i, (nombre, _, _) in enumerate(filas) if nombre == 'site'), default=0)
+    
+    return filas[inicio:]
+
+
+def parsear_importtime(salida: str) -> List[Tuple[str, int, int]]:
+    """
+    Parsea las lineas 'import time: propio | acumulado | nombre'.
+    
+    Args:
+        salida: stderr de python -X importtime
+    
+    Returns:
+        Lista de (nombre, propio_us, acumulado_us)
+    """
+    filas = []
+    
+    for linea in salida.splitlines():
+        if not linea.startswith('import time:'):
+            continue
+        
+        propio, acumulado, nombre = linea[len('import time:'):].split('|')
+        if not propio.strip().isdigit():
+            continue  # Encabezado
+        
+        filas.append((nombre.strip(), int(propio), int(acumulado)))
+    
+    return filas
+
+
+def costo_por_paquete(filas: List[Tuple[str, int, int]]) -> Dict[str, int]:
+    """
+    Suma el tiempo propio de cada modulo en su paquete raiz.
+    
+    Args:
+        filas: Resultado de medir_importacion()
+    
+    Returns:
+        Microsegundos por paquete, de mayor a menor
+    """
+    totales: Dict[str, int] = {}
+    
+    for nombre, propio, _ in filas:
+        paquete = nombre.split('.')[0]
+        totales[paquete] = totales.get(paquete, 0) + propio
+    
+    return dict(sorted(totales.items(), key=lambda item: item[1], reverse=True))
+
+
+def main(argv=None) -> int:
+    """
+    Imprime el reporte y retorna el codigo de salida.
+    
+    Returns:
+        0 si respeta presupuesto y modulos lazy, 1 si no
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--modulo', default='api.index')
+    parser.add_argument('--presupuesto-ms', type=float, default=PRESUPUESTO_MS)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--repeticiones', type=int, default=3)
+    args = parser.parse_args(argv)
+    
+    # La primera corrida puede incluir compilar .pyc: nos quedamos con la mejor
+    filas = min(
+        (medir_importacion(args.modulo) for _ in range(max(1, args.repeticiones))),
+        key=lambda corrida: sum(propio for _, propio, _ in corrida)
+    )
+    
+    total_ms = sum(propio for _, propio, _ in filas) / 1000
+    cargados = {nombre for nombre, _, _ in filas}
+    lazy_cargados = [m for m in MODULOS_LAZY if m in cargados]
+    
+    print(f"=== Arranque de {args.modulo}: {total_ms:.1f} ms "
+          f"(presupuesto {args.presupuesto_ms:.0f} ms) ===\n")
+    
+    print("Por paquete:")
+    for paquete, propio in list(costo_por_paquete(filas).items())[:args.top]:
+        print(f"  {propio / 1000:8.1f} ms  {paquete}")
+    
+    print(f"\nModulos mas caros (tiempo propio):")
+    for nombre, propio, acumulado in sorted(filas, key=lambda f: f[1], reverse=True)[:args.top]:
+        print(f"  {propio / 1000:8.1f} ms  (acum. {acumulado / 1000:7.1f})  {nombre}")
+    
+    ok = total_ms <= args.presupuesto_ms and not lazy_cargados
+    
+    if lazy_cargados:
+        print(f"\n[ERROR] Importados en el arranque (deben ser lazy): {', '.join(lazy_cargados)}")
+    if total_ms > args.presupuesto_ms:
+        print(f"\n[ERROR] Presupuesto excedido por {total_ms - args.presupuesto_ms:.1f} ms")
+    if ok:
+        print("\n[OK] Dentro del presupuesto")
+    
+    return 0 if ok else 1
+
+
+# ===========================================================================
+# PRUEBA ATOMICA
+# ===========================================================================
+if __name__ == "__main__":
+    sys.exit(main())
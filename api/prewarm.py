@@ -0,0 +1,98 @@
+# ===========================================================================
+# Precalentamiento por Proceso
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: API (Presentacion)
+# ===========================================================================
+#
+# POR QUE PRECALENTAR:
+# - Todo es lazy: el primer request de cada worker paga get_config(), la
+#   creacion del cliente/servicio y el primer handshake TLS
+# - Despues de un deploy o de escalar, esos primeros requests son los
+#   picos de latencia
+# - Precalentando al arrancar el worker, ese costo sale del camino del
+#   request
+#
+# CUANDO SE EJECUTA:
+# - create_app() si PREWARM_ON_START=1 (sin --preload: una vez por worker)
+# - post_fork de gunicorn.conf.py (con --preload: la app ya existe en el
+#   master y cada worker rearma sus conexiones despues del fork)
+#
+# ===========================================================================
+
+"""
+Construye las dependencias de la app y abre una conexion antes del primer request.
+"""
+
+# Configuracion de path
+import sys
+from pathlib import Path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import logging
+import time
+from contextlib import contextmanager
+
+
+logger = logging.getLogger(__name__)
+
+
+def precalentar(app) -> dict:
+    """
+    Precalienta config, verificador JWT, servicio y una conexion a la BD.
+    
+    POR QUE NO FALLA:
+    - Un worker sin BD al arrancar igual debe levantar: el health check
+      responde y los requests reintentan la conexion como siempre
+    
+    Args:
+        app: Aplicacion Flask creada con create_app()
+    
+    Returns:
+        Milisegundos por paso ('config', 'jwt', 'servicio', 'conexion');
+        si un paso fallo, 'error' con el motivo y sin los pasos siguientes
+    """
+    tiempos = {}
+    
+    try:
+        with _cronometrar(tiempos, 'config'):
+            from infrastructure.config import get_config
+            get_config()
+        
+        with _cronometrar(tiempos, 'jwt'):
+            from api.middleware.auth import precalentar_jwt
+            precalentar_jwt()
+        
+        with _cronometrar(tiempos, 'servicio'):
+            service = app.extensions['service_registry'].get_alumno_service()
+        
+        # Una consulta minima abre (y deja en el pool) la primera conexion
+        with _cronometrar(tiempos, 'conexion'):
+            service.listar_alumnos_paginado(limite=1)
+    
+    except Exception as e:
+        tiempos['error'] = str(e)
+        logger.warning("Precalentamiento incompleto: %s", e)
+    
+    return tiempos
+
+
+@contextmanager
+def _cronometrar(tiempos: dict, paso: str):
+    """Guarda en tiempos[paso] los milisegundos que tardo el bloque."""
+    inicio = time.perf_counter()
+    yield
+    tiempos[paso] = round((time.perf_counter() - inicio) * 1000, 1)
+
+
+# ===========================================================================
+# PRUEBA ATOMICA
+# ===========================================================================
+if __name__ == "__main__":
+    print("=== Prueba de Precalentamiento ===\n")
+    
+    from api.index import create_app
+    
+    for paso, valor in precalentar(create_app()).items():
+        print(f"  {paso}: {valor}")
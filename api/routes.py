@@ -28,18 +28,41 @@ Define los endpoints HTTP y delega la logica al servicio.
 # Configuracion de path
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import csv
+import hashlib
+import io
+import itertools
 
-from flask import Blueprint, request, jsonify
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    jsonify,
+    request,
+    stream_with_context
+)
 from datetime import datetime, timezone
+from typing import List, Optional, Tuple
 
+from api.json_provider import dumps
 from api.middleware.auth import require_auth
-from application.alumno_service import create_alumno_service
+from application.alumno_service import (
+    AlumnoService,
+    create_alumno_service,
+    ESTADO_CREADO,
+    ESTADO_DNI_DUPLICADO,
+    ESTADO_ERROR_VALIDACION
+)
+from domain.entities.fechas import parsear_fecha
 from domain.exceptions import (
     DomainException,
     ValidacionError,
     AlumnoNoEncontrado,
-    DNIDuplicado
+    DNIDuplicado,
+    ModificacionConcurrente
 )
 
 
@@ -62,14 +85,13 @@ def health_check():
     No requiere autenticacion.
     Util para verificar que el servicio esta corriendo.
     
+    Si el cliente Supabase ya se creo, incluye las estadisticas de su
+    pool HTTP (conexiones abiertas/ociosas, requests y reintentos).
+    
     Returns:
         200 OK con estado del servicio
     """
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now(timezone.utc).isoformat(),
-        'version': '1.0.0'
-    }), 200
+    return jsonify(_estado_salud()), 200
 
 
 @api_bp.route('/config', methods=['GET'])
@@ -103,20 +125,78 @@ def get_config():
 @require_auth
 def listar_alumnos():
     """
-    Listar todos los alumnos.
+    Listar alumnos.
     
     Trazabilidad:
     - HU-002: Ver Lista de Alumnos
     - RF-002: Listar alumnos
     
+    Query Params (opcionales):
+        limit: Cantidad de alumnos por pagina
+        after: Cursor devuelto como next_cursor por la pagina anterior
+        fields: Columnas a incluir, separadas por coma (ej: id,nombre,dni)
+    
+    POR QUE DOS FORMATOS:
+    - Sin parametros se mantiene la lista completa (compatibilidad)
+    - Con limit/after se pagina por cursor: cada pagina cuesta lo mismo
+    
+    POR QUE fields:
+    - La tabla del frontend no muestra fechas
+    - Se piden menos columnas y las filas no se convierten en Alumno
+    
+    Headers (opcional):
+        If-None-Match: ETag de una respuesta anterior
+    
+    POR QUE ETag (ver _validadores_listado):
+    - El frontend vuelve a pedir la lista despues de cada cambio y en
+      cada navegacion; casi siempre es la misma
+    - Con If-None-Match igual se responde 304 sin leer ni serializar
+      la tabla: cuesta leer una fila de table_versions
+    
     Returns:
-        200 OK con lista de alumnos
+        200 OK con lista de alumnos, o con
+            {"items": [...], "next_cursor": "..." | null} si se pagina
+        304 Not Modified si If-None-Match coincide
+        400 Bad Request si limit, after o fields son invalidos
     """
     try:
-        service = create_alumno_service()
-        alumnos = service.listar_alumnos()
+        service = _get_alumno_service()
+        campos = _parse_campos_arg(request.args)
+        paginado = 'limit' in request.args or 'after' in request.args
+        
+        # Version ANTES que los datos: si alguien escribe en el medio, el ETag
+        # queda mas viejo que el cuerpo y el cliente solo refresca de mas
+        version = service.obtener_version_alumnos()
+        firma = service.obtener_firma_alumnos() if version is None else None
+        etag, ultima = _validadores_listado(version, firma, request.query_string)
+        if _no_modificado(request, etag):
+            return _respuesta_no_modificado(current_app.response_class, etag, ultima)
+        
+        if campos is not None and not paginado:
+            cuerpo = service.listar_alumnos_campos(campos)
+        
+        elif campos is not None:
+            filas, next_cursor = service.listar_alumnos_campos_paginado(
+                campos,
+                limite=_parse_int_arg(request.args, 'limit'),
+                cursor=request.args.get('after') or None
+            )
+            cuerpo = {'items': filas, 'next_cursor': next_cursor}
         
-        return jsonify([alumno.to_dict() for alumno in alumnos]), 200
+        elif not paginado:
+            cuerpo = service.listar_alumnos(version)
+        
+        else:
+            alumnos, next_cursor = service.listar_alumnos_paginado(
+                limite=_parse_int_arg(request.args, 'limit'),
+                cursor=request.args.get('after') or None
+            )
+            cuerpo = {'items': alumnos, 'next_cursor': next_cursor}
+        
+        return _con_validadores(jsonify(cuerpo), etag, ultima), 200
+        
+    except ValidacionError as e:
+        return jsonify(e.to_dict()), 400
         
     except Exception as e:
         return _handle_error(e)
@@ -152,14 +232,14 @@ def crear_alumno():
             return jsonify({'error': 'Body JSON requerido'}), 400
         
         # Crear alumno
-        service = create_alumno_service()
+        service = _get_alumno_service()
         alumno = service.crear_alumno(
             nombre=data.get('nombre', ''),
             apellido=data.get('apellido', ''),
             dni=data.get('dni', '')
         )
         
-        return jsonify(alumno.to_dict()), 201
+        return jsonify(alumno), 201
         
     except ValidacionError as e:
         return jsonify(e.to_dict()), 400
@@ -171,6 +251,150 @@ def crear_alumno():
         return _handle_error(e)
 
 
+@api_bp.route('/alumnos/batch', methods=['POST'])
+@require_auth
+def importar_alumnos():
+    """
+    Importar muchos alumnos en una sola peticion.
+    
+    Trazabilidad:
+    - HU-001: Registrar Alumno
+    - RF-001, RF-005
+    
+    Request Body (uno de):
+        - JSON: [{"nombre": "...", "apellido": "...", "dni": "..."}, ...]
+        - CSV (Content-Type: text/csv) con encabezado nombre,apellido,dni
+        - multipart/form-data con el CSV en el campo "file"
+    
+    Query Params (opcional):
+        chunk_size: Alumnos por INSERT
+    
+    POR QUE UN ENDPOINT DE LOTE:
+    - Al inicio de cursada se cargan miles de alumnos
+    - Uno por uno eran miles de requests HTTP y 2 consultas por alumno
+    - Aca se valida todo en memoria y se inserta de a lotes
+    
+    Returns:
+        200 OK con {"resumen": {...}, "resultados": [...]} (un resultado
+            por fila: creado, dni_duplicado o error_validacion)
+        400 Bad Request si el body no es un array JSON ni un CSV valido
+    """
+    try:
+        filas = _leer_filas_importacion()
+        
+        service = _get_alumno_service()
+        resultados = service.crear_alumnos_lote(
+            filas,
+            tamano_lote=_parse_int_arg(request.args, 'chunk_size')
+        )
+        
+        resumen = {'total': len(resultados)}
+        for estado in (ESTADO_CREADO, ESTADO_DNI_DUPLICADO, ESTADO_ERROR_VALIDACION):
+            resumen[estado] = sum(1 for r in resultados if r['estado'] == estado)
+        
+        return jsonify({
+            'resumen': resumen,
+            'resultados': [_resultado_to_dict(r) for r in resultados]
+        }), 200
+        
+    except ValidacionError as e:
+        return jsonify(e.to_dict()), 400
+        
+    except Exception as e:
+        return _handle_error(e)
+
+
+@api_bp.route('/alumnos/search', methods=['GET'])
+@require_auth
+def buscar_alumnos():
+    """
+    Buscar alumnos por apellido, nombre o DNI.
+    
+    Trazabilidad:
+    - HU-002: Ver Lista de Alumnos
+    - RF-002
+    
+    Query Params:
+        q: Texto a buscar (requerido)
+        limit: Maximo de resultados (opcional)
+    
+    POR QUE UN ENDPOINT APARTE:
+    - Pensado para buscar mientras se tipea: pocas filas y rapido
+    - Usa indices de prefijo/trigram en vez de traer la lista completa
+    
+    Returns:
+        200 OK con lista de alumnos
+        400 Bad Request si q falta o limit es invalido
+    """
+    try:
+        service = _get_alumno_service()
+        alumnos = service.buscar(
+            request.args.get('q', ''),
+            limite=_parse_int_arg(request.args, 'limit')
+        )
+        
+        return jsonify(alumnos), 200
+        
+    except ValidacionError as e:
+        return jsonify(e.to_dict()), 400
+        
+    except Exception as e:
+        return _handle_error(e)
+
+
+@api_bp.route('/alumnos/export', methods=['GET'])
+@require_auth
+def exportar_alumnos():
+    """
+    Exportar todos los alumnos como stream.
+    
+    Trazabilidad:
+    - HU-002: Ver Lista de Alumnos
+    - RF-002
+    
+    Query Params:
+        format: "ndjson" (default, un alumno JSON por linea) o
+                "json" (un array JSON enviado en partes)
+    
+    POR QUE STREAMING:
+    - La tabla se lee por paginas y cada fila se escribe al llegar
+    - La memoria del worker no crece con el tamano de la tabla
+    
+    Returns:
+        200 OK con el stream de alumnos
+        400 Bad Request si el formato no es soportado
+    """
+    formato = request.args.get('format', 'ndjson')
+    
+    if formato not in ('ndjson', 'json'):
+        return jsonify({
+            'error': "Formato no soportado. Use 'ndjson' o 'json'",
+            'codigo': 'VALIDATION_ERROR',
+            'campo': 'format'
+        }), 400
+    
+    try:
+        service = _get_alumno_service()
+        alumnos = service.exportar_alumnos()
+        
+        # Leer el primer alumno antes de responder: si la BD falla,
+        # todavia podemos devolver un 500 en vez de un 200 truncado
+        primero = list(itertools.islice(alumnos, 1))
+        alumnos = itertools.chain(primero, alumnos)
+        
+    except Exception as e:
+        return _handle_error(e)
+    
+    if formato == 'ndjson':
+        cuerpo = _stream_ndjson(alumnos)
+        mimetype = 'application/x-ndjson'
+    else:
+        cuerpo = _stream_json_array(alumnos)
+        mimetype = 'application/json'
+    
+    return Response(stream_with_context(cuerpo), mimetype=mimetype), 200
+
+
 @api_bp.route('/alumnos/<id>', methods=['GET'])
 @require_auth
 def obtener_alumno(id):
@@ -184,15 +408,37 @@ def obtener_alumno(id):
     Args:
         id: UUID del alumno
     
+    Query Params (opcional):
+        fields: Columnas a incluir, separadas por coma
+    
+    Headers (opcional):
+        If-None-Match: ETag de una respuesta anterior (es el updated_at,
+            el mismo valor que acepta If-Match en PUT)
+        If-Modified-Since: Fecha HTTP (solo si no hay If-None-Match)
+    
     Returns:
         200 OK con el alumno
+        304 Not Modified si no cambio desde la version del cliente
+        400 Bad Request si fields es invalido
         404 Not Found si no existe
     """
     try:
-        service = create_alumno_service()
+        service = _get_alumno_service()
+        campos = _parse_campos_arg(request.args)
+        
+        if campos is not None:
+            return jsonify(service.obtener_alumno_campos(id, campos)), 200
+        
         alumno = service.obtener_alumno(id)
         
-        return jsonify(alumno.to_dict()), 200
+        etag, ultima = _validadores_alumno(alumno)
+        if _no_modificado(request, etag, ultima):
+            return _respuesta_no_modificado(current_app.response_class, etag, ultima)
+        
+        return _con_validadores(jsonify(alumno), etag, ultima), 200
+        
+    except ValidacionError as e:
+        return jsonify(e.to_dict()), 400
         
     except AlumnoNoEncontrado as e:
         return jsonify(e.to_dict()), 404
@@ -218,14 +464,23 @@ def actualizar_alumno(id):
         {
             "nombre": "string",
             "apellido": "string",
-            "dni": "string"
+            "dni": "string",
+            "updated_at": "ISO8601"   (opcional)
         }
     
+    Headers (opcional):
+        If-Match: updated_at leido por el cliente (ej: "2025-01-01T00:00:00+00:00")
+    
+    POR QUE PRECONDICION OPCIONAL:
+    - Sin ella, el ultimo que guarda gana (comportamiento historico)
+    - Con ella, si otro usuario edito el alumno se responde 412
+    
     Returns:
         200 OK con el alumno actualizado
         400 Bad Request si datos invalidos
         404 Not Found si no existe
         409 Conflict si DNI duplicado
+        412 Precondition Failed si el alumno cambio
     """
     try:
         # Obtener datos del body
@@ -235,15 +490,16 @@ def actualizar_alumno(id):
             return jsonify({'error': 'Body JSON requerido'}), 400
         
         # Actualizar alumno
-        service = create_alumno_service()
+        service = _get_alumno_service()
         alumno = service.actualizar_alumno(
             id=id,
             nombre=data.get('nombre', ''),
             apellido=data.get('apellido', ''),
-            dni=data.get('dni', '')
+            dni=data.get('dni', ''),
+            updated_at_esperado=_parse_precondicion(request.headers, data)
         )
         
-        return jsonify(alumno.to_dict()), 200
+        return jsonify(alumno), 200
         
     except ValidacionError as e:
         return jsonify(e.to_dict()), 400
@@ -254,6 +510,9 @@ def actualizar_alumno(id):
     except DNIDuplicado as e:
         return jsonify(e.to_dict()), 409
         
+    except ModificacionConcurrente as e:
+        return jsonify(e.to_dict()), 412
+        
     except Exception as e:
         return _handle_error(e)
 
@@ -276,7 +535,7 @@ def eliminar_alumno(id):
         404 Not Found si no existe
     """
     try:
-        service = create_alumno_service()
+        service = _get_alumno_service()
         service.eliminar_alumno(id)
         
         return '', 204
@@ -288,6 +547,331 @@ def eliminar_alumno(id):
         return _handle_error(e)
 
 
+# ===========================================================================
+# UTILIDADES DE REQUEST
+# ===========================================================================
+
+def _get_alumno_service() -> AlumnoService:
+    """
+    Obtiene el AlumnoService compartido de la app.
+    
+    POR QUE NO CREARLO EN CADA REQUEST:
+    - create_app() registra un ServiceRegistry que lo construye una vez
+    - Si el blueprint se usa sin create_app() (prueba atomica), se crea
+      uno nuevo como antes
+    
+    Returns:
+        AlumnoService listo para usar
+    """
+    registry = current_app.extensions.get('service_registry')
+    
+    if registry is None:
+        return create_alumno_service()
+    
+    return registry.get_alumno_service()
+
+
+def _leer_filas_importacion() -> list:
+    """
+    Lee las filas a importar desde un array JSON o un CSV.
+    
+    Returns:
+        Lista de filas (dicts para CSV; para JSON, lo que venga en el array)
+    
+    Raises:
+        ValidacionError: Si el body no es un array JSON ni un CSV legible
+    """
+    archivo = request.files.get('file')
+    
+    if archivo is not None:
+        return _parse_csv(archivo.read())
+    
+    if request.mimetype == 'text/csv':
+        return _parse_csv(request.get_data())
+    
+    data = request.get_json(silent=True)
+    
+    if not isinstance(data, list):
+        raise ValidacionError(
+            "Se esperaba un array JSON de alumnos o un archivo CSV",
+            campo="alumnos"
+        )
+    
+    return data
+
+
+def _parse_csv(contenido: bytes) -> list:
+    """
+    Convierte un CSV con encabezado nombre,apellido,dni en filas.
+    
+    POR QUE utf-8-sig:
+    - Excel guarda los CSV con BOM; sin esto el primer encabezado
+      seria "\\ufeffnombre" y nunca coincidiria
+    
+    Raises:
+        ValidacionError: Si el archivo no es UTF-8 o falta el encabezado
+    """
+    try:
+        texto = contenido.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        raise ValidacionError("El CSV debe estar codificado en UTF-8", campo="file")
+    
+    lector = csv.DictReader(io.StringIO(texto))
+    encabezado = [c.strip().lower() for c in (lector.fieldnames or [])]
+    
+    faltantes = {'nombre', 'apellido', 'dni'} - set(encabezado)
+    if faltantes:
+        raise ValidacionError(
+            f"Faltan columnas en el CSV: {', '.join(sorted(faltantes))}",
+            campo="file"
+        )
+    
+    lector.fieldnames = encabezado
+    return list(lector)
+
+
+def _resultado_to_dict(resultado: dict) -> dict:
+    """Convierte un resultado de importacion a JSON."""
+    salida = {'fila': resultado['fila'], 'estado': resultado['estado']}
+    
+    if 'alumno' in resultado:
+        salida['alumno'] = resultado['alumno']
+    if 'error' in resultado:
+        salida['error'] = resultado['error'].to_dict()
+    
+    return salida
+
+
+def _estado_salud() -> dict:
+    """
+    Arma el cuerpo del health check (compartido con api/async_routes.py).
+    
+    POR QUE MIRAR sys.modules:
+    - Si infrastructure.supabase_client nunca se importo, no hay cliente
+      ni pool que reportar
+    - Asi el health check no importa supabase-py ni abre conexiones
+    """
+    estado = {
+        'status': 'healthy',
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'version': '1.0.0'
+    }
+    
+    supabase_client = sys.modules.get('infrastructure.supabase_client')
+    pool = supabase_client.get_pool_stats() if supabase_client else None
+    if pool is not None:
+        estado['http_pool'] = pool
+    
+    return estado
+
+
+# ===========================================================================
+# PARSEO DE PARAMETROS
+# ===========================================================================
+# Compartido con api/async_routes.py: reciben args/headers en lugar de usar
+# el proxy request, que en Quart es otro objeto.
+
+def _parse_int_arg(args, nombre: str) -> Optional[int]:
+    """
+    Lee un query param entero.
+    
+    Args:
+        args: request.args
+        nombre: Nombre del parametro
+    
+    Returns:
+        Valor entero, o None si no vino
+    
+    Raises:
+        ValidacionError: Si el valor no es un entero
+    """
+    valor = args.get(nombre)
+    
+    if valor is None or valor == '':
+        return None
+    
+    try:
+        return int(valor)
+    except ValueError:
+        raise ValidacionError(
+            f"El parametro '{nombre}' debe ser un numero entero",
+            campo=nombre
+        )
+
+
+def _parse_campos_arg(args) -> Optional[List[str]]:
+    """
+    Lee el query param fields (columnas separadas por coma).
+    
+    Args:
+        args: request.args
+    
+    Returns:
+        Lista de columnas, o None si no vino (respuesta completa)
+    """
+    valor = args.get('fields')
+    
+    if valor is None:
+        return None
+    
+    return valor.split(',')
+
+
+def _parse_precondicion(headers, data: dict) -> Optional[datetime]:
+    """
+    Obtiene el updated_at esperado de If-Match o del body.
+    
+    If-Match tiene prioridad. Se aceptan comillas y el prefijo W/.
+    La fecha se lee con parsear_fecha: acepta los mismos timestamps que
+    la API devuelve (fracciones cortas de PostgREST incluidas).
+    
+    Args:
+        headers: request.headers
+        data: Body JSON del request
+    
+    Returns:
+        datetime esperado, o None si no hay precondicion
+    
+    Raises:
+        ValidacionError: Si el valor no es una fecha ISO8601
+    """
+    valor = headers.get('If-Match') or data.get('updated_at')
+    
+    if not valor or valor == '*':
+        return None
+    
+    valor = valor.strip()
+    if valor.startswith('W/'):
+        valor = valor[2:]
+    valor = valor.strip('"')
+    
+    try:
+        return parsear_fecha(valor)
+    except ValueError:
+        raise ValidacionError(
+            "If-Match/updated_at debe ser una fecha ISO8601",
+            campo="updated_at"
+        )
+
+
+# ===========================================================================
+# VALIDADORES HTTP (ETag / Last-Modified)
+# ===========================================================================
+# Compartidos con api/async_routes.py: reciben el request y la clase de
+# respuesta porque los proxies de Flask no existen dentro de Quart.
+
+# Subir si cambia el formato de las respuestas del listado: un ETag fuerte
+# promete el mismo cuerpo byte a byte
+VERSION_ETAG = 1
+
+
+def _validadores_listado(
+    version: Optional[int],
+    firma: Optional[Tuple[int, Optional[datetime]]],
+    query_string: bytes
+) -> Tuple[str, Optional[datetime]]:
+    """
+    ETag y Last-Modified del listado a partir de la version de la tabla.
+    
+    POR QUE LA VERSION Y NO LA FIRMA:
+    - La version es una fila de table_versions que sube con cada escritura
+      (trigger): leerla no recorre alumnos
+    - La firma (count, max(updated_at)) cuesta un COUNT(*) por request,
+      tambien en el camino del 304; solo se usa si no hay version
+    
+    POR QUE EL QUERY STRING ENTRA EN EL ETAG:
+    - fields, limit y after cambian el cuerpo sin que cambie la tabla
+    
+    Args:
+        version: service.obtener_version_alumnos(), o None
+        firma: (cantidad, max(updated_at)) de service.obtener_firma_alumnos();
+            solo se mira si version es None
+        query_string: request.query_string
+    
+    Returns:
+        (etag sin comillas, max(updated_at) o None si se uso la version)
+    """
+    if version is not None:
+        estado, ultima = f'v{version}', None
+    else:
+        cantidad, ultima = firma
+        estado = f'{cantidad}|{ultima.isoformat() if ultima else ""}'
+    
+    base = '|'.join((str(VERSION_ETAG), estado, query_string.decode('latin-1')))
+    return hashlib.blake2b(base.encode(), digest_size=16).hexdigest(), ultima
+
+
+def _validadores_alumno(alumno) -> Tuple[str, Optional[datetime]]:
+    """
+    ETag y Last-Modified de un alumno: su updated_at.
+    
+    POR QUE updated_at TAL CUAL:
+    - Cambia con cada escritura (trigger), asi que identifica la version
+    - Es el mismo valor que PUT acepta en If-Match (_parse_precondicion)
+    """
+    ultima = alumno.updated_at
+    return ultima.isoformat(), ultima
+
+
+def _no_modificado(peticion, etag: str, ultima: Optional[datetime] = None) -> bool:
+    """
+    Indica si la copia del cliente sigue vigente.
+    
+    If-None-Match manda sobre If-Modified-Since (RFC 9110). La fecha solo
+    se usa si se pasa `ultima`: en el listado, eliminar un alumno no
+    cambia max(updated_at), asi que ahi solo vale el ETag.
+    """
+    if peticion.if_none_match:
+        return peticion.if_none_match.contains_weak(etag)
+    
+    desde = peticion.if_modified_since
+    if ultima is None or desde is None:
+        return False
+    
+    # Last-Modified tiene resolucion de segundos
+    return ultima.replace(microsecond=0, tzinfo=ultima.tzinfo or timezone.utc) <= desde
+
+
+def _con_validadores(respuesta, etag: str, ultima: Optional[datetime]):
+    """
+    Agrega ETag, Last-Modified y Cache-Control a una respuesta.
+    
+    POR QUE private, no-cache:
+    - private: son datos de usuarios autenticados, no para proxies
+    - no-cache: el navegador puede guardarla pero debe revalidar siempre
+    """
+    respuesta.set_etag(etag)
+    if ultima is not None:
+        respuesta.last_modified = ultima
+    respuesta.headers['Cache-Control'] = 'private, no-cache'
+    return respuesta
+
+
+def _respuesta_no_modificado(clase_respuesta, etag: str, ultima: Optional[datetime]):
+    """304 sin cuerpo, con los mismos validadores."""
+    return _con_validadores(clase_respuesta(status=304), etag, ultima)
+
+
+# ===========================================================================
+# SERIALIZACION EN STREAM
+# ===========================================================================
+
+def _stream_ndjson(alumnos):
+    """Genera una linea JSON por alumno."""
+    for alumno in alumnos:
+        yield dumps(alumno) + '\n'
+
+
+def _stream_json_array(alumnos):
+    """Genera un array JSON valido enviado elemento por elemento."""
+    yield '['
+    separador = ''
+    for alumno in alumnos:
+        yield separador + dumps(alumno)
+        separador = ','
+    yield ']'
+
+
 # ===========================================================================
 # MANEJO DE ERRORES
 # ===========================================================================
@@ -27,12 +27,16 @@ Orquesta los casos de uso CRUD y coordina con el repositorio.
 # Configuracion de path para pruebas atomicas
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from typing import List, Optional
+import base64
+import json
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from domain.entities.alumno import Alumno
-from domain.repositories.alumno_repository import AlumnoRepository
+from domain.repositories.alumno_repository import AlumnoRepository, CAMPOS_ALUMNO
 from domain.exceptions import AlumnoNoEncontrado, DNIDuplicado, ValidacionError
 
 
@@ -53,6 +57,24 @@ class AlumnoService:
     Patron: Service Layer + Dependency Injection
     """
     
+    # Limites de paginacion
+    # POR QUE UN MAXIMO: Evita que un cliente pida la tabla entera de una vez
+    LIMITE_POR_DEFECTO = 50
+    LIMITE_MAXIMO = 500
+    
+    # Tamano de pagina al exportar la tabla completa
+    TAMANO_PAGINA_EXPORTACION = 500
+    
+    # Busqueda mientras se tipea
+    LIMITE_BUSQUEDA_POR_DEFECTO = 20
+    LIMITE_BUSQUEDA_MAXIMO = 100
+    
+    # Importacion masiva
+    # POR QUE LOTES: un INSERT multi-fila por lote, no uno por alumno
+    TAMANO_LOTE_IMPORTACION = 500
+    TAMANO_LOTE_MAXIMO = 1000
+    FILAS_MAXIMAS_IMPORTACION = 50000
+    
     def __init__(self, repository: AlumnoRepository):
         """
         Inicializa el servicio con un repositorio.
@@ -98,6 +120,52 @@ class AlumnoService:
         # Persistir (el repositorio verifica DNI unico)
         return self._repository.crear(alumno)
     
+    def crear_alumnos_lote(
+        self,
+        filas: List[dict],
+        tamano_lote: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Caso de uso: Importar muchos alumnos de una vez.
+        
+        Trazabilidad:
+        - HU-001: Registrar Alumno
+        - RF-001, RF-005
+        
+        POR QUE VALIDAR TODO ANTES DE INSERTAR:
+        - Las filas invalidas no viajan a la BD
+        - Un DNI repetido dentro del mismo archivo se detecta en memoria
+        - Cada lote cuesta un solo round trip (crear_lote)
+        
+        Si la BD falla a mitad de camino, los lotes anteriores quedan
+        guardados: reintentar la importacion los reporta como duplicados.
+        
+        Args:
+            filas: Diccionarios con nombre, apellido y dni
+            tamano_lote: Alumnos por INSERT (default TAMANO_LOTE_IMPORTACION)
+        
+        Returns:
+            Un resultado por fila, en el mismo orden:
+                {"fila": n, "estado": "creado", "alumno": Alumno}
+                {"fila": n, "estado": "dni_duplicado", "error": DNIDuplicado}
+                {"fila": n, "estado": "error_validacion", "error": ValidacionError}
+            "fila" empieza en 1.
+        
+        Raises:
+            ValidacionError: Si el tamano de lote o la cantidad de filas
+                estan fuera de rango
+            RepositoryError: Si falla la persistencia de un lote
+        """
+        resultados, pendientes, tamano_lote = _preparar_importacion(filas, tamano_lote)
+        
+        # Insertar de a lotes; los que no vuelven ya existian
+        for inicio in range(0, len(pendientes), tamano_lote):
+            lote = pendientes[inicio:inicio + tamano_lote]
+            creados = self._repository.crear_lote([alumno for _, alumno in lote])
+            _registrar_lote(resultados, lote, creados)
+        
+        return resultados
+    
     def obtener_alumno(self, id: str) -> Alumno:
         """
         Caso de uso: Obtener un alumno por ID.
@@ -122,7 +190,29 @@ class AlumnoService:
         
         return alumno
     
-    def listar_alumnos(self) -> List[Alumno]:
+    def obtener_alumno_campos(self, id: str, campos: List[str]) -> dict:
+        """
+        Caso de uso: Obtener un alumno por ID con solo algunas columnas.
+        
+        Args:
+            id: UUID del alumno
+            campos: Columnas a incluir (ver CAMPOS_ALUMNO)
+        
+        Returns:
+            Fila (dict) con esas columnas
+        
+        Raises:
+            ValidacionError: Si algun campo no existe
+            AlumnoNoEncontrado: Si el ID no existe
+        """
+        fila = self._repository.obtener_fila_por_id(id, _validar_campos(campos))
+        
+        if fila is None:
+            raise AlumnoNoEncontrado(id)
+        
+        return fila
+    
+    def listar_alumnos(self, version: Optional[int] = None) -> List[Alumno]:
         """
         Caso de uso: Listar todos los alumnos.
         
@@ -130,17 +220,181 @@ class AlumnoService:
         - HU-002: Ver Lista de Alumnos
         - RF-002
         
+        Args:
+            version: obtener_version_alumnos() si ya se leyo (la ruta la
+                lee para el ETag); el cache la reutiliza en vez de releerla
+        
         Returns:
             Lista de alumnos ordenada por apellido
         """
-        return self._repository.listar_todos()
+        return self._repository.listar_todos(version)
+    
+    def obtener_firma_alumnos(self) -> Tuple[int, Optional[datetime]]:
+        """
+        Caso de uso: Saber si el listado cambio sin traerlo.
+        
+        Returns:
+            (cantidad de alumnos, max(updated_at)); ver
+            AlumnoRepository.obtener_firma()
+        """
+        return self._repository.obtener_firma()
+    
+    def obtener_version_alumnos(self) -> Optional[int]:
+        """
+        Caso de uso: Saber si el listado cambio leyendo una sola fila.
+        
+        Returns:
+            Version de la tabla (table_versions), o None si el backend
+            no la lleva; ver AlumnoRepository.obtener_version()
+        """
+        return self._repository.obtener_version()
+    
+    def listar_alumnos_paginado(
+        self,
+        limite: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Alumno], Optional[str]]:
+        """
+        Caso de uso: Listar alumnos de a una pagina (paginacion keyset).
+        
+        Trazabilidad:
+        - HU-002: Ver Lista de Alumnos
+        - RF-002
+        
+        POR QUE PEDIR limite + 1:
+        - Si el repositorio devuelve una fila extra, hay pagina siguiente
+        - Evita un COUNT(*) sobre toda la tabla
+        
+        Args:
+            limite: Cantidad de alumnos por pagina (default LIMITE_POR_DEFECTO)
+            cursor: Cursor opaco devuelto por la pagina anterior
+        
+        Returns:
+            Tupla (alumnos de la pagina, cursor siguiente o None si es la ultima)
+        
+        Raises:
+            ValidacionError: Si el limite o el cursor son invalidos
+        """
+        limite = _validar_limite(limite, self.LIMITE_POR_DEFECTO, self.LIMITE_MAXIMO)
+        
+        despues_de = _decodificar_cursor(cursor) if cursor else None
+        
+        alumnos = self._repository.listar_pagina(limite + 1, despues_de)
+        
+        siguiente = None
+        if len(alumnos) > limite:
+            alumnos = alumnos[:limite]
+            ultimo = alumnos[-1]
+            siguiente = _codificar_cursor((ultimo.apellido, ultimo.nombre, ultimo.id))
+        
+        return alumnos, siguiente
+    
+    def listar_alumnos_campos(self, campos: List[str]) -> List[dict]:
+        """
+        Caso de uso: Listar alumnos trayendo solo algunas columnas.
+        
+        Trazabilidad:
+        - HU-002: Ver Lista de Alumnos
+        - RF-002
+        
+        Args:
+            campos: Columnas a incluir (ver CAMPOS_ALUMNO)
+        
+        Returns:
+            Filas (dict) ordenadas por (apellido, nombre, id)
+        
+        Raises:
+            ValidacionError: Si algun campo no existe
+        """
+        return self._repository.listar_filas(_validar_campos(campos))
+    
+    def listar_alumnos_campos_paginado(
+        self,
+        campos: List[str],
+        limite: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        Caso de uso: Listar una pagina de alumnos con solo algunas columnas.
+        
+        Igual que listar_alumnos_paginado(), pero retorna filas.
+        
+        POR QUE AGREGAR LAS COLUMNAS DE LA CLAVE:
+        - El cursor se arma con (apellido, nombre, id) de la ultima fila
+        - Si el cliente no las pidio, se traen y se quitan al final
+        
+        Args:
+            campos: Columnas a incluir (ver CAMPOS_ALUMNO)
+            limite: Cantidad de filas por pagina (default LIMITE_POR_DEFECTO)
+            cursor: Cursor opaco devuelto por la pagina anterior
+        
+        Returns:
+            Tupla (filas de la pagina, cursor siguiente o None si es la ultima)
+        
+        Raises:
+            ValidacionError: Si algun campo, el limite o el cursor son invalidos
+        """
+        campos = _validar_campos(campos)
+        
+        limite = _validar_limite(limite, self.LIMITE_POR_DEFECTO, self.LIMITE_MAXIMO)
+        
+        despues_de = _decodificar_cursor(cursor) if cursor else None
+        
+        extra = [c for c in ('apellido', 'nombre', 'id') if c not in campos]
+        filas = self._repository.listar_filas(campos + extra, limite + 1, despues_de)
+        
+        siguiente = None
+        if len(filas) > limite:
+            filas = filas[:limite]
+            ultima = filas[-1]
+            siguiente = _codificar_cursor(
+                (ultima['apellido'], ultima['nombre'], ultima['id'])
+            )
+        
+        if extra:
+            filas = [{c: fila[c] for c in campos} for fila in filas]
+        
+        return filas, siguiente
+    
+    def exportar_alumnos(
+        self,
+        tamano_pagina: Optional[int] = None
+    ) -> Iterator[Alumno]:
+        """
+        Caso de uso: Recorrer todos los alumnos para exportarlos.
+        
+        POR QUE GENERADOR:
+        - Lee la tabla de a una pagina (keyset) y entrega alumno por alumno
+        - En memoria solo vive la pagina actual, sin importar el tamano
+          de la tabla
+        
+        Args:
+            tamano_pagina: Alumnos por consulta (default TAMANO_PAGINA_EXPORTACION)
+        
+        Yields:
+            Alumnos ordenados por (apellido, nombre, id)
+        """
+        tamano_pagina = tamano_pagina or self.TAMANO_PAGINA_EXPORTACION
+        despues_de = None
+        
+        while True:
+            pagina = self._repository.listar_pagina(tamano_pagina, despues_de)
+            
+            yield from pagina
+            
+            if len(pagina) < tamano_pagina:
+                return
+            
+            ultimo = pagina[-1]
+            despues_de = (ultimo.apellido, ultimo.nombre, ultimo.id)
     
     def actualizar_alumno(
         self, 
         id: str, 
         nombre: str, 
         apellido: str, 
-        dni: str
+        dni: str,
+        updated_at_esperado: Optional[datetime] = None
     ) -> Alumno:
         """
         Caso de uso: Actualizar datos de un alumno.
@@ -149,11 +403,18 @@ class AlumnoService:
         - HU-003: Editar Alumno
         - RF-003, RF-005
         
+        POR QUE SIN obtener_por_id() PREVIO:
+        - El repositorio detecta "no existe" y "DNI duplicado" en el
+          mismo UPDATE, y conserva created_at
+        - Una edicion cuesta un round trip en vez de varios
+        
         Args:
             id: UUID del alumno a actualizar
             nombre: Nuevo nombre
             apellido: Nuevo apellido
             dni: Nuevo DNI
+            updated_at_esperado: updated_at que el cliente leyo. Si el
+                alumno cambio desde entonces, no se actualiza.
         
         Returns:
             Alumno actualizado
@@ -162,26 +423,21 @@ class AlumnoService:
             AlumnoNoEncontrado: Si el ID no existe
             ValidacionError: Si los datos son invalidos
             DNIDuplicado: Si el DNI pertenece a otro alumno
+            ModificacionConcurrente: Si el alumno cambio desde updated_at_esperado
         """
-        # Verificar que existe
-        alumno_actual = self._repository.obtener_por_id(id)
-        if alumno_actual is None:
-            raise AlumnoNoEncontrado(id)
-        
         # Crear nueva instancia con datos actualizados
-        # (Alumno es conceptualmente inmutable)
+        # (Alumno es conceptualmente inmutable; valida internamente)
         alumno_nuevo = Alumno(
             id=id,
             nombre=nombre,
             apellido=apellido,
-            dni=dni,
-            created_at=alumno_actual.created_at
+            dni=dni
         )
         
         # Persistir actualizacion
-        return self._repository.actualizar(alumno_nuevo)
+        return self._repository.actualizar(alumno_nuevo, updated_at_esperado)
     
-    def eliminar_alumno(self, id: str) -> bool:
+    def eliminar_alumno(self, id: str, verificar_existencia: bool = False) -> bool:
         """
         Caso de uso: Eliminar un alumno.
         
@@ -189,8 +445,13 @@ class AlumnoService:
         - HU-004: Eliminar Alumno
         - RF-004, RF-009
         
+        POR QUE NO VERIFICAR ANTES POR DEFECTO:
+        - repository.eliminar() ya retorna False si el ID no existia
+        - Asi un DELETE cuesta un solo round trip a la BD
+        
         Args:
             id: UUID del alumno a eliminar
+            verificar_existencia: Si True, busca el alumno antes de eliminar
         
         Returns:
             True si se elimino
@@ -198,11 +459,13 @@ class AlumnoService:
         Raises:
             AlumnoNoEncontrado: Si el ID no existe
         """
-        # Verificar que existe antes de eliminar
-        if not self._repository.obtener_por_id(id):
+        if verificar_existencia and not self._repository.obtener_por_id(id):
             raise AlumnoNoEncontrado(id)
         
-        return self._repository.eliminar(id)
+        if not self._repository.eliminar(id):
+            raise AlumnoNoEncontrado(id)
+        
+        return True
     
     def buscar_por_dni(self, dni: str) -> Optional[Alumno]:
         """
@@ -215,6 +478,276 @@ class AlumnoService:
             Alumno si existe, None si no
         """
         return self._repository.obtener_por_dni(dni)
+    
+    def buscar(self, texto: str, limite: Optional[int] = None) -> List[Alumno]:
+        """
+        Caso de uso: Buscar alumnos por apellido, nombre o DNI.
+        
+        Trazabilidad:
+        - HU-002: Ver Lista de Alumnos
+        - RF-002
+        
+        Args:
+            texto: Texto ingresado (no vacio)
+            limite: Maximo de resultados (default LIMITE_BUSQUEDA_POR_DEFECTO)
+        
+        Returns:
+            Alumnos que coinciden, los de apellido con ese prefijo primero
+        
+        Raises:
+            ValidacionError: Si el texto esta vacio o el limite fuera de rango
+        """
+        texto, limite = _validar_busqueda(texto, limite)
+        return self._repository.buscar(texto, limite)
+    
+    def buscar_por_dnis(self, dnis: Iterable[str]) -> Dict[str, Alumno]:
+        """
+        Caso de uso: Buscar muchos alumnos por DNI (conciliacion).
+        
+        Args:
+            dnis: DNIs a buscar
+        
+        Returns:
+            Diccionario DNI (en mayusculas) -> Alumno, solo los que existen
+        """
+        return self._repository.obtener_por_dni_many(dnis)
+    
+    def dnis_existentes(self, dnis: Iterable[str]) -> Set[str]:
+        """
+        Caso de uso: Saber cuales de muchos DNIs ya estan registrados.
+        
+        POR QUE NO buscar_por_dni() EN UN BUCLE:
+        - Serian N round trips; el repositorio agrupa en consultas IN
+        
+        Args:
+            dnis: DNIs a verificar
+        
+        Returns:
+            Conjunto de DNIs (en mayusculas) que ya existen
+        """
+        return self._repository.existe_dni_many(dnis)
+
+
+# ===========================================================================
+# IMPORTACION MASIVA
+# ===========================================================================
+
+# Estados posibles de cada fila importada
+ESTADO_CREADO = 'creado'
+ESTADO_DNI_DUPLICADO = 'dni_duplicado'
+ESTADO_ERROR_VALIDACION = 'error_validacion'
+
+
+def _alumno_desde_fila(fila) -> Alumno:
+    """
+    Construye (y valida) un Alumno desde una fila importada.
+    
+    POR QUE str():
+    - En JSON el DNI suele venir como numero
+    - En CSV todo llega como texto; una celda vacia llega como None
+    
+    Raises:
+        ValidacionError: Si la fila no es un objeto o sus datos son invalidos
+    """
+    if not isinstance(fila, dict):
+        raise ValidacionError(
+            "Cada fila debe ser un objeto con nombre, apellido y dni"
+        )
+    
+    def texto(campo: str) -> str:
+        valor = fila.get(campo)
+        return '' if valor is None else str(valor)
+    
+    return Alumno(
+        nombre=texto('nombre'),
+        apellido=texto('apellido'),
+        dni=texto('dni')
+    )
+
+
+def _resultado(indice: int, estado: str, **detalle) -> dict:
+    """Arma el resultado de una fila (numerada desde 1)."""
+    return {'fila': indice + 1, 'estado': estado, **detalle}
+
+
+def _preparar_importacion(
+    filas: List[dict],
+    tamano_lote: Optional[int]
+) -> Tuple[List[Optional[dict]], List[Tuple[int, Alumno]], int]:
+    """
+    Valida una importacion en memoria, antes de tocar la BD.
+    
+    Compartido por AlumnoService y AsyncAlumnoService.
+    
+    Returns:
+        Tupla (resultados con las filas ya rechazadas, pendientes
+        (indice, Alumno) a insertar, tamano de lote efectivo)
+    
+    Raises:
+        ValidacionError: Si el tamano de lote o la cantidad de filas
+            estan fuera de rango
+    """
+    if tamano_lote is None:
+        tamano_lote = AlumnoService.TAMANO_LOTE_IMPORTACION
+    
+    if tamano_lote < 1 or tamano_lote > AlumnoService.TAMANO_LOTE_MAXIMO:
+        raise ValidacionError(
+            f"El tamano de lote debe estar entre 1 y {AlumnoService.TAMANO_LOTE_MAXIMO}",
+            campo="chunk_size"
+        )
+    
+    if len(filas) > AlumnoService.FILAS_MAXIMAS_IMPORTACION:
+        raise ValidacionError(
+            f"No se pueden importar mas de {AlumnoService.FILAS_MAXIMAS_IMPORTACION} filas",
+            campo="alumnos"
+        )
+    
+    resultados: List[Optional[dict]] = [None] * len(filas)
+    pendientes: List[Tuple[int, Alumno]] = []
+    dnis_vistos = set()
+    
+    for indice, fila in enumerate(filas):
+        try:
+            alumno = _alumno_desde_fila(fila)
+        except ValidacionError as e:
+            resultados[indice] = _resultado(indice, ESTADO_ERROR_VALIDACION, error=e)
+            continue
+        
+        if alumno.dni in dnis_vistos:
+            resultados[indice] = _resultado(
+                indice, ESTADO_DNI_DUPLICADO, error=DNIDuplicado(alumno.dni)
+            )
+            continue
+        
+        dnis_vistos.add(alumno.dni)
+        pendientes.append((indice, alumno))
+    
+    return resultados, pendientes, tamano_lote
+
+
+def _registrar_lote(
+    resultados: List[Optional[dict]],
+    lote: List[Tuple[int, Alumno]],
+    creados: List[Alumno]
+) -> None:
+    """Completa los resultados de un lote: los que no volvieron ya existian."""
+    por_dni = {creado.dni: creado for creado in creados}
+    
+    for indice, alumno in lote:
+        creado = por_dni.get(alumno.dni)
+        if creado is not None:
+            resultados[indice] = _resultado(indice, ESTADO_CREADO, alumno=creado)
+        else:
+            resultados[indice] = _resultado(
+                indice, ESTADO_DNI_DUPLICADO, error=DNIDuplicado(alumno.dni)
+            )
+
+
+# ===========================================================================
+# LIMITES
+# ===========================================================================
+
+def _validar_limite(limite: Optional[int], por_defecto: int, maximo: int) -> int:
+    """
+    Aplica el default y verifica que el limite este en [1, maximo].
+    
+    Raises:
+        ValidacionError: Si el limite esta fuera de rango
+    """
+    if limite is None:
+        return por_defecto
+    
+    if limite < 1 or limite > maximo:
+        raise ValidacionError(
+            f"El limite debe estar entre 1 y {maximo}",
+            campo="limit"
+        )
+    
+    return limite
+
+
+def _validar_busqueda(texto: str, limite: Optional[int]) -> Tuple[str, int]:
+    """
+    Normaliza el texto y el limite de una busqueda.
+    
+    Raises:
+        ValidacionError: Si el texto esta vacio o el limite fuera de rango
+    """
+    texto = (texto or '').strip()
+    
+    if not texto:
+        raise ValidacionError("El texto de busqueda es requerido", campo="q")
+    
+    limite = _validar_limite(
+        limite,
+        AlumnoService.LIMITE_BUSQUEDA_POR_DEFECTO,
+        AlumnoService.LIMITE_BUSQUEDA_MAXIMO
+    )
+    return texto, limite
+
+
+# ===========================================================================
+# PROYECCION DE COLUMNAS
+# ===========================================================================
+
+def _validar_campos(campos: List[str]) -> List[str]:
+    """
+    Valida y normaliza una lista de columnas pedidas.
+    
+    Quita espacios y repetidos, manteniendo el orden.
+    
+    Raises:
+        ValidacionError: Si la lista esta vacia o tiene campos desconocidos
+    """
+    normalizados = list(dict.fromkeys(c.strip() for c in campos if c.strip()))
+    
+    if not normalizados:
+        raise ValidacionError("Debe indicar al menos un campo", campo="fields")
+    
+    desconocidos = [c for c in normalizados if c not in CAMPOS_ALUMNO]
+    if desconocidos:
+        raise ValidacionError(
+            f"Campos desconocidos: {', '.join(desconocidos)}. "
+            f"Validos: {', '.join(CAMPOS_ALUMNO)}",
+            campo="fields"
+        )
+    
+    return normalizados
+
+
+# ===========================================================================
+# CURSORES DE PAGINACION
+# ===========================================================================
+# POR QUE CURSOR OPACO:
+# - El cliente no depende de como se ordena internamente
+# - Podemos cambiar la clave de orden sin romper la API
+# ===========================================================================
+
+def _codificar_cursor(clave: Tuple[str, str, str]) -> str:
+    """Codifica la clave (apellido, nombre, id) como base64 url-safe."""
+    texto = json.dumps(list(clave))
+    return base64.urlsafe_b64encode(texto.encode('utf-8')).decode('ascii')
+
+
+def _decodificar_cursor(cursor: str) -> Tuple[str, str, str]:
+    """
+    Decodifica un cursor generado por _codificar_cursor.
+    
+    Raises:
+        ValidacionError: Si el cursor no tiene el formato esperado
+    """
+    try:
+        clave = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        if (
+            isinstance(clave, list)
+            and len(clave) == 3
+            and all(isinstance(v, str) for v in clave)
+        ):
+            return clave[0], clave[1], clave[2]
+    except (ValueError, UnicodeError):
+        pass
+    
+    raise ValidacionError("Cursor de paginacion invalido", campo="after")
 
 
 # ===========================================================================
@@ -230,13 +763,51 @@ def create_alumno_service() -> AlumnoService:
     - Facilita cambiar la implementacion del repositorio
     - Usado por la capa de presentacion (API)
     
+    Si ALUMNO_CACHE_ENABLED=1, el repositorio se envuelve con
+    CachedAlumnoRepository (cache LRU + TTL de lecturas por ID/DNI).
+    
     Returns:
-        AlumnoService configurado con SupabaseAlumnoRepository
+        AlumnoService configurado con el repositorio de ALUMNO_REPOSITORY
+    """
+    from infrastructure.config import get_config
+    
+    return AlumnoService(_crear_repositorio(get_config()))
+
+
+def _crear_repositorio(config) -> AlumnoRepository:
     """
-    from infrastructure.supabase_alumno_repository import SupabaseAlumnoRepository
+    Crea el repositorio segun config.ALUMNO_REPOSITORY (con cache si aplica).
+    
+    Tambien lo usa create_async_alumno_service para los backends sin
+    driver async.
+    
+    POR QUE IMPORTS DENTRO: solo se carga el backend elegido
+    (ni supabase ni psycopg son necesarios si no se usan).
+    """
+    if config.ALUMNO_REPOSITORY == 'sqlite':
+        from infrastructure.sqlite_alumno_repository import SqliteAlumnoRepository
+        repository = SqliteAlumnoRepository(config.SQLITE_PATH)
+    elif config.ALUMNO_REPOSITORY == 'postgres':
+        from infrastructure.postgres_alumno_repository import PostgresAlumnoRepository
+        repository = PostgresAlumnoRepository(
+            config.DATABASE_URL,
+            min_size=config.PG_POOL_MIN_SIZE,
+            max_size=config.PG_POOL_MAX_SIZE
+        )
+    else:
+        from infrastructure.supabase_alumno_repository import SupabaseAlumnoRepository
+        repository = SupabaseAlumnoRepository()
+    
+    if config.ALUMNO_CACHE_ENABLED:
+        from infrastructure.cached_alumno_repository import CachedAlumnoRepository
+        
+        repository = CachedAlumnoRepository(
+            repository,
+            max_size=config.ALUMNO_CACHE_MAX_SIZE,
+            ttl_seconds=config.ALUMNO_CACHE_TTL_SECONDS
+        )
     
-    repository = SupabaseAlumnoRepository()
-    return AlumnoService(repository)
+    return repository
 
 
 # ===========================================================================
@@ -0,0 +1,322 @@
+# ===========================================================================
+# Servicio Async de Alumnos
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: Application
+# Patron: Service Layer, Dependency Injection
+# ===========================================================================
+#
+# POR QUE UN SERVICIO ASYNC:
+# - La app ASGI (api/asgi.py) no puede esperar al repositorio bloqueando
+# - Mismos casos de uso que AlumnoService, con "await" sobre un
+#   AsyncAlumnoRepository
+#
+# SIN DUPLICAR REGLAS:
+# - Limites, cursores, campos y validacion de importaciones usan los
+#   mismos helpers de application/alumno_service.py
+#
+# ===========================================================================
+
+"""
+Servicio de aplicacion async para gestionar Alumnos.
+
+Version async de AlumnoService, usada por la app ASGI.
+"""
+
+# Configuracion de path para pruebas atomicas
+import sys
+from pathlib import Path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+
+from domain.entities.alumno import Alumno
+from domain.repositories.async_alumno_repository import AsyncAlumnoRepository
+from domain.exceptions import AlumnoNoEncontrado
+from application.alumno_service import (
+    AlumnoService,
+    _codificar_cursor,
+    _decodificar_cursor,
+    _preparar_importacion,
+    _registrar_lote,
+    _validar_busqueda,
+    _validar_campos,
+    _validar_limite
+)
+
+
+class AsyncAlumnoService:
+    """
+    Servicio de aplicacion async para Alumnos.
+    
+    Cada metodo tiene la misma semantica (y las mismas excepciones) que
+    su par en AlumnoService.
+    
+    Patron: Service Layer + Dependency Injection
+    """
+    
+    def __init__(self, repository: AsyncAlumnoRepository):
+        """
+        Inicializa el servicio con un repositorio async.
+        
+        Args:
+            repository: Implementacion async del repositorio de alumnos
+        """
+        self._repository = repository
+    
+    # =========================================================================
+    # CASOS DE USO
+    # =========================================================================
+    
+    async def crear_alumno(self, nombre: str, apellido: str, dni: str) -> Alumno:
+        """Caso de uso: Crear un nuevo alumno (HU-001)."""
+        alumno = Alumno(nombre=nombre, apellido=apellido, dni=dni)
+        return await self._repository.crear(alumno)
+    
+    async def crear_alumnos_lote(
+        self,
+        filas: List[dict],
+        tamano_lote: Optional[int] = None
+    ) -> List[dict]:
+        """Caso de uso: Importar muchos alumnos (ver AlumnoService)."""
+        resultados, pendientes, tamano_lote = _preparar_importacion(filas, tamano_lote)
+        
+        for inicio in range(0, len(pendientes), tamano_lote):
+            lote = pendientes[inicio:inicio + tamano_lote]
+            creados = await self._repository.crear_lote([alumno for _, alumno in lote])
+            _registrar_lote(resultados, lote, creados)
+        
+        return resultados
+    
+    async def obtener_alumno(self, id: str) -> Alumno:
+        """Caso de uso: Obtener un alumno por ID (HU-002)."""
+        alumno = await self._repository.obtener_por_id(id)
+        
+        if alumno is None:
+            raise AlumnoNoEncontrado(id)
+        
+        return alumno
+    
+    async def obtener_alumno_campos(self, id: str, campos: List[str]) -> dict:
+        """Caso de uso: Obtener un alumno por ID con solo algunas columnas."""
+        fila = await self._repository.obtener_fila_por_id(id, _validar_campos(campos))
+        
+        if fila is None:
+            raise AlumnoNoEncontrado(id)
+        
+        return fila
+    
+    async def listar_alumnos(self, version: Optional[int] = None) -> List[Alumno]:
+        """Caso de uso: Listar todos los alumnos (HU-002)."""
+        return await self._repository.listar_todos(version)
+    
+    async def obtener_firma_alumnos(self) -> Tuple[int, Optional[datetime]]:
+        """Caso de uso: Saber si el listado cambio sin traerlo."""
+        return await self._repository.obtener_firma()
+    
+    async def obtener_version_alumnos(self) -> Optional[int]:
+        """Caso de uso: Saber si el listado cambio leyendo una sola fila."""
+        return await self._repository.obtener_version()
+    
+    async def listar_alumnos_paginado(
+        self,
+        limite: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Alumno], Optional[str]]:
+        """Caso de uso: Listar alumnos de a una pagina (paginacion keyset)."""
+        limite = _validar_limite(
+            limite, AlumnoService.LIMITE_POR_DEFECTO, AlumnoService.LIMITE_MAXIMO
+        )
+        despues_de = _decodificar_cursor(cursor) if cursor else None
+        
+        alumnos = await self._repository.listar_pagina(limite + 1, despues_de)
+        
+        siguiente = None
+        if len(alumnos) > limite:
+            alumnos = alumnos[:limite]
+            ultimo = alumnos[-1]
+            siguiente = _codificar_cursor((ultimo.apellido, ultimo.nombre, ultimo.id))
+        
+        return alumnos, siguiente
+    
+    async def listar_alumnos_campos(self, campos: List[str]) -> List[dict]:
+        """Caso de uso: Listar alumnos trayendo solo algunas columnas."""
+        return await self._repository.listar_filas(_validar_campos(campos))
+    
+    async def listar_alumnos_campos_paginado(
+        self,
+        campos: List[str],
+        limite: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """Caso de uso: Listar una pagina de alumnos con solo algunas columnas."""
+        campos = _validar_campos(campos)
+        limite = _validar_limite(
+            limite, AlumnoService.LIMITE_POR_DEFECTO, AlumnoService.LIMITE_MAXIMO
+        )
+        despues_de = _decodificar_cursor(cursor) if cursor else None
+        
+        extra = [c for c in ('apellido', 'nombre', 'id') if c not in campos]
+        filas = await self._repository.listar_filas(campos + extra, limite + 1, despues_de)
+        
+        siguiente = None
+        if len(filas) > limite:
+            filas = filas[:limite]
+            ultima = filas[-1]
+            siguiente = _codificar_cursor(
+                (ultima['apellido'], ultima['nombre'], ultima['id'])
+            )
+        
+        if extra:
+            filas = [{c: fila[c] for c in campos} for fila in filas]
+        
+        return filas, siguiente
+    
+    async def exportar_alumnos(
+        self,
+        tamano_pagina: Optional[int] = None
+    ) -> AsyncIterator[Alumno]:
+        """
+        Caso de uso: Recorrer todos los alumnos para exportarlos.
+        
+        Generador async: lee de a una pagina (keyset) y entrega alumno por
+        alumno, igual que AlumnoService.exportar_alumnos().
+        """
+        tamano_pagina = tamano_pagina or AlumnoService.TAMANO_PAGINA_EXPORTACION
+        despues_de = None
+        
+        while True:
+            pagina = await self._repository.listar_pagina(tamano_pagina, despues_de)
+            
+            for alumno in pagina:
+                yield alumno
+            
+            if len(pagina) < tamano_pagina:
+                return
+            
+            ultimo = pagina[-1]
+            despues_de = (ultimo.apellido, ultimo.nombre, ultimo.id)
+    
+    async def actualizar_alumno(
+        self,
+        id: str,
+        nombre: str,
+        apellido: str,
+        dni: str,
+        updated_at_esperado: Optional[datetime] = None
+    ) -> Alumno:
+        """Caso de uso: Actualizar datos de un alumno (HU-003)."""
+        alumno_nuevo = Alumno(id=id, nombre=nombre, apellido=apellido, dni=dni)
+        return await self._repository.actualizar(alumno_nuevo, updated_at_esperado)
+    
+    async def eliminar_alumno(self, id: str) -> bool:
+        """Caso de uso: Eliminar un alumno (HU-004)."""
+        if not await self._repository.eliminar(id):
+            raise AlumnoNoEncontrado(id)
+        
+        return True
+    
+    async def buscar_por_dni(self, dni: str) -> Optional[Alumno]:
+        """Caso de uso: Buscar alumno por DNI."""
+        return await self._repository.obtener_por_dni(dni)
+    
+    async def buscar(self, texto: str, limite: Optional[int] = None) -> List[Alumno]:
+        """Caso de uso: Buscar alumnos por apellido, nombre o DNI."""
+        texto, limite = _validar_busqueda(texto, limite)
+        return await self._repository.buscar(texto, limite)
+    
+    async def buscar_por_dnis(self, dnis: Iterable[str]) -> Dict[str, Alumno]:
+        """Caso de uso: Buscar muchos alumnos por DNI (conciliacion)."""
+        return await self._repository.obtener_por_dni_many(dnis)
+    
+    async def dnis_existentes(self, dnis: Iterable[str]) -> Set[str]:
+        """Caso de uso: Saber cuales de muchos DNIs ya estan registrados."""
+        return await self._repository.existe_dni_many(dnis)
+    
+    async def cerrar(self) -> None:
+        """Libera las conexiones del repositorio (al apagar la app)."""
+        await self._repository.cerrar()
+
+
+# ===========================================================================
+# FACTORY FUNCTION
+# ===========================================================================
+
+async def create_async_alumno_service() -> AsyncAlumnoService:
+    """
+    Crea el servicio async con el repositorio de ALUMNO_REPOSITORY.
+    
+    POR QUE ASYNC:
+    - El pool async de psycopg se abre dentro del event loop que lo va a usar
+    
+    Backends:
+    - postgres: AsyncPostgresAlumnoRepository (driver async, sin threads)
+    - supabase / sqlite: el repositorio sincronico (con su cache si
+      ALUMNO_CACHE_ENABLED=1) envuelto en ThreadedAlumnoRepository
+    
+    LIMITE CON supabase:
+    - Cada llamada ocupa un thread y una conexion del pool httpx mientras
+      espera a PostgREST: como mucho SUPABASE_HTTP_MAX_CONNECTIONS (20)
+      llamadas a la BD en vuelo por worker; el resto hace cola
+    - Por eso el adaptador usa esa misma cantidad de threads: con mas,
+      los threads sobrantes solo esperarian una conexion libre
+    
+    Returns:
+        AsyncAlumnoService listo para usar
+    """
+    from infrastructure.config import get_config
+    
+    config = get_config()
+    
+    if config.ALUMNO_REPOSITORY == 'postgres':
+        from infrastructure.async_postgres_alumno_repository import (
+            AsyncPostgresAlumnoRepository
+        )
+        
+        repository = AsyncPostgresAlumnoRepository(
+            config.DATABASE_URL,
+            min_size=config.PG_POOL_MIN_SIZE,
+            max_size=config.PG_POOL_MAX_SIZE
+        )
+        await repository.abrir()
+        return AsyncAlumnoService(repository)
+    
+    from application.alumno_service import _crear_repositorio
+    from infrastructure.threaded_alumno_repository import ThreadedAlumnoRepository
+    
+    hilos = config.SUPABASE_HTTP_MAX_CONNECTIONS if config.ALUMNO_REPOSITORY == 'supabase' else 32
+    
+    return AsyncAlumnoService(
+        ThreadedAlumnoRepository(_crear_repositorio(config), max_workers=hilos)
+    )
+
+
+# ===========================================================================
+# PRUEBA ATOMICA
+# ===========================================================================
+if __name__ == "__main__":
+    print("=== Prueba de AsyncAlumnoService (con Mock) ===\n")
+    
+    import asyncio
+    from domain.repositories.alumno_repository import MockAlumnoRepository
+    from infrastructure.threaded_alumno_repository import ThreadedAlumnoRepository
+    
+    async def probar():
+        service = AsyncAlumnoService(ThreadedAlumnoRepository(MockAlumnoRepository()))
+        
+        alumno = await service.crear_alumno("Juan", "Perez", "11111111")
+        print(f"[OK] Crear: {alumno}")
+        
+        lista = await service.listar_alumnos()
+        print(f"[OK] Listar: {len(lista)} alumnos")
+        
+        await service.eliminar_alumno(alumno.id)
+        print("[OK] Eliminar")
+        
+        await service.cerrar()
+    
+    asyncio.run(probar())
+    
+    print("\n=== Todas las pruebas pasaron ===")
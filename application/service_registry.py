@@ -0,0 +1,153 @@
+# ===========================================================================
+# Registro de Servicios
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: Application
+# Patron: Registry, Singleton por aplicacion (Thread-Safe)
+# ===========================================================================
+#
+# POR QUE UN REGISTRO DE SERVICIOS:
+# - Antes cada request construia un repositorio y un servicio nuevos
+# - El servicio no guarda estado de usuario: se puede compartir
+# - Se construye UNA vez por proceso y lo usan todos los threads
+#
+# POR QUE FORK-AWARE:
+# - Con gunicorn --preload el registro se crea en el master y cada worker
+#   lo hereda con el repositorio ya armado (pool de Postgres, conexiones
+#   SQLite, cliente HTTP): compartir esos sockets entre procesos es inseguro
+# - Si el PID cambio, el servicio heredado se descarta (sin cerrarlo, que
+#   cortaria las conexiones del padre) y se construye uno nuevo
+#
+# NOTA STATELESS:
+# - El registro guarda DEPENDENCIAS, no datos de sesion
+# - Igual que el cliente Supabase singleton, es seguro en serverless
+#
+# ===========================================================================
+
+"""
+Registro de servicios con alcance de aplicacion.
+
+Construye el AlumnoService una sola vez y lo comparte entre requests.
+"""
+
+# Configuracion de path para pruebas atomicas
+import sys
+from pathlib import Path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import os
+from threading import Lock
+from typing import Callable, List, Optional
+
+from application.alumno_service import AlumnoService, create_alumno_service
+
+
+class ServiceRegistry:
+    """
+    Registro de servicios compartido por toda la aplicacion.
+    
+    Responsabilidades:
+    - Construir el AlumnoService la primera vez que se pide
+    - Devolver siempre la misma instancia despues
+    - Permitir reemplazarlo en tests (reset)
+    
+    Patron: Registry + Double-Check Locking
+    """
+    
+    def __init__(self, factory: Callable[[], AlumnoService] = create_alumno_service):
+        """
+        Inicializa el registro.
+        
+        POR QUE RECIBIR LA FACTORY:
+        - Por defecto usa create_alumno_service (Supabase)
+        - En tests se puede pasar una factory que use MockAlumnoRepository
+        
+        Args:
+            factory: Funcion que construye el AlumnoService
+        """
+        self._factory = factory
+        self._alumno_service: Optional[AlumnoService] = None
+        self._pid = os.getpid()
+        self._lock = Lock()
+        
+        # Servicios heredados de un fork: se conservan para que el GC no
+        # cierre conexiones que siguen siendo del proceso padre
+        self._heredados: List[AlumnoService] = []
+    
+    def get_alumno_service(self) -> AlumnoService:
+        """
+        Retorna el AlumnoService compartido.
+        
+        POR QUE DOUBLE-CHECK LOCKING:
+        - Varios threads de gunicorn pueden pedirlo a la vez
+        - Solo se toma el lock mientras no existe
+        
+        Returns:
+            Instancia unica de AlumnoService (por proceso)
+        """
+        if self._pid != os.getpid():
+            self._descartar_heredado()
+        
+        if self._alumno_service is None:
+            with self._lock:
+                if self._alumno_service is None:
+                    self._alumno_service = self._factory()
+        
+        return self._alumno_service
+    
+    def reset(self, alumno_service: Optional[AlumnoService] = None) -> None:
+        """
+        Reemplaza o descarta el servicio registrado (solo para testing).
+        
+        Uso:
+            registry.reset(AlumnoService(MockAlumnoRepository()))
+            registry.reset()  # El proximo acceso vuelve a usar la factory
+        
+        Args:
+            alumno_service: Servicio a inyectar, o None para descartarlo
+        """
+        with self._lock:
+            self._alumno_service = alumno_service
+    
+    def _descartar_heredado(self) -> None:
+        """
+        Olvida el servicio construido por el proceso padre.
+        
+        Se llama sin lock y con un lock nuevo: el del padre pudo haber
+        quedado tomado por otro thread al hacer fork. Gunicorn lo ejecuta
+        en post_fork, antes de que el worker atienda requests.
+        """
+        if self._alumno_service is not None:
+            self._heredados.append(self._alumno_service)
+        
+        self._lock = Lock()
+        self._alumno_service = None
+        self._pid = os.getpid()
+
+
+# ===========================================================================
+# PRUEBA ATOMICA
+# ===========================================================================
+if __name__ == "__main__":
+    print("=== Prueba de ServiceRegistry (con Mock) ===\n")
+    
+    from domain.repositories.alumno_repository import MockAlumnoRepository
+    
+    registry = ServiceRegistry(lambda: AlumnoService(MockAlumnoRepository()))
+    
+    # Test 1: Misma instancia en cada acceso
+    s1 = registry.get_alumno_service()
+    s2 = registry.get_alumno_service()
+    print(f"[OK] Misma instancia: {s1 is s2}")
+    
+    # Test 2: Reset con inyeccion
+    inyectado = AlumnoService(MockAlumnoRepository())
+    registry.reset(inyectado)
+    print(f"[OK] Servicio inyectado: {registry.get_alumno_service() is inyectado}")
+    
+    # Test 3: Reset sin argumento reconstruye
+    registry.reset()
+    print(f"[OK] Reconstruido: {registry.get_alumno_service() is not inyectado}")
+    
+    print("\n=== Todas las pruebas pasaron ===")
@@ -0,0 +1,103 @@
+# ===========================================================================
+# Benchmark: Hidratacion de Alumno desde la BD
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# ===========================================================================
+#
+# QUE MIDE:
+# - Costo por fila de convertir lo que devuelve la BD en entidades Alumno
+# - Camino con validacion (from_dict / constructor, lo que se usaba antes
+#   en los repositorios) vs camino confiable (from_db_dict / from_db_row)
+# - Memoria por instancia (Alumno usa __slots__)
+#
+# USO:
+#   python benchmarks/bench_alumno_hidratacion.py [filas]
+#
+# ===========================================================================
+
+"""
+Microbenchmark de hidratacion de Alumno (por fila y memoria).
+"""
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+
+from domain.entities.alumno import Alumno
+
+
+def filas_supabase(cantidad: int) -> list:
+    """Filas como las devuelve PostgREST (fechas en string)."""
+    return [
+        {
+            'id': f'00000000-0000-0000-0000-{i:012d}',
+            'nombre': 'Juan',
+            'apellido': f'Perez{i}',
+            'dni': f'{i:08d}',
+            'created_at': '2024-03-01T12:34:56.123456+00:00',
+            'updated_at': '2024-03-02T08:00:00.654321+00:00'
+        }
+        for i in range(cantidad)
+    ]
+
+
+def filas_postgres(cantidad: int) -> list:
+    """Filas como las devuelve psycopg (tuplas con datetime)."""
+    fecha = datetime(2024, 3, 1, 12, 34, 56, tzinfo=timezone.utc)
+    return [
+        (f'00000000-0000-0000-0000-{i:012d}', 'Juan', f'Perez{i}', f'{i:08d}', fecha, fecha)
+        for i in range(cantidad)
+    ]
+
+
+def medir(nombre: str, funcion, filas: int, repeticiones: int = 5) -> float:
+    """Imprime y retorna los microsegundos por fila (mejor de N)."""
+    segundos = min(timeit.repeat(funcion, number=1, repeat=repeticiones))
+    por_fila = segundos / filas * 1e6
+    print(f"  {nombre:<42} {por_fila:7.2f} us/fila   {segundos * 1000:8.1f} ms total")
+    return por_fila
+
+
+def bytes_por_instancia(crear, filas: list) -> float:
+    """Memoria asignada por instancia creada."""
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    instancias = [crear(fila) for fila in filas]
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (despues - antes) / len(instancias)
+
+
+def main(cantidad: int = 50_000) -> None:
+    dicts = filas_supabase(cantidad)
+    tuplas = filas_postgres(cantidad)
+    
+    print(f"=== Hidratacion de {cantidad} alumnos ===\n")
+    
+    print("Filas de Supabase (dict, fechas en string):")
+    antes = medir("from_dict (valida y normaliza)",
+                  lambda: [Alumno.from_dict(d) for d in dicts], cantidad)
+    despues = medir("from_db_dict (confiable)",
+                    lambda: [Alumno.from_db_dict(d) for d in dicts], cantidad)
+    print(f"  -> {antes / despues:.1f}x mas rapido\n")
+    
+    print("Filas de PostgreSQL (tupla, datetime):")
+    antes = medir("Alumno(...) (valida y normaliza)",
+                  lambda: [Alumno(id=t[0], nombre=t[1], apellido=t[2], dni=t[3],
+                                  created_at=t[4], updated_at=t[5]) for t in tuplas], cantidad)
+    despues = medir("from_db_row (confiable)",
+                    lambda: [Alumno.from_db_row(*t) for t in tuplas], cantidad)
+    print(f"  -> {antes / despues:.1f}x mas rapido\n")
+    
+    # Solo la instancia (las fechas/strings se comparten entre filas)
+    memoria = bytes_por_instancia(lambda t: Alumno.from_db_row(*t), tuplas)
+    print(f"Memoria por instancia (con __slots__): {memoria:.0f} bytes")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
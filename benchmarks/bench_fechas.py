@@ -0,0 +1,111 @@
+# ===========================================================================
+# Benchmark: Codec de fechas (lectura -> JSON)
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# ===========================================================================
+#
+# QUE MIDE:
+# - Parseo de un timestamp de PostgREST: replace + fromisoformat (antes)
+#   vs parsear_fecha con cache
+# - Ida y vuelta completa por fila (filas de Supabase -> Alumno -> dict):
+#   antes parseaba y formateaba las dos fechas; ahora pasan como texto
+# - Con fechas todas distintas y con fechas repetidas (una importacion
+#   masiva deja el mismo created_at en miles de filas)
+#
+# USO:
+#   python benchmarks/bench_fechas.py [filas]
+#
+# ===========================================================================
+
+"""
+Microbenchmark del codec de fechas contra el camino anterior.
+"""
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import timeit
+from datetime import datetime
+
+from domain.entities.alumno import Alumno
+from domain.entities.fechas import parsear_fecha
+
+
+def filas_supabase(cantidad: int, distintas: bool) -> list:
+    """Filas como las devuelve PostgREST (fechas en string)."""
+    return [
+        {
+            'id': f'00000000-0000-0000-0000-{i:012d}',
+            'nombre': 'Juan',
+            'apellido': f'Perez{i}',
+            'dni': f'{i:08d}',
+            'created_at': f'2024-03-01T12:34:56.{i % 1_000_000 if distintas else 123456:06d}+00:00',
+            'updated_at': f'2024-03-02T08:00:00.{i % 1_000_000 if distintas else 654321:06d}+00:00'
+        }
+        for i in range(cantidad)
+    ]
+
+
+def ida_y_vuelta_anterior(filas: list) -> list:
+    """Lo que hacian from_db_dict + to_dict antes del codec."""
+    salida = []
+    for data in filas:
+        created_at = datetime.fromisoformat(data['created_at'].replace('Z', '+00:00'))
+        updated_at = datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00'))
+        alumno = Alumno.from_db_row(
+            data['id'], data['nombre'], data['apellido'], data['dni'],
+            created_at, updated_at
+        )
+        salida.append({
+            'id': alumno._id,
+            'nombre': alumno._nombre,
+            'apellido': alumno._apellido,
+            'dni': alumno._dni,
+            'created_at': alumno._created_at.isoformat() if alumno._created_at else None,
+            'updated_at': alumno._updated_at.isoformat() if alumno._updated_at else None
+        })
+    return salida
+
+
+def ida_y_vuelta_actual(filas: list) -> list:
+    """Camino de listar: from_db_dicts + to_dict."""
+    return [alumno.to_dict() for alumno in Alumno.from_db_dicts(filas)]
+
+
+def medir(nombre: str, funcion, filas: int, repeticiones: int = 5) -> float:
+    """Imprime y retorna los microsegundos por fila (mejor de N)."""
+    segundos = min(timeit.repeat(funcion, number=1, repeat=repeticiones))
+    por_fila = segundos / filas * 1e6
+    print(f"  {nombre:<42} {por_fila:7.2f} us/fila   {segundos * 1000:8.1f} ms total")
+    return por_fila
+
+
+def main(cantidad: int = 50_000) -> None:
+    print(f"=== Codec de fechas, {cantidad} filas ===\n")
+    
+    for distintas in (True, False):
+        filas = filas_supabase(cantidad, distintas)
+        textos = [fila['created_at'] for fila in filas]
+        print("Fechas distintas:" if distintas else "Fechas repetidas (importacion masiva):")
+        
+        antes = medir("replace + fromisoformat",
+                      lambda: [datetime.fromisoformat(t.replace('Z', '+00:00')) for t in textos],
+                      cantidad)
+        parsear_fecha.cache_clear()
+        despues = medir("parsear_fecha (cache)",
+                        lambda: [parsear_fecha(t) for t in textos], cantidad)
+        print(f"  -> parseo: {antes / despues:.1f}x")
+        
+        antes = medir("fila -> Alumno -> dict (anterior)",
+                      lambda: ida_y_vuelta_anterior(filas), cantidad)
+        despues = medir("fila -> Alumno -> dict (texto tal cual)",
+                        lambda: ida_y_vuelta_actual(filas), cantidad)
+        print(f"  -> ida y vuelta: {antes / despues:.1f}x mas rapido\n")
+    
+    assert ida_y_vuelta_actual(filas) == ida_y_vuelta_anterior(filas)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
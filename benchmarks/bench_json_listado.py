@@ -0,0 +1,114 @@
+# ===========================================================================
+# Benchmark: GET /api/alumnos (serializacion JSON)
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# ===========================================================================
+#
+# QUE MIDE:
+# - Requests por segundo de GET /api/alumnos con el test client de Flask
+#   (sin red; servicio sobre MockAlumnoRepository, auth mockeada)
+# - Antes: la ruta armaba [a.to_dict() for a in alumnos] y jsonify
+#   codificaba con json de la stdlib
+# - Despues: AlumnoJSONProvider, con la stdlib y con orjson
+#
+# USO:
+#   python benchmarks/bench_json_listado.py [alumnos]
+#
+# ===========================================================================
+
+"""
+Throughput de GET /api/alumnos con cada proveedor JSON.
+"""
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import os
+import time
+from unittest.mock import patch
+
+from flask.json.provider import DefaultJSONProvider
+
+import api.json_provider as json_provider
+from api.index import create_app
+from api.json_provider import AlumnoJSONProvider
+from application.alumno_service import AlumnoService
+from domain.entities.alumno import Alumno
+from domain.repositories.alumno_repository import MockAlumnoRepository
+
+
+class ProveedorAnterior(DefaultJSONProvider):
+    """jsonify de antes: lista de to_dict() + stdlib."""
+    
+    def response(self, *args, **kwargs):
+        if args and isinstance(args[0], list):
+            args = ([a.to_dict() if isinstance(a, Alumno) else a for a in args[0]],)
+        return super().response(*args, **kwargs)
+
+
+def crear_app(cantidad: int):
+    """App con un servicio sobre MockAlumnoRepository con N alumnos."""
+    repositorio = MockAlumnoRepository()
+    repositorio.crear_lote([
+        Alumno.from_db_row(
+            None, 'Juan', f'Perez{i}', f'{i:08d}',
+            '2024-03-01T12:34:56.123456+00:00',
+            '2024-03-02T08:00:00.654321+00:00'
+        )
+        for i in range(cantidad)
+    ])
+    app = create_app()
+    app.config['DEBUG'] = False
+    app.extensions['service_registry'].reset(AlumnoService(repositorio))
+    return app
+
+
+def medir(nombre: str, app, cantidad: int, segundos: float = 2.0) -> float:
+    """Imprime y retorna los requests por segundo."""
+    cliente = app.test_client()
+    cabeceras = {'Authorization': 'Bearer bench'}
+    respuesta = cliente.get('/api/alumnos', headers=cabeceras)
+    assert respuesta.status_code == 200, respuesta.get_data()
+    cuerpo = respuesta.get_data()
+    
+    requests = 0
+    inicio = time.perf_counter()
+    while time.perf_counter() - inicio < segundos:
+        cliente.get('/api/alumnos', headers=cabeceras)
+        requests += 1
+    por_segundo = requests / (time.perf_counter() - inicio)
+    
+    filas = por_segundo * cantidad
+    print(f"  {nombre:<34} {por_segundo:8.1f} req/s   {filas / 1000:8.0f} mil filas/s   "
+          f"{len(cuerpo) / 1024:6.0f} KiB")
+    return por_segundo
+
+
+def main(cantidad: int = 2_000) -> None:
+    os.environ.setdefault('SUPABASE_URL', 'https://bench.supabase.co')
+    os.environ.setdefault('SUPABASE_KEY', 'bench-key')
+    os.environ.setdefault('SUPABASE_JWT_SECRET', 'bench-secret')
+    
+    sesion = {'sub': 'bench', 'exp': time.time() + 3600}
+    with patch('api.middleware.auth._validate_jwt', return_value=sesion):
+        app = crear_app(cantidad)
+        print(f"=== GET /api/alumnos con {cantidad} alumnos ===\n")
+        
+        app.json = ProveedorAnterior(app)
+        antes = medir("antes (to_dict + stdlib)", app, cantidad)
+        
+        app.json = AlumnoJSONProvider(app)
+        with patch.object(json_provider, 'orjson', None):
+            stdlib = medir("AlumnoJSONProvider (stdlib)", app, cantidad)
+        
+        if AlumnoJSONProvider.rapido:
+            rapido = medir("AlumnoJSONProvider (orjson)", app, cantidad)
+            print(f"\n  -> orjson: {rapido / antes:.1f}x, stdlib: {stdlib / antes:.1f}x")
+        else:
+            print(f"\n  -> stdlib: {stdlib / antes:.1f}x (orjson no instalado)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -30,6 +30,10 @@
 
 -- Nota: En Supabase, gen_random_uuid() está disponible sin necesidad de extensión
 
+-- Extensión de trigramas para la búsqueda por texto (buscar_alumnos)
+-- POR QUÉ: permite que LIKE '%texto%' use un índice GIN en vez de recorrer la tabla
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 
 -- ═══════════════════════════════════════════════════════════════════════════
 -- SECCIÓN 2: TABLA PRINCIPAL - ALUMNOS
@@ -111,6 +115,8 @@ CREATE INDEX IF NOT EXISTS idx_alumnos_apellido
     ON alumnos(apellido);
 
 -- Índice compuesto para búsqueda por nombre completo
+-- También sirve la paginación keyset (listar_pagina): ORDER BY apellido,
+-- nombre, id con filtro "clave > cursor" salta directo a la página sin OFFSET
 CREATE INDEX IF NOT EXISTS idx_alumnos_apellido_nombre 
     ON alumnos(apellido, nombre);
 
@@ -118,6 +124,21 @@ CREATE INDEX IF NOT EXISTS idx_alumnos_apellido_nombre
 CREATE INDEX IF NOT EXISTS idx_alumnos_apellido_lower 
     ON alumnos(LOWER(apellido));
 
+-- Índice para prefijos de apellido en buscar_alumnos (LOWER(apellido) LIKE 'abc%')
+-- POR QUÉ text_pattern_ops: con collation distinta de "C", un índice btree común
+-- no sirve para LIKE con prefijo; este sí
+CREATE INDEX IF NOT EXISTS idx_alumnos_apellido_lower_prefijo 
+    ON alumnos(LOWER(apellido) text_pattern_ops);
+
+-- Índice trigram para buscar texto en cualquier parte de apellido, nombre o DNI
+CREATE INDEX IF NOT EXISTS idx_alumnos_busqueda_trgm 
+    ON alumnos USING GIN (LOWER(apellido || ' ' || nombre || ' ' || dni) gin_trgm_ops);
+
+-- Índice para max(updated_at): firma del listado (ETag de GET /api/alumnos)
+-- POR QUÉ: sin índice, cada revalidación del listado recorre toda la tabla
+CREATE INDEX IF NOT EXISTS idx_alumnos_updated_at 
+    ON alumnos(updated_at);
+
 
 -- ═══════════════════════════════════════════════════════════════════════════
 -- SECCIÓN 4: FUNCIÓN Y TRIGGER PARA updated_at
@@ -152,9 +173,96 @@ CREATE TRIGGER trigger_alumnos_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION trigger_set_updated_at();
 
+-- ─────────────────────────────────────────────────────────────────────────
+-- Versión de la tabla (table_versions)
+-- ─────────────────────────────────────────────────────────────────────────
+-- POR QUÉ UN CONTADOR:
+-- - La app cachea listar_todos() por proceso y, antes de usar el cache,
+--   lee solo esta fila (una búsqueda por clave primaria) en vez de
+--   recorrer alumnos
+-- - Crece con cada INSERT, UPDATE o DELETE, venga de la API o del SQL Editor
+
+CREATE TABLE IF NOT EXISTS table_versions (
+    tabla TEXT PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+COMMENT ON TABLE table_versions IS 
+    'Contador de cambios por tabla. Lo incrementan triggers; la app lo usa para invalidar caches.';
+
+INSERT INTO table_versions (tabla, version) VALUES ('alumnos', 0)
+ON CONFLICT (tabla) DO NOTHING;
+
+-- POR QUÉ SECURITY DEFINER: los usuarios autenticados solo pueden leer
+-- table_versions (ver sección 6); el trigger escribe con los permisos del dueño
+CREATE OR REPLACE FUNCTION trigger_bump_table_version()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE tabla = TG_TABLE_NAME;
+    RETURN NULL;
+END;
+$$;
+
+COMMENT ON FUNCTION trigger_bump_table_version() IS 
+    'Función de trigger que incrementa la versión de la tabla en table_versions.';
+
+DROP TRIGGER IF EXISTS trigger_alumnos_version ON alumnos;
+
+-- POR QUÉ FOR EACH STATEMENT: una importación por lote incrementa la
+-- versión una sola vez, no una por fila
+CREATE TRIGGER trigger_alumnos_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON alumnos
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION trigger_bump_table_version();
+
 
 -- ═══════════════════════════════════════════════════════════════════════════
--- SECCIÓN 5: ROW LEVEL SECURITY (RLS)
+-- SECCIÓN 5: FUNCIÓN DE BÚSQUEDA (GET /api/alumnos/search)
+-- ═══════════════════════════════════════════════════════════════════════════
+
+-- POR QUÉ UNA FUNCIÓN:
+-- - PostgREST no puede filtrar por LOWER(apellido) ni ordenar por relevancia
+-- - Se llama por RPC: POST /rest/v1/rpc/buscar_alumnos
+-- - SECURITY INVOKER (default): respeta las políticas RLS del usuario
+
+-- REGLA (la misma de AlumnoRepository.buscar en la app):
+-- - El texto se parte en palabras; CADA palabra debe aparecer dentro de
+--   "apellido nombre dni" ('per ju' y 'erez' encuentran a Juan Pérez)
+-- - La primera palabra usa el índice trigram; las demás filtran esas filas
+
+CREATE OR REPLACE FUNCTION buscar_alumnos(q TEXT, limite INT DEFAULT 20)
+RETURNS SETOF alumnos
+LANGUAGE sql
+STABLE
+AS $$
+    WITH patron AS (
+        -- Escapar comodines de LIKE que vengan en el texto
+        SELECT replace(replace(replace(LOWER(TRIM(q)), '\', '\\'), '%', '\%'), '_', '\_') AS p
+    ),
+    palabras AS (
+        -- Un patrón '%palabra%' por palabra (ya escapada)
+        SELECT array_agg('%' || palabra || '%') AS patrones
+        FROM patron, regexp_split_to_table(patron.p, '\s+') AS palabra
+        WHERE palabra <> ''
+    )
+    SELECT a.*
+    FROM alumnos a, patron, palabras
+    WHERE LOWER(a.apellido || ' ' || a.nombre || ' ' || a.dni) LIKE palabras.patrones[1]
+      AND LOWER(a.apellido || ' ' || a.nombre || ' ' || a.dni) LIKE ALL (palabras.patrones)
+    ORDER BY (LOWER(a.apellido) LIKE patron.p || '%') DESC, a.apellido, a.nombre, a.id
+    LIMIT limite;
+$$;
+
+COMMENT ON FUNCTION buscar_alumnos(TEXT, INT) IS 
+    'Búsqueda por texto: cada palabra dentro de apellido, nombre o DNI; primero apellidos con ese prefijo.';
+
+
+-- ═══════════════════════════════════════════════════════════════════════════
+-- SECCIÓN 6: ROW LEVEL SECURITY (RLS)
 -- ═══════════════════════════════════════════════════════════════════════════
 
 -- POR QUÉ RLS:
@@ -202,9 +310,19 @@ CREATE POLICY "Usuarios autenticados pueden eliminar alumnos"
     TO authenticated
     USING (true);
 
+-- table_versions: solo lectura (la escribe el trigger de la sección 4)
+ALTER TABLE table_versions ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Usuarios autenticados pueden leer versiones" ON table_versions;
+CREATE POLICY "Usuarios autenticados pueden leer versiones"
+    ON table_versions
+    FOR SELECT
+    TO authenticated
+    USING (true);
+
 
 -- ═══════════════════════════════════════════════════════════════════════════
--- SECCIÓN 6: DATOS DE PRUEBA (OPCIONAL - SOLO DESARROLLO)
+-- SECCIÓN 7: DATOS DE PRUEBA (OPCIONAL - SOLO DESARROLLO)
 -- ═══════════════════════════════════════════════════════════════════════════
 
 -- ADVERTENCIA: Comentar o eliminar en producción
@@ -224,7 +342,7 @@ ON CONFLICT (dni) DO NOTHING;  -- Evita errores si ya existen
 
 
 -- ═══════════════════════════════════════════════════════════════════════════
--- SECCIÓN 7: VERIFICACIÓN
+-- SECCIÓN 8: VERIFICACIÓN
 -- ═══════════════════════════════════════════════════════════════════════════
 
 -- Verificar que la tabla se creó correctamente
@@ -253,4 +371,5 @@ BEGIN
     RAISE NOTICE '📊 Tabla "alumnos" creada/verificada';
     RAISE NOTICE '🔒 Row Level Security habilitado';
     RAISE NOTICE '⚡ Trigger de updated_at configurado';
+    RAISE NOTICE '🔢 Versión de alumnos en table_versions';
 END $$;
@@ -25,10 +25,12 @@ Es independiente de frameworks y bases de datos.
 # POR QUE: Permite ejecutar el archivo directamente con python domain/entities/alumno.py
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional, Union
+from domain.entities.fechas import formatear_fecha, parsear_fecha
 from domain.exceptions import ValidacionError
 
 
@@ -46,9 +48,24 @@ class Alumno:
     
     Patrones aplicados:
         - Factory Method: from_dict() para crear desde diccionario
+        - Factory Method: from_db_row() / from_db_dict() para filas ya
+          validadas que vienen de la BD
         - Value Object: Inmutabilidad conceptual (atributos privados)
+    
+    POR QUE __slots__:
+    - Sin __dict__ por instancia: cada alumno ocupa menos de la mitad de
+      memoria y el acceso a atributos es mas rapido
+    - Listar decenas de miles de alumnos crea decenas de miles de instancias
+    
+    POR QUE LAS FECHAS PUEDEN QUEDAR COMO TEXTO:
+    - Las filas de la BD traen las fechas en ISO8601; si nadie las usa
+      como datetime, to_dict() las devuelve tal cual sin parsear ni
+      formatear
+    - created_at / updated_at las parsean recien al pedirlas (con cache)
     """
     
+    __slots__ = ('_id', '_nombre', '_apellido', '_dni', '_created_at', '_updated_at')
+    
     # Constantes de validacion
     NOMBRE_MAX_LENGTH = 100
     APELLIDO_MAX_LENGTH = 100
@@ -121,12 +138,14 @@ class Alumno:
     @property
     def created_at(self) -> datetime:
         """Retorna la fecha de creacion."""
-        return self._created_at
+        valor = self._created_at
+        return parsear_fecha(valor) if valor.__class__ is str else valor
     
     @property
     def updated_at(self) -> datetime:
         """Retorna la fecha de ultima modificacion."""
-        return self._updated_at
+        valor = self._updated_at
+        return parsear_fecha(valor) if valor.__class__ is str else valor
     
     @property
     def nombre_completo(self) -> str:
@@ -161,9 +180,9 @@ class Alumno:
         updated_at = data.get('updated_at')
         
         if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+            created_at = parsear_fecha(created_at)
         if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
+            updated_at = parsear_fecha(updated_at)
         
         return cls(
             id=data.get('id'),
@@ -174,7 +193,100 @@ class Alumno:
             updated_at=updated_at
         )
     
-    def to_dict(self) -> dict:
+    @classmethod
+    def from_db_row(
+        cls,
+        id: str,
+        nombre: str,
+        apellido: str,
+        dni: str,
+        created_at: Union[datetime, str, None],
+        updated_at: Union[datetime, str, None]
+    ) -> 'Alumno':
+        """
+        Crea un Alumno desde una fila leida de la BD, SIN validar.
+        
+        POR QUE SIN VALIDAR NI NORMALIZAR:
+        - Toda fila se valido y normalizo al escribirse (constructor)
+        - Repetir los _validar_*, strip(), title() y upper() en cada
+          lectura era la mayor parte del costo de listar
+        
+        SOLO PARA REPOSITORIOS: datos del usuario deben pasar por el
+        constructor o por from_dict().
+        
+        Args:
+            id: ID del alumno
+            nombre: Nombre ya normalizado
+            apellido: Apellido ya normalizado
+            dni: DNI ya normalizado
+            created_at: Fecha de creacion (datetime o texto ISO8601)
+            updated_at: Fecha de modificacion (datetime o texto ISO8601)
+        
+        Returns:
+            Instancia de Alumno
+        """
+        alumno = cls.__new__(cls)
+        alumno._id = id
+        alumno._nombre = nombre
+        alumno._apellido = apellido
+        alumno._dni = dni
+        alumno._created_at = created_at
+        alumno._updated_at = updated_at
+        return alumno
+    
+    @classmethod
+    def from_db_dict(cls, data: dict) -> 'Alumno':
+        """
+        Crea un Alumno desde un dict de la BD (PostgREST), SIN validar.
+        
+        Igual que from_db_row() pero para filas como diccionario. Las
+        fechas quedan como el texto original (ver fechas.py).
+        
+        Args:
+            data: Fila con id, nombre, apellido, dni y fechas
+        
+        Returns:
+            Instancia de Alumno
+        """
+        return cls.from_db_row(
+            data.get('id'),
+            data['nombre'],
+            data['apellido'],
+            data['dni'],
+            data.get('created_at'),
+            data.get('updated_at')
+        )
+    
+    @classmethod
+    def from_db_dicts(cls, filas: List[dict]) -> List['Alumno']:
+        """
+        Crea todos los Alumno de un resultado de la BD, SIN validar.
+        
+        POR QUE UN METODO PARA LA LISTA:
+        - Un solo bucle sin llamadas por fila a from_db_dict/from_db_row
+        - Es el camino de listar, buscar y paginar
+        
+        Args:
+            filas: Filas como las devuelve PostgREST
+        
+        Returns:
+            Lista de Alumno en el mismo orden
+        """
+        nuevo = cls.__new__
+        alumnos = []
+        agregar = alumnos.append
+        for data in filas:
+            alumno = nuevo(cls)
+            alumno._id = data.get('id')
+            alumno._nombre = data['nombre']
+            alumno._apellido = data['apellido']
+            alumno._dni = data['dni']
+            alumno._created_at = data.get('created_at')
+            alumno._updated_at = data.get('updated_at')
+            agregar(alumno)
+        return alumnos
+    
+    def to_dict(self, formatear_fechas: bool = True) -> dict:
         """
         Convierte el Alumno a diccionario.
         
@@ -182,16 +294,28 @@ class Alumno:
         - Facilita serializacion a JSON
         - Desacopla la entidad del formato de transporte
         
+        Args:
+            formatear_fechas: Si es False las fechas quedan como estan
+                (datetime o texto), para encoders que ya escriben
+                datetime en ISO8601 (ej: orjson, ver api/json_provider.py)
+        
         Returns:
             Diccionario con los datos del alumno
         """
+        if formatear_fechas:
+            created_at = formatear_fecha(self._created_at)
+            updated_at = formatear_fecha(self._updated_at)
+        else:
+            created_at = self._created_at
+            updated_at = self._updated_at
+        
         return {
             'id': self._id,
             'nombre': self._nombre,
             'apellido': self._apellido,
             'dni': self._dni,
-            'created_at': self._created_at.isoformat() if self._created_at else None,
-            'updated_at': self._updated_at.isoformat() if self._updated_at else None
+            'created_at': created_at,
+            'updated_at': updated_at
         }
     
     # =========================================================================
@@ -272,7 +396,7 @@ class Alumno:
             nombre=nombre if nombre is not None else self._nombre,
             apellido=apellido if apellido is not None else self._apellido,
             dni=dni if dni is not None else self._dni,
-            created_at=self._created_at,
+            created_at=self.created_at,
             updated_at=datetime.now(timezone.utc)  # Actualizar timestamp
         )
     
@@ -329,14 +453,22 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"[ERROR] from_dict: {e}")
     
-    # Test 4: to_dict
+    # Test 4: from_db_row (sin validar)
+    try:
+        alumno3 = Alumno.from_db_row("abc-456", "Ana", "Lopez", "1", None, None)
+        print(f"[OK] from_db_row: {alumno3}")
+        print(f"     - Sin __dict__: {not hasattr(alumno3, '__dict__')}")
+    except Exception as e:
+        print(f"[ERROR] from_db_row: {e}")
+    
+    # Test 5: to_dict
     try:
         dict_alumno = alumno2.to_dict()
         print(f"[OK] to_dict: {dict_alumno}")
     except Exception as e:
         print(f"[ERROR] to_dict: {e}")
     
-    # Test 5: actualizar (inmutable)
+    # Test 6: actualizar (inmutable)
     try:
         alumno_actualizado = alumno.actualizar(nombre="Juan Carlos")
         print(f"[OK] Actualizar: {alumno_actualizado}")
@@ -0,0 +1,116 @@
+# ===========================================================================
+# Codec de Fechas (timestamps ISO8601)
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: Domain (Nucleo)
+# ===========================================================================
+#
+# POR QUE UN CODEC PROPIO:
+# - Cada fila leida pasaba dos veces por replace('Z', '+00:00') +
+#   datetime.fromisoformat, y cada respuesta por dos isoformat()
+# - PostgREST devuelve siempre el mismo formato
+#   (2024-03-01T12:34:56.123456+00:00); las filas de una misma importacion
+#   comparten created_at, asi que el mismo texto se parsea muchas veces
+# - La mayoria de las lecturas solo reenvia la fecha al cliente: no hace
+#   falta convertirla a datetime para volver a convertirla a texto
+#
+# ===========================================================================
+
+"""
+Parseo y formateo de fechas ISO8601 con cache.
+
+Uso:
+    from domain.entities.fechas import parsear_fecha, formatear_fecha
+    
+    fecha = parsear_fecha('2024-03-01T12:34:56.123456+00:00')
+    texto = formatear_fecha(fecha)
+"""
+
+# Configuracion de path para pruebas atomicas
+import sys
+from pathlib import Path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional, Union
+
+
+# Textos distintos que se recuerdan ya parseados
+# POR QUE 4096: una pagina de listado trae a lo sumo unos pocos miles de
+# fechas distintas; cada entrada ocupa unos 200 bytes
+TAMANO_CACHE = 4096
+
+# Fraccion de segundo: PostgREST recorta los ceros finales (".12")
+_FRACCION = re.compile(r'\.(\d{1,6})(?=\D|$)')
+
+
+@lru_cache(maxsize=TAMANO_CACHE)
+def parsear_fecha(texto: str) -> datetime:
+    """
+    Convierte un timestamp ISO8601 a datetime.
+    
+    POR QUE PRIMERO fromisoformat DIRECTO:
+    - Desde Python 3.11 acepta 'Z' y fracciones de cualquier largo, asi
+      que el formato de PostgREST entra sin tocar el texto
+    - Solo si falla (Python anterior) se normaliza y se reintenta
+    
+    Args:
+        texto: Fecha ISO8601 (ej: "2024-03-01T12:34:56.12Z")
+    
+    Returns:
+        datetime (con zona horaria si el texto la trae)
+    
+    Raises:
+        ValueError: Si el texto no es una fecha ISO8601
+    """
+    try:
+        return datetime.fromisoformat(texto)
+    except ValueError:
+        return datetime.fromisoformat(_normalizar(texto))
+
+
+def formatear_fecha(valor: Union[datetime, str, None]) -> Optional[str]:
+    """
+    Convierte una fecha a texto ISO8601.
+    
+    Un texto se devuelve tal cual: es la fecha original de la BD que
+    nadie necesito como datetime.
+    
+    Args:
+        valor: datetime, texto ISO8601 o None
+    
+    Returns:
+        Texto ISO8601 o None
+    """
+    if valor is None or valor.__class__ is str:
+        return valor
+    return valor.isoformat()
+
+
+def _normalizar(texto: str) -> str:
+    """'Z' como +00:00 y fraccion completada a 6 digitos."""
+    texto = texto.strip()
+    if texto.endswith(('Z', 'z')):
+        texto = texto[:-1] + '+00:00'
+    return _FRACCION.sub(lambda m: '.' + m.group(1).ljust(6, '0'), texto)
+
+
+# ===========================================================================
+# PRUEBA ATOMICA
+# ===========================================================================
+if __name__ == "__main__":
+    print("=== Prueba de Codec de Fechas ===\n")
+    
+    fecha = parsear_fecha('2024-03-01T12:34:56.12Z')
+    print(f"[OK] Parseo: {fecha!r}")
+    print(f"[OK] Normalizado: {_normalizar('2024-03-01T12:34:56.12Z')}")
+    print(f"[OK] Formateo: {formatear_fecha(fecha)}")
+    print(f"[OK] Texto tal cual: {formatear_fecha('2024-03-01T12:34:56+00:00')}")
+    
+    parsear_fecha('2024-03-01T12:34:56.12Z')
+    print(f"[OK] Cache: {parsear_fecha.cache_info()}")
+    
+    print("\n=== Todas las pruebas pasaron ===")
@@ -93,6 +93,23 @@ class DNIDuplicado(DomainException):
         self.dni = dni
 
 
+class ModificacionConcurrente(DomainException):
+    """
+    Error cuando el alumno cambio desde que el cliente lo leyo.
+    
+    Uso: Al actualizar con una precondicion (If-Match / updated_at)
+    que ya no coincide con la version guardada.
+    HTTP: 412 Precondition Failed
+    """
+    
+    def __init__(self, identificador: str = None):
+        message = "El alumno fue modificado por otro usuario"
+        if identificador:
+            message = f"El alumno con ID '{identificador}' fue modificado por otro usuario"
+        super().__init__(message, "PRECONDITION_FAILED")
+        self.identificador = identificador
+
+
 class RepositoryError(DomainException):
     """
     Error de acceso a datos/repositorio.
@@ -1,4 +1,5 @@
 # domain/repositories/__init__.py
 from domain.repositories.alumno_repository import AlumnoRepository, MockAlumnoRepository
+from domain.repositories.async_alumno_repository import AsyncAlumnoRepository
 
-__all__ = ['AlumnoRepository', 'MockAlumnoRepository']
+__all__ = ['AlumnoRepository', 'MockAlumnoRepository', 'AsyncAlumnoRepository']
@@ -24,15 +24,23 @@ Define las operaciones de persistencia sin conocer la implementacion.
 # POR QUE: Permite ejecutar el archivo directamente con python domain/repositories/alumno_repository.py
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
+import bisect
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime, timezone
+from threading import RLock
+from typing import Dict, Iterable, Optional, List, Set, Tuple
 
 # Importamos la entidad (misma capa, permitido)
 from domain.entities.alumno import Alumno
 
 
+# Columnas que se pueden pedir en una proyeccion (listar_filas, obtener_fila_por_id)
+CAMPOS_ALUMNO = ('id', 'nombre', 'apellido', 'dni', 'created_at', 'updated_at')
+
+
 class AlumnoRepository(ABC):
     """
     Interface abstracta para el repositorio de Alumnos.
@@ -45,12 +53,21 @@ class AlumnoRepository(ABC):
     
     Metodos abstractos:
         - crear(alumno) -> Alumno
+        - crear_lote(alumnos) -> List[Alumno]
         - obtener_por_id(id) -> Optional[Alumno]
         - obtener_por_dni(dni) -> Optional[Alumno]
+        - obtener_por_dni_many(dnis) -> Dict[str, Alumno]
         - listar_todos() -> List[Alumno]
-        - actualizar(alumno) -> Alumno
+        - listar_pagina(limite, despues_de) -> List[Alumno]
+        - listar_filas(campos, limite, despues_de) -> List[dict]
+        - obtener_fila_por_id(id, campos) -> Optional[dict]
+        - buscar(texto, limite) -> List[Alumno]
+        - actualizar(alumno, updated_at_esperado) -> Alumno
         - eliminar(id) -> bool
         - existe_dni(dni, excluir_id) -> bool
+        - existe_dni_many(dnis) -> Set[str]
+        - obtener_firma() -> Tuple[int, Optional[datetime]]
+        - obtener_version() -> Optional[int]
     """
     
     @abstractmethod
@@ -70,6 +87,28 @@ class AlumnoRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def crear_lote(self, alumnos: List[Alumno]) -> List[Alumno]:
+        """
+        Persiste varios alumnos nuevos en una sola operacion.
+        
+        Los alumnos cuyo DNI ya existe se omiten sin error.
+        
+        Args:
+            alumnos: Entidades Alumno a persistir (sin ID, DNIs distintos)
+        
+        Returns:
+            Solo los alumnos creados, con ID asignado
+        
+        Raises:
+            RepositoryError: Si hay error de persistencia
+        
+        POR QUE OMITIR DUPLICADOS EN VEZ DE FALLAR:
+        - Un DNI repetido no debe abortar el resto del lote
+        - El que llama compara por DNI para saber cuales faltaron
+        """
+        pass
+    
     @abstractmethod
     def obtener_por_id(self, id: str) -> Optional[Alumno]:
         """
@@ -97,27 +136,146 @@ class AlumnoRepository(ABC):
         pass
     
     @abstractmethod
-    def listar_todos(self) -> List[Alumno]:
+    def obtener_por_dni_many(self, dnis: Iterable[str]) -> Dict[str, Alumno]:
+        """
+        Busca varios alumnos por DNI en pocas consultas.
+        
+        Args:
+            dnis: DNIs a buscar (se normalizan a mayusculas)
+        
+        Returns:
+            Diccionario DNI normalizado -> Alumno, solo con los que existen
+        """
+        pass
+    
+    @abstractmethod
+    def listar_todos(self, version: Optional[int] = None) -> List[Alumno]:
         """
         Obtiene todos los alumnos.
         
+        Args:
+            version: obtener_version() si quien llama ya la leyo (ej: para
+                el ETag); solo la usan los decoradores que revalidan con
+                ella (CachedAlumnoRepository), los backends la ignoran
+        
         Returns:
             Lista de todos los alumnos (puede estar vacia)
         
         POR QUE LISTA Y NO ITERADOR:
         - Para un CRUD simple, la cantidad de alumnos es manejable
         - Simplifica el codigo cliente
-        - En caso de necesitar paginacion, se agregaria otro metodo
+        - En caso de necesitar paginacion, se usa listar_pagina()
+        """
+        pass
+    
+    @abstractmethod
+    def listar_pagina(
+        self,
+        limite: int,
+        despues_de: Optional[Tuple[str, str, str]] = None
+    ) -> List[Alumno]:
+        """
+        Obtiene una pagina de alumnos usando paginacion por cursor (keyset).
+        
+        El orden es estable por (apellido, nombre, id). El id desempata
+        alumnos con mismo apellido y nombre.
+        
+        Args:
+            limite: Cantidad maxima de alumnos a retornar
+            despues_de: Clave (apellido, nombre, id) del ultimo alumno de la
+                pagina anterior. None para la primera pagina.
+        
+        Returns:
+            Hasta `limite` alumnos cuya clave es mayor a `despues_de`
+        
+        POR QUE KEYSET Y NO OFFSET:
+        - OFFSET obliga a la BD a recorrer y descartar las filas anteriores
+        - Con keyset la BD salta directo a la clave usando el indice
+          idx_alumnos_apellido_nombre: cada pagina cuesta lo mismo
+        """
+        pass
+    
+    @abstractmethod
+    def listar_filas(
+        self,
+        campos: List[str],
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[str, str, str]] = None
+    ) -> List[dict]:
+        """
+        Obtiene solo algunas columnas de los alumnos, sin crear entidades.
+        
+        Mismo orden y mismo cursor que listar_pagina().
+        
+        Args:
+            campos: Columnas a traer (subconjunto de CAMPOS_ALUMNO)
+            limite: Cantidad maxima de filas, None para todas
+            despues_de: Clave (apellido, nombre, id) de la ultima fila vista
+        
+        Returns:
+            Filas como diccionarios con solo esas columnas. Las fechas
+            quedan como texto ISO8601, tal como llegan de la BD.
+        
+        POR QUE DICCIONARIOS Y NO ALUMNO:
+        - Las vistas de lista solo muestran algunas columnas
+        - Se evita traer, parsear y validar lo que no se va a mostrar
+        """
+        pass
+    
+    @abstractmethod
+    def obtener_fila_por_id(self, id: str, campos: List[str]) -> Optional[dict]:
+        """
+        Obtiene solo algunas columnas de un alumno.
+        
+        Args:
+            id: UUID del alumno
+            campos: Columnas a traer (subconjunto de CAMPOS_ALUMNO)
+        
+        Returns:
+            Diccionario con esas columnas, None si no existe
+        """
+        pass
+    
+    @abstractmethod
+    def buscar(self, texto: str, limite: int) -> List[Alumno]:
+        """
+        Busca alumnos por apellido, nombre o DNI (busqueda mientras se tipea).
+        
+        REGLA (igual en todos los backends; ver tests/test_buscar_contrato.py):
+        - El texto se parte en palabras por los espacios
+        - Un alumno coincide si CADA palabra aparece, sin distinguir
+          mayusculas, dentro de "apellido nombre dni" ("per ju" y "erez"
+          encuentran a Juan Perez; "23" a cualquier DNI que lo contenga)
+        - Las mayusculas se pliegan como str.lower(), tambien las acentuadas
+          ("ÁLV" encuentra a Álvaro); los acentos no se ignoran
+        - %, _ y \\ son texto literal, no comodines
+        
+        Args:
+            texto: Texto ingresado
+            limite: Cantidad maxima de resultados
+        
+        Returns:
+            Alumnos que coinciden; primero los que tienen el apellido
+            empezando con el texto, luego por (apellido, nombre, id)
         """
         pass
     
     @abstractmethod
-    def actualizar(self, alumno: Alumno) -> Alumno:
+    def actualizar(
+        self,
+        alumno: Alumno,
+        updated_at_esperado: Optional[datetime] = None
+    ) -> Alumno:
         """
         Actualiza un alumno existente.
         
+        Solo se actualizan nombre, apellido y dni. created_at y updated_at
+        los conserva/asigna el repositorio.
+        
         Args:
             alumno: Entidad Alumno con los nuevos datos (debe tener ID)
+            updated_at_esperado: Si se indica, solo actualiza si el
+                updated_at guardado coincide (concurrencia optimista)
         
         Returns:
             Alumno actualizado
@@ -125,6 +283,7 @@ class AlumnoRepository(ABC):
         Raises:
             AlumnoNoEncontrado: Si el ID no existe
             DNIDuplicado: Si el nuevo DNI pertenece a otro alumno
+            ModificacionConcurrente: Si updated_at_esperado no coincide
             RepositoryError: Si hay error de persistencia
         """
         pass
@@ -159,6 +318,57 @@ class AlumnoRepository(ABC):
         - Debemos verificar que no pertenezca a OTRO alumno
         """
         pass
+    
+    @abstractmethod
+    def existe_dni_many(self, dnis: Iterable[str]) -> Set[str]:
+        """
+        Verifica cuales de varios DNIs ya existen.
+        
+        Args:
+            dnis: DNIs a verificar (se normalizan a mayusculas)
+        
+        Returns:
+            Conjunto con los DNIs normalizados que ya existen
+        
+        POR QUE NO LLAMAR N VECES A existe_dni:
+        - Cada llamada es un round trip a la BD
+        - Conciliar miles de DNIs debe costar unas pocas consultas
+        """
+        pass
+    
+    @abstractmethod
+    def obtener_firma(self) -> Tuple[int, Optional[datetime]]:
+        """
+        Obtiene un resumen barato del estado de la tabla.
+        
+        Returns:
+            (cantidad de alumnos, max(updated_at)); la fecha es None si
+            la tabla esta vacia
+        
+        POR QUE CANTIDAD + max(updated_at):
+        - Crear o editar cambia max(updated_at); eliminar cambia la cantidad
+        - Una consulta de una fila alcanza para saber si el listado cambio
+          (ETag de GET /api/alumnos) sin traer ni serializar la tabla
+        """
+        pass
+    
+    @abstractmethod
+    def obtener_version(self) -> Optional[int]:
+        """
+        Obtiene la version de la tabla alumnos.
+        
+        Returns:
+            Numero que crece con cada escritura (crear, actualizar,
+            eliminar); None si la base no lleva version (sin fila en
+            table_versions)
+        
+        POR QUE UNA VERSION:
+        - Leerla es una fila por clave primaria: sirve para revalidar un
+          listar_todos() cacheado sin recorrer la tabla
+        - A diferencia de la firma, cambia tambien si se elimina un
+          alumno y se crea otro en el mismo instante
+        """
+        pass
 
 
 # ===========================================================================
@@ -167,19 +377,49 @@ class AlumnoRepository(ABC):
 
 class MockAlumnoRepository(AlumnoRepository):
     """
-    Implementacion mock del repositorio para testing.
+    Implementacion en memoria del repositorio (testing y pruebas de carga).
     
     POR QUE MOCK EN EL MISMO ARCHIVO:
     - Facilita testing sin dependencias externas
     - Documenta como implementar la interface
     - Util para desarrollo inicial sin BD
     
+    INDICES (se mantienen en cada escritura, nunca se recalculan):
+    - _por_dni: DNI -> id (hash), busqueda por DNI en O(1)
+    - _orden: lista ordenada de (apellido, nombre, id) con bisect;
+      listar y paginar no ordenan ni recorren toda la tabla
+    - _indice_busqueda: (sufijo, id) ordenado con todos los sufijos de cada
+      palabra; una subcadena es prefijo de algun sufijo, asi que buscar()
+      la encuentra con bisect
+    
+    POR QUE INDICES EN UN MOCK:
+    - Con 100k alumnos, un benchmark de la API debe medir la API y no
+      los recorridos lineales del mock
+    
+    THREAD-SAFETY:
+    - Todas las operaciones toman un RLock (reentrante porque, por
+      ejemplo, crear_lote() llama a crear())
+    
     NOTA: NO usar en produccion, los datos se pierden al reiniciar.
     """
     
     def __init__(self):
         self._alumnos: dict[str, Alumno] = {}
         self._id_counter = 0
+        self._lock = RLock()
+        
+        # Version de la tabla (simula el trigger de table_versions)
+        self._version = 0
+        
+        # Indice hash por DNI normalizado
+        self._por_dni: dict[str, str] = {}
+        
+        # Indice ordenado por la clave de listado (apellido, nombre, id)
+        self._orden: List[Tuple[str, str, str]] = []
+        
+        # Indice de sufijos para buscar(): lista ordenada de (sufijo, id)
+        # POR QUE BISECT: encontrar un prefijo es O(log n) y no recorre todo
+        self._indice_busqueda: List[Tuple[str, str]] = []
     
     def _generar_id(self) -> str:
         """Genera un ID unico para testing."""
@@ -190,71 +430,245 @@ class MockAlumnoRepository(AlumnoRepository):
         """Crea un alumno en memoria."""
         from domain.exceptions import DNIDuplicado
         
-        # Verificar DNI unico
-        if self.existe_dni(alumno.dni):
-            raise DNIDuplicado(alumno.dni)
-        
-        # Simular asignacion de ID
-        nuevo_id = self._generar_id()
-        alumno_con_id = Alumno(
-            id=nuevo_id,
-            nombre=alumno.nombre,
-            apellido=alumno.apellido,
-            dni=alumno.dni,
-            created_at=alumno.created_at,
-            updated_at=alumno.updated_at
-        )
-        
-        self._alumnos[nuevo_id] = alumno_con_id
-        return alumno_con_id
+        with self._lock:
+            # Verificar DNI unico
+            if self.existe_dni(alumno.dni):
+                raise DNIDuplicado(alumno.dni)
+            
+            # Simular asignacion de ID
+            nuevo_id = self._generar_id()
+            alumno_con_id = Alumno(
+                id=nuevo_id,
+                nombre=alumno.nombre,
+                apellido=alumno.apellido,
+                dni=alumno.dni,
+                created_at=alumno.created_at,
+                updated_at=alumno.updated_at
+            )
+            
+            self._guardar(alumno_con_id)
+            return alumno_con_id
+    
+    def crear_lote(self, alumnos: List[Alumno]) -> List[Alumno]:
+        """Crea en memoria los alumnos cuyo DNI no existe."""
+        with self._lock:
+            return [
+                self.crear(alumno)
+                for alumno in alumnos
+                if not self.existe_dni(alumno.dni)
+            ]
     
     def obtener_por_id(self, id: str) -> Optional[Alumno]:
         """Busca por ID en memoria."""
-        return self._alumnos.get(id)
+        with self._lock:
+            return self._alumnos.get(id)
     
     def obtener_por_dni(self, dni: str) -> Optional[Alumno]:
-        """Busca por DNI en memoria."""
-        for alumno in self._alumnos.values():
-            if alumno.dni.upper() == dni.upper():
-                return alumno
-        return None
-    
-    def listar_todos(self) -> List[Alumno]:
-        """Lista todos ordenados por apellido."""
-        return sorted(
-            self._alumnos.values(),
-            key=lambda a: (a.apellido, a.nombre)
-        )
+        """Busca por DNI con el indice hash."""
+        with self._lock:
+            id = self._por_dni.get(_normalizar_dni(dni))
+            return self._alumnos[id] if id is not None else None
     
-    def actualizar(self, alumno: Alumno) -> Alumno:
-        """Actualiza en memoria."""
-        from domain.exceptions import AlumnoNoEncontrado, DNIDuplicado
-        
-        if alumno.id not in self._alumnos:
-            raise AlumnoNoEncontrado(alumno.id)
-        
-        # Verificar DNI unico (excluyendo el actual)
-        if self.existe_dni(alumno.dni, excluir_id=alumno.id):
-            raise DNIDuplicado(alumno.dni)
+    def obtener_por_dni_many(self, dnis: Iterable[str]) -> Dict[str, Alumno]:
+        """Busca varios DNIs con el indice hash."""
+        with self._lock:
+            encontrados = {}
+            for dni in dnis:
+                id = self._por_dni.get(_normalizar_dni(dni))
+                if id is not None:
+                    alumno = self._alumnos[id]
+                    encontrados[alumno.dni] = alumno
+            return encontrados
+    
+    def listar_todos(self, version: Optional[int] = None) -> List[Alumno]:
+        """Lista todos en el orden del indice (sin ordenar)."""
+        with self._lock:
+            return [self._alumnos[clave[2]] for clave in self._orden]
+    
+    def listar_pagina(
+        self,
+        limite: int,
+        despues_de: Optional[Tuple[str, str, str]] = None
+    ) -> List[Alumno]:
+        """Lista una pagina saltando al cursor con bisect."""
+        with self._lock:
+            inicio = 0
+            if despues_de is not None:
+                inicio = bisect.bisect_right(self._orden, tuple(despues_de))
+            
+            return [
+                self._alumnos[clave[2]]
+                for clave in self._orden[inicio:inicio + limite]
+            ]
+    
+    def listar_filas(
+        self,
+        campos: List[str],
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[str, str, str]] = None
+    ) -> List[dict]:
+        """Lista filas proyectadas con el mismo orden que listar_pagina."""
+        with self._lock:
+            if limite is None:
+                limite = len(self._alumnos)
+            alumnos = self.listar_pagina(limite, despues_de)
+        return [_proyectar(alumno, campos) for alumno in alumnos]
+    
+    def obtener_fila_por_id(self, id: str, campos: List[str]) -> Optional[dict]:
+        """Busca por ID y proyecta las columnas pedidas."""
+        alumno = self.obtener_por_id(id)
+        return _proyectar(alumno, campos) if alumno else None
+    
+    def actualizar(
+        self,
+        alumno: Alumno,
+        updated_at_esperado: Optional[datetime] = None
+    ) -> Alumno:
+        """Actualiza en memoria (conserva created_at, renueva updated_at)."""
+        from domain.exceptions import (
+            AlumnoNoEncontrado,
+            DNIDuplicado,
+            ModificacionConcurrente
+        )
         
-        self._alumnos[alumno.id] = alumno
-        return alumno
+        with self._lock:
+            actual = self._alumnos.get(alumno.id)
+            if actual is None:
+                raise AlumnoNoEncontrado(alumno.id)
+            
+            if updated_at_esperado is not None and actual.updated_at != updated_at_esperado:
+                raise ModificacionConcurrente(alumno.id)
+            
+            # Verificar DNI unico (excluyendo el actual)
+            if self.existe_dni(alumno.dni, excluir_id=alumno.id):
+                raise DNIDuplicado(alumno.dni)
+            
+            # Simular el trigger de updated_at
+            guardado = Alumno(
+                id=alumno.id,
+                nombre=alumno.nombre,
+                apellido=alumno.apellido,
+                dni=alumno.dni,
+                created_at=actual.created_at,
+                updated_at=datetime.now(timezone.utc)
+            )
+            
+            self._quitar(actual)
+            self._guardar(guardado)
+            return guardado
     
     def eliminar(self, id: str) -> bool:
         """Elimina de memoria."""
-        if id in self._alumnos:
-            del self._alumnos[id]
+        with self._lock:
+            alumno = self._alumnos.get(id)
+            if alumno is None:
+                return False
+            self._quitar(alumno)
             return True
-        return False
     
     def existe_dni(self, dni: str, excluir_id: Optional[str] = None) -> bool:
-        """Verifica si el DNI existe."""
-        for alumno in self._alumnos.values():
-            if alumno.dni.upper() == dni.upper():
-                if excluir_id and alumno.id == excluir_id:
-                    continue  # Es el mismo alumno, no cuenta
-                return True
-        return False
+        """Verifica si el DNI existe con el indice hash."""
+        with self._lock:
+            id = self._por_dni.get(_normalizar_dni(dni))
+            return id is not None and id != excluir_id
+    
+    def existe_dni_many(self, dnis: Iterable[str]) -> Set[str]:
+        """Verifica varios DNIs de una vez."""
+        return set(self.obtener_por_dni_many(dnis))
+    
+    def obtener_firma(self) -> Tuple[int, Optional[datetime]]:
+        """Cantidad y max(updated_at) recorriendo la tabla en memoria."""
+        with self._lock:
+            if not self._alumnos:
+                return 0, None
+            return len(self._alumnos), max(a.updated_at for a in self._alumnos.values())
+    
+    def obtener_version(self) -> Optional[int]:
+        """Version en memoria (crece en cada _guardar y _quitar)."""
+        with self._lock:
+            return self._version
+    
+    def buscar(self, texto: str, limite: int) -> List[Alumno]:
+        """
+        Busca cada palabra en el indice de sufijos (regla en AlumnoRepository.buscar).
+        
+        Las palabras del texto no tienen espacios: si estan dentro de
+        "apellido nombre dni", estan dentro de una sola de sus palabras,
+        es decir, son prefijo de alguno de sus sufijos.
+        """
+        with self._lock:
+            ids = None
+            
+            for palabra in texto.lower().split():
+                coincidencias = set()
+                i = bisect.bisect_left(self._indice_busqueda, (palabra, ''))
+                while (
+                    i < len(self._indice_busqueda)
+                    and self._indice_busqueda[i][0].startswith(palabra)
+                ):
+                    coincidencias.add(self._indice_busqueda[i][1])
+                    i += 1
+                ids = coincidencias if ids is None else ids & coincidencias
+            
+            if not ids:
+                return []
+            
+            encontrados = [self._alumnos[id] for id in ids]
+        
+        prefijo = texto.strip().lower()
+        encontrados.sort(
+            key=lambda a: (
+                not a.apellido.lower().startswith(prefijo),
+                a.apellido, a.nombre, a.id
+            )
+        )
+        return encontrados[:limite]
+    
+    # =========================================================================
+    # MANTENIMIENTO DE INDICES (llamar con el lock tomado)
+    # =========================================================================
+    
+    def _guardar(self, alumno: Alumno) -> None:
+        """Agrega el alumno a la tabla y a todos los indices."""
+        self._version += 1
+        self._alumnos[alumno.id] = alumno
+        self._por_dni[_normalizar_dni(alumno.dni)] = alumno.id
+        bisect.insort(self._orden, (alumno.apellido, alumno.nombre, alumno.id))
+        for termino in _terminos_busqueda(alumno):
+            bisect.insort(self._indice_busqueda, (termino, alumno.id))
+    
+    def _quitar(self, alumno: Alumno) -> None:
+        """Quita el alumno de la tabla y de todos los indices."""
+        self._version += 1
+        del self._alumnos[alumno.id]
+        self._por_dni.pop(_normalizar_dni(alumno.dni), None)
+        _quitar_ordenado(self._orden, (alumno.apellido, alumno.nombre, alumno.id))
+        for termino in _terminos_busqueda(alumno):
+            _quitar_ordenado(self._indice_busqueda, (termino, alumno.id))
+
+
+def _normalizar_dni(dni: str) -> str:
+    """Normaliza el DNI igual que la entidad Alumno."""
+    return dni.strip().upper()
+
+
+def _quitar_ordenado(lista: list, valor: tuple) -> None:
+    """Quita un valor de una lista ordenada ubicandolo con bisect."""
+    i = bisect.bisect_left(lista, valor)
+    if i < len(lista) and lista[i] == valor:
+        del lista[i]
+
+
+def _terminos_busqueda(alumno: Alumno) -> Set[str]:
+    """Sufijos (en minusculas) de cada palabra de apellido, nombre y DNI."""
+    texto = f"{alumno.apellido} {alumno.nombre} {alumno.dni}".lower()
+    return {palabra[i:] for palabra in texto.split() for i in range(len(palabra))}
+
+
+def _proyectar(alumno: Alumno, campos: List[str]) -> dict:
+    """Deja solo las columnas pedidas (fechas en ISO8601, como la BD)."""
+    completo = alumno.to_dict()
+    return {campo: completo[campo] for campo in campos}
 
 
 # ===========================================================================
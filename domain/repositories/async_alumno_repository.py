@@ -0,0 +1,162 @@
+# ===========================================================================
+# Interface Async de Repositorio de Alumnos
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: Domain (Nucleo)
+# Patron: Repository Pattern (Interface/ABC)
+# ===========================================================================
+#
+# POR QUE UNA INTERFACE ASYNC APARTE:
+# - AlumnoRepository es sincronica: cada llamada bloquea el thread
+# - En la app ASGI un solo proceso atiende muchos requests a la vez;
+#   mientras una consulta espera a la BD, el event loop atiende otras
+# - Mismo contrato que AlumnoRepository, con metodos "async def"
+#
+# ===========================================================================
+
+"""
+Interface abstracta async para el repositorio de Alumnos.
+
+Cada metodo tiene la misma semantica que su par en AlumnoRepository.
+"""
+
+# Configuracion de path para pruebas atomicas
+import sys
+from pathlib import Path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Iterable, Optional, List, Set, Tuple
+
+from domain.entities.alumno import Alumno
+
+
+class AsyncAlumnoRepository(ABC):
+    """
+    Interface abstracta async para el repositorio de Alumnos.
+    
+    Metodos abstractos (todos "async", ver AlumnoRepository):
+        - crear(alumno) -> Alumno
+        - crear_lote(alumnos) -> List[Alumno]
+        - obtener_por_id(id) -> Optional[Alumno]
+        - obtener_por_dni(dni) -> Optional[Alumno]
+        - obtener_por_dni_many(dnis) -> Dict[str, Alumno]
+        - listar_todos() -> List[Alumno]
+        - listar_pagina(limite, despues_de) -> List[Alumno]
+        - listar_filas(campos, limite, despues_de) -> List[dict]
+        - obtener_fila_por_id(id, campos) -> Optional[dict]
+        - buscar(texto, limite) -> List[Alumno]
+        - actualizar(alumno, updated_at_esperado) -> Alumno
+        - eliminar(id) -> bool
+        - existe_dni(dni, excluir_id) -> bool
+        - existe_dni_many(dnis) -> Set[str]
+        - obtener_firma() -> Tuple[int, Optional[datetime]]
+        - obtener_version() -> Optional[int]
+        - cerrar() -> None
+    
+    Patron: Repository
+    """
+    
+    @abstractmethod
+    async def crear(self, alumno: Alumno) -> Alumno:
+        """Persiste un nuevo alumno (DNIDuplicado si el DNI existe)."""
+        pass
+    
+    @abstractmethod
+    async def crear_lote(self, alumnos: List[Alumno]) -> List[Alumno]:
+        """Persiste varios alumnos; retorna solo los creados."""
+        pass
+    
+    @abstractmethod
+    async def obtener_por_id(self, id: str) -> Optional[Alumno]:
+        """Busca un alumno por su ID."""
+        pass
+    
+    @abstractmethod
+    async def obtener_por_dni(self, dni: str) -> Optional[Alumno]:
+        """Busca un alumno por su DNI."""
+        pass
+    
+    @abstractmethod
+    async def obtener_por_dni_many(self, dnis: Iterable[str]) -> Dict[str, Alumno]:
+        """Busca varios alumnos por DNI (DNI en mayusculas -> Alumno)."""
+        pass
+    
+    @abstractmethod
+    async def listar_todos(self, version: Optional[int] = None) -> List[Alumno]:
+        """
+        Obtiene todos los alumnos ordenados por (apellido, nombre, id).
+        
+        version: ver AlumnoRepository.listar_todos
+        """
+        pass
+    
+    @abstractmethod
+    async def listar_pagina(
+        self,
+        limite: int,
+        despues_de: Optional[Tuple[str, str, str]] = None
+    ) -> List[Alumno]:
+        """Obtiene una pagina de alumnos posteriores a despues_de."""
+        pass
+    
+    @abstractmethod
+    async def listar_filas(
+        self,
+        campos: List[str],
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[str, str, str]] = None
+    ) -> List[dict]:
+        """Obtiene filas con solo las columnas pedidas."""
+        pass
+    
+    @abstractmethod
+    async def obtener_fila_por_id(self, id: str, campos: List[str]) -> Optional[dict]:
+        """Obtiene un alumno con solo las columnas pedidas."""
+        pass
+    
+    @abstractmethod
+    async def buscar(self, texto: str, limite: int) -> List[Alumno]:
+        """Busca por texto (misma regla que AlumnoRepository.buscar)."""
+        pass
+    
+    @abstractmethod
+    async def actualizar(
+        self,
+        alumno: Alumno,
+        updated_at_esperado: Optional[datetime] = None
+    ) -> Alumno:
+        """Actualiza un alumno (con precondicion opcional)."""
+        pass
+    
+    @abstractmethod
+    async def eliminar(self, id: str) -> bool:
+        """Elimina un alumno; retorna si existia."""
+        pass
+    
+    @abstractmethod
+    async def existe_dni(self, dni: str, excluir_id: Optional[str] = None) -> bool:
+        """Verifica si un DNI ya esta registrado."""
+        pass
+    
+    @abstractmethod
+    async def existe_dni_many(self, dnis: Iterable[str]) -> Set[str]:
+        """Verifica varios DNIs; retorna los que existen."""
+        pass
+    
+    @abstractmethod
+    async def obtener_firma(self) -> Tuple[int, Optional[datetime]]:
+        """Cantidad de alumnos y max(updated_at) (ETag del listado)."""
+        pass
+    
+    @abstractmethod
+    async def obtener_version(self) -> Optional[int]:
+        """Version de la tabla (None si la base no la lleva)."""
+        pass
+    
+    @abstractmethod
+    async def cerrar(self) -> None:
+        """Libera conexiones y recursos (al apagar la app)."""
+        pass
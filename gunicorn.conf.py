@@ -0,0 +1,45 @@
+# ===========================================================================
+# Configuracion de Gunicorn
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Compatible: Docker (gunicorn lee este archivo desde el directorio actual)
+# ===========================================================================
+#
+# POR QUE UN ARCHIVO DE CONFIGURACION:
+# - Los hooks (post_fork) no se pueden pasar por linea de comandos
+# - Cada worker precalienta cliente, servicio y verificador JWT antes de
+#   su primer request (ver api/prewarm.py)
+#
+# CON Y SIN --preload (GUNICORN_PRELOAD):
+# - Sin preload: cada worker importa la app despues del fork y
+#   create_app() precalienta (PREWARM_ON_START=1)
+# - Con preload: la app se importa una vez en el master y se comparte la
+#   memoria; el master NO precalienta (sus conexiones las heredarian todos
+#   los workers) y cada worker lo hace en post_fork
+#
+# ===========================================================================
+
+import os
+import sys
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv('WEB_CONCURRENCY', '2'))
+preload_app = os.getenv('GUNICORN_PRELOAD', '0') == '1'
+
+# load_dotenv() no pisa variables ya definidas: esto manda sobre el .env
+os.environ['PREWARM_ON_START'] = '0' if preload_app else '1'
+
+
+def post_fork(server, worker):
+    """Precalienta el worker si la app ya venia cargada del master (preload)."""
+    index = sys.modules.get('api.index')
+    
+    if index is None:
+        # Sin preload: create_app() todavia no corrio en este worker
+        return
+    
+    from api.prewarm import precalentar
+    
+    tiempos = precalentar(index.app)
+    server.log.info("Worker %s precalentado: %s", worker.pid, tiempos)
@@ -0,0 +1,443 @@
+# ===========================================================================
+# Repositorio de Alumnos con Cache (Decorator)
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: Infrastructure
+# Patron: Decorator, Read-Through Cache
+# ===========================================================================
+#
+# POR QUE UN DECORADOR DE REPOSITORIO:
+# - El ~95% del trafico son lecturas de un alumno por ID
+# - Cada lectura era un round trip a Supabase
+# - Envuelve CUALQUIER AlumnoRepository sin modificarlo
+# - El servicio no se entera: sigue hablando con un AlumnoRepository
+#
+# POLITICA DEL CACHE:
+# - LRU: si se llena, se descarta el menos usado
+# - TTL: cada entrada vence a los N segundos
+# - Se invalida en crear, actualizar y eliminar
+# - listar_todos() se guarda junto con la version de la tabla y se
+#   revalida leyendo solo la version (ver obtener_version)
+#
+# NOTA MULTI-PROCESO:
+# - El cache es por proceso (cada worker de gunicorn tiene el suyo)
+# - Una escritura en otro worker se ve, como mucho, al vencer el TTL
+# - Salvo en listar_todos(): la version la incrementa la BD, asi que la
+#   escritura de otro worker se ve en la siguiente llamada
+#
+# ===========================================================================
+
+"""
+Decorador de AlumnoRepository con cache LRU + TTL.
+
+Cachea obtener_por_id, obtener_por_dni y listar_todos e invalida en
+cada escritura.
+"""
+
+# Configuracion de path para pruebas atomicas
+import sys
+from pathlib import Path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import time
+from collections import OrderedDict
+from datetime import datetime
+from threading import Lock
+from typing import Callable, Dict, Iterable, Optional, List, Set, Tuple
+
+from domain.entities.alumno import Alumno
+from domain.repositories.alumno_repository import AlumnoRepository
+
+
+class CachedAlumnoRepository(AlumnoRepository):
+    """
+    Repositorio que agrega cache de lectura a otro repositorio.
+    
+    Claves del cache:
+    - ('id', <id>)
+    - ('dni', <dni normalizado>)
+    - listar_todos() aparte, en _listado, junto con la version de la tabla
+    
+    Metricas:
+    - hits: lecturas resueltas por el cache
+    - misses: lecturas que fueron al repositorio
+    - evictions: entradas descartadas por tamano o por vencimiento
+    
+    Patron: Decorator
+    """
+    
+    def __init__(
+        self,
+        repository: AlumnoRepository,
+        max_size: int = 1024,
+        ttl_seconds: float = 60.0,
+        reloj: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa el cache.
+        
+        Args:
+            repository: Repositorio real al que se delegan las operaciones
+            max_size: Cantidad maxima de entradas en cache
+            ttl_seconds: Segundos de vida de cada entrada
+            reloj: Fuente de tiempo (inyectable para tests)
+        """
+        self._repository = repository
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._reloj = reloj
+        
+        # clave -> (alumno, vence_en)
+        self._cache: 'OrderedDict[tuple, Tuple[Alumno, float]]' = OrderedDict()
+        self._lock = Lock()
+        
+        # (version de la tabla, resultado de listar_todos) o None
+        self._listado: Optional[Tuple[int, List[Alumno]]] = None
+        
+        # Se incrementa en cada invalidacion. Una lectura que empezo antes
+        # de una escritura no puede guardar su resultado (quedaria viejo).
+        self._generacion = 0
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    # =========================================================================
+    # LECTURAS CACHEADAS
+    # =========================================================================
+    
+    def obtener_por_id(self, id: str) -> Optional[Alumno]:
+        """Busca por ID, primero en cache."""
+        alumno, generacion = self._get(('id', id))
+        
+        if alumno is not None:
+            return alumno
+        
+        alumno = self._repository.obtener_por_id(id)
+        if alumno is not None:
+            self._put(alumno, generacion)
+        return alumno
+    
+    def obtener_por_dni(self, dni: str) -> Optional[Alumno]:
+        """Busca por DNI, primero en cache."""
+        alumno, generacion = self._get(('dni', _normalizar_dni(dni)))
+        
+        if alumno is not None:
+            return alumno
+        
+        alumno = self._repository.obtener_por_dni(dni)
+        if alumno is not None:
+            self._put(alumno, generacion)
+        return alumno
+    
+    def obtener_por_dni_many(self, dnis: Iterable[str]) -> Dict[str, Alumno]:
+        """Resuelve desde cache lo que pueda y busca el resto de una vez."""
+        encontrados = {}
+        faltantes = []
+        generacion = None
+        
+        for dni in {_normalizar_dni(d) for d in dnis}:
+            alumno, gen = self._get(('dni', dni))
+            if generacion is None:
+                generacion = gen
+            if alumno is not None:
+                encontrados[dni] = alumno
+            else:
+                faltantes.append(dni)
+        
+        if faltantes:
+            for dni, alumno in self._repository.obtener_por_dni_many(faltantes).items():
+                encontrados[dni] = alumno
+                self._put(alumno, generacion)
+        
+        return encontrados
+    
+    def listar_todos(self, version: Optional[int] = None) -> List[Alumno]:
+        """
+        Lista todos los alumnos, revalidando el cache con la version.
+        
+        POR QUE LA VERSION SE LEE ANTES QUE EL LISTADO:
+        - Si otra escritura entra entre las dos lecturas, el listado queda
+          guardado con la version anterior y la proxima llamada lo descarta
+        - Al reves, un listado viejo podria quedar con la version nueva
+        
+        Si la base no lleva version (None) no se cachea: no habria forma
+        de enterarse de las escrituras de otros procesos.
+        
+        Args:
+            version: La que ya leyo quien llama (la ruta, para el ETag).
+                POR QUE: evita leer table_versions dos veces por request
+        """
+        if version is None:
+            version = self._repository.obtener_version()
+        
+        with self._lock:
+            generacion = self._generacion
+            if version is not None and self._listado is not None and self._listado[0] == version:
+                self.hits += 1
+                return list(self._listado[1])
+            self.misses += 1
+        
+        alumnos = self._repository.listar_todos()
+        
+        if version is not None:
+            with self._lock:
+                if generacion == self._generacion:
+                    self._listado = (version, alumnos)
+        
+        return list(alumnos)
+    
+    # =========================================================================
+    # ESCRITURAS (Invalidan)
+    # =========================================================================
+    #
+    # POR QUE INVALIDAR DESPUES DE ESCRIBIR (y en finally):
+    # - Una lectura que empieza mientras la escritura esta en curso todavia
+    #   ve la fila vieja; si la invalidacion ya hubiera pasado, guardaria esa
+    #   fila con la generacion nueva y se serviria hasta el TTL
+    # - Invalidando al final, esa lectura queda con una generacion vieja y
+    #   _put() la descarta
+    # - Si la escritura falla igual se invalida: no se sabe si llego a la BD
+    
+    def crear(self, alumno: Alumno) -> Alumno:
+        """Crea en el repositorio e invalida el DNI."""
+        try:
+            return self._repository.crear(alumno)
+        finally:
+            self._invalidar(dni=alumno.dni)
+    
+    def crear_lote(self, alumnos: List[Alumno]) -> List[Alumno]:
+        """Crea en el repositorio e invalida todos los DNI del lote."""
+        try:
+            return self._repository.crear_lote(alumnos)
+        finally:
+            self._invalidar_dnis([alumno.dni for alumno in alumnos])
+    
+    def actualizar(
+        self,
+        alumno: Alumno,
+        updated_at_esperado: Optional[datetime] = None
+    ) -> Alumno:
+        """Actualiza en el repositorio e invalida el ID y ambos DNI."""
+        try:
+            return self._repository.actualizar(alumno, updated_at_esperado)
+        finally:
+            self._invalidar(id=alumno.id, dni=alumno.dni)
+    
+    def eliminar(self, id: str) -> bool:
+        """Elimina en el repositorio e invalida el ID y su DNI."""
+        try:
+            return self._repository.eliminar(id)
+        finally:
+            self._invalidar(id=id)
+    
+    # =========================================================================
+    # OPERACIONES SIN CACHE (Delegan)
+    # =========================================================================
+    
+    def listar_pagina(
+        self,
+        limite: int,
+        despues_de: Optional[Tuple[str, str, str]] = None
+    ) -> List[Alumno]:
+        """Delega al repositorio real."""
+        return self._repository.listar_pagina(limite, despues_de)
+    
+    def listar_filas(
+        self,
+        campos: List[str],
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[str, str, str]] = None
+    ) -> List[dict]:
+        """Delega al repositorio real."""
+        return self._repository.listar_filas(campos, limite, despues_de)
+    
+    def obtener_fila_por_id(self, id: str, campos: List[str]) -> Optional[dict]:
+        """
+        Delega al repositorio real.
+        
+        POR QUE NO CACHEAR:
+        - El cache guarda entidades completas; una fila parcial no sirve
+          para obtener_por_id()
+        """
+        return self._repository.obtener_fila_por_id(id, campos)
+    
+    def buscar(self, texto: str, limite: int) -> List[Alumno]:
+        """Delega al repositorio real."""
+        return self._repository.buscar(texto, limite)
+    
+    def existe_dni(self, dni: str, excluir_id: Optional[str] = None) -> bool:
+        """
+        Delega al repositorio real.
+        
+        POR QUE NO CACHEAR:
+        - Se usa para validar unicidad antes de escribir
+        - Un resultado viejo permitiria un DNI duplicado
+        """
+        return self._repository.existe_dni(dni, excluir_id)
+    
+    def existe_dni_many(self, dnis: Iterable[str]) -> Set[str]:
+        """Delega al repositorio real (mismo motivo que existe_dni)."""
+        return self._repository.existe_dni_many(dnis)
+    
+    def obtener_firma(self) -> Tuple[int, Optional[datetime]]:
+        """
+        Delega al repositorio real.
+        
+        POR QUE NO CACHEAR: es lo que se consulta para saber si el
+        listado cambio; cacheado, el ETag quedaria viejo
+        """
+        return self._repository.obtener_firma()
+    
+    def obtener_version(self) -> Optional[int]:
+        """Delega al repositorio real (mismo motivo que obtener_firma)."""
+        return self._repository.obtener_version()
+    
+    # =========================================================================
+    # METRICAS
+    # =========================================================================
+    
+    def estadisticas(self) -> dict:
+        """
+        Retorna las metricas del cache.
+        
+        Returns:
+            Diccionario con hits, misses, evictions, size y hit_rate
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._cache),
+                'hit_rate': self.hits / total if total else 0.0
+            }
+    
+    def limpiar(self) -> None:
+        """Vacia el cache (no resetea las metricas)."""
+        with self._lock:
+            self._cache.clear()
+            self._listado = None
+    
+    def cerrar(self) -> None:
+        """Vacia el cache y cierra el repositorio real (si tiene cerrar())."""
+        self.limpiar()
+        cerrar = getattr(self._repository, 'cerrar', None)
+        if cerrar is not None:
+            cerrar()
+    
+    # =========================================================================
+    # METODOS PRIVADOS
+    # =========================================================================
+    
+    def _get(self, clave: tuple) -> Tuple[Optional[Alumno], int]:
+        """
+        Lee una entrada vigente y la marca como usada recientemente.
+        
+        Returns:
+            Tupla (alumno o None, generacion actual del cache)
+        """
+        with self._lock:
+            entrada = self._cache.get(clave)
+            
+            if entrada is None:
+                self.misses += 1
+                return None, self._generacion
+            
+            alumno, vence_en = entrada
+            if self._reloj() >= vence_en:
+                del self._cache[clave]
+                self.evictions += 1
+                self.misses += 1
+                return None, self._generacion
+            
+            self._cache.move_to_end(clave)
+            self.hits += 1
+            return alumno, self._generacion
+    
+    def _put(self, alumno: Alumno, generacion: int) -> None:
+        """
+        Guarda el alumno bajo su ID y su DNI.
+        
+        Si hubo una invalidacion desde que empezo la lectura, no se guarda:
+        el alumno leido podria ser anterior a esa escritura.
+        """
+        vence_en = self._reloj() + self._ttl
+        
+        with self._lock:
+            if generacion != self._generacion:
+                return
+            
+            for clave in (('id', alumno.id), ('dni', _normalizar_dni(alumno.dni))):
+                self._cache[clave] = (alumno, vence_en)
+                self._cache.move_to_end(clave)
+            
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+    
+    def _invalidar(self, id: Optional[str] = None, dni: Optional[str] = None) -> None:
+        """
+        Descarta las entradas de un ID y/o DNI.
+        
+        Si el ID estaba cacheado, tambien se descarta el DNI que tenia
+        (al actualizar, el DNI viejo no debe seguir apuntando al alumno).
+        """
+        with self._lock:
+            self._generacion += 1
+            self._listado = None
+            
+            if id is not None:
+                entrada = self._cache.pop(('id', id), None)
+                if entrada is not None:
+                    self._cache.pop(('dni', _normalizar_dni(entrada[0].dni)), None)
+            
+            if dni is not None:
+                entrada = self._cache.pop(('dni', _normalizar_dni(dni)), None)
+                if entrada is not None:
+                    self._cache.pop(('id', entrada[0].id), None)
+    
+    def _invalidar_dnis(self, dnis: List[str]) -> None:
+        """Descarta varios DNI tomando el lock una sola vez."""
+        with self._lock:
+            self._generacion += 1
+            self._listado = None
+            
+            for dni in dnis:
+                entrada = self._cache.pop(('dni', _normalizar_dni(dni)), None)
+                if entrada is not None:
+                    self._cache.pop(('id', entrada[0].id), None)
+
+
+def _normalizar_dni(dni: str) -> str:
+    """Normaliza el DNI igual que la entidad Alumno."""
+    return dni.strip().upper()
+
+
+# ===========================================================================
+# PRUEBA ATOMICA
+# ===========================================================================
+if __name__ == "__main__":
+    print("=== Prueba de CachedAlumnoRepository (con Mock) ===\n")
+    
+    from domain.repositories.alumno_repository import MockAlumnoRepository
+    
+    repo = CachedAlumnoRepository(MockAlumnoRepository(), max_size=10, ttl_seconds=30)
+    
+    # Test 1: Miss y luego hit
+    creado = repo.crear(Alumno(nombre="Juan", apellido="Perez", dni="11111111"))
+    repo.obtener_por_id(creado.id)
+    repo.obtener_por_id(creado.id)
+    print(f"[OK] Miss + hit: {repo.estadisticas()}")
+    
+    # Test 2: Hit por DNI (cargado junto con el ID)
+    repo.obtener_por_dni("11111111")
+    print(f"[OK] Hit por DNI: {repo.estadisticas()}")
+    
+    # Test 3: Actualizar invalida
+    repo.actualizar(creado.actualizar(nombre="Juan Carlos"))
+    print(f"[OK] Despues de actualizar: {repo.obtener_por_id(creado.id)}")
+    
+    print("\n=== Todas las pruebas pasaron ===")
@@ -25,15 +25,20 @@ Carga y valida todas las variables de entorno necesarias.
 # Configuracion de path para pruebas atomicas
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import os
-from dotenv import load_dotenv
 
 # Cargar variables de entorno desde .env
 # POR QUE AL INICIO: Garantiza que las variables esten disponibles
 # antes de que cualquier otro modulo las necesite
-load_dotenv()
+# POR QUE SOLO SI EXISTE: en Vercel/Docker no hay .env y no hace falta
+# importar python-dotenv
+_ARCHIVO_ENV = Path(__file__).resolve().parent.parent / '.env'
+if _ARCHIVO_ENV.exists():
+    from dotenv import load_dotenv
+    load_dotenv(_ARCHIVO_ENV)
 
 
 class Config:
@@ -54,6 +59,26 @@ class Config:
         FLASK_SECRET_KEY: Clave secreta de Flask
         PORT: Puerto del servidor
         SESSION_TIMEOUT_SECONDS: Timeout de inactividad
+        ALUMNO_CACHE_ENABLED: Activa el cache de lecturas por ID/DNI y del listado
+        ALUMNO_CACHE_MAX_SIZE: Entradas maximas del cache
+        ALUMNO_CACHE_TTL_SECONDS: Segundos de vida de cada entrada
+        JWT_CACHE_MAX_SIZE: Tokens verificados en cache (0 = desactivado)
+        SUPABASE_JWKS_URL: Archivo o URL del JWKS para RS256/ES256 (opcional)
+        JWKS_REFRESH_SECONDS: Segundos entre refrescos del JWKS
+        ALUMNO_REPOSITORY: Backend de datos ('supabase', 'sqlite' o 'postgres')
+        SQLITE_PATH: Archivo de la base SQLite (backend 'sqlite')
+        DATABASE_URL: Conexion directa a PostgreSQL (backend 'postgres')
+        PG_POOL_MIN_SIZE: Conexiones minimas del pool (backend 'postgres')
+        PG_POOL_MAX_SIZE: Conexiones maximas del pool (backend 'postgres')
+        SUPABASE_HTTP_MAX_CONNECTIONS: Conexiones HTTP simultaneas a Supabase
+        SUPABASE_HTTP_MAX_KEEPALIVE: Conexiones ociosas que se reutilizan
+        SUPABASE_HTTP_KEEPALIVE_SECONDS: Vida de una conexion ociosa
+        SUPABASE_HTTP2: Usa HTTP/2 con Supabase
+        SUPABASE_HTTP_CONNECT_TIMEOUT: Segundos maximos para conectar
+        SUPABASE_HTTP_READ_TIMEOUT: Segundos maximos esperando respuesta
+        SUPABASE_HTTP_RETRIES: Reintentos de lecturas idempotentes
+        SUPABASE_HTTP_RETRY_BACKOFF: Espera inicial entre reintentos
+        PREWARM_ON_START: Precalienta cliente, servicio y JWT al crear la app
     """
     
     def __init__(self):
@@ -63,19 +88,65 @@ class Config:
         Raises:
             EnvironmentError: Si falta alguna variable requerida
         """
-        # Supabase (requeridas)
-        self.SUPABASE_URL = self._get_required('SUPABASE_URL')
-        self.SUPABASE_KEY = self._get_required('SUPABASE_KEY')
+        # Backend de datos
+        # POR QUE SQLITE: sedes sin conexion confiable usan un archivo local
+        # POR QUE POSTGRES: evita el salto HTTP de PostgREST en cada consulta
+        self.ALUMNO_REPOSITORY = os.getenv('ALUMNO_REPOSITORY', 'supabase').lower()
+        self.SQLITE_PATH = os.getenv('SQLITE_PATH', 'data/alumnos.db')
+        
+        if self.ALUMNO_REPOSITORY not in ('supabase', 'sqlite', 'postgres'):
+            raise EnvironmentError(
+                f"ALUMNO_REPOSITORY invalido: '{self.ALUMNO_REPOSITORY}' "
+                f"(valores posibles: supabase, sqlite, postgres)"
+            )
+        
+        if self.ALUMNO_REPOSITORY == 'postgres':
+            self.DATABASE_URL = self._get_required('DATABASE_URL')
+        else:
+            self.DATABASE_URL = os.getenv('DATABASE_URL', '')
+        self.PG_POOL_MIN_SIZE = int(os.getenv('PG_POOL_MIN_SIZE', '1'))
+        self.PG_POOL_MAX_SIZE = int(os.getenv('PG_POOL_MAX_SIZE', '10'))
+        
+        # Supabase (requeridas salvo con backend sqlite; el secreto JWT siempre)
+        if self.ALUMNO_REPOSITORY == 'supabase':
+            self.SUPABASE_URL = self._get_required('SUPABASE_URL')
+            self.SUPABASE_KEY = self._get_required('SUPABASE_KEY')
+        else:
+            self.SUPABASE_URL = os.getenv('SUPABASE_URL', '')
+            self.SUPABASE_KEY = os.getenv('SUPABASE_KEY', '')
         self.SUPABASE_JWT_SECRET = self._get_required('SUPABASE_JWT_SECRET')
         
+        # Transporte HTTP hacia Supabase (pool, keep-alive, timeouts)
+        self.SUPABASE_HTTP_MAX_CONNECTIONS = int(os.getenv('SUPABASE_HTTP_MAX_CONNECTIONS', '20'))
+        self.SUPABASE_HTTP_MAX_KEEPALIVE = int(os.getenv('SUPABASE_HTTP_MAX_KEEPALIVE', '10'))
+        self.SUPABASE_HTTP_KEEPALIVE_SECONDS = float(os.getenv('SUPABASE_HTTP_KEEPALIVE_SECONDS', '30'))
+        self.SUPABASE_HTTP2 = os.getenv('SUPABASE_HTTP2', '1') == '1'
+        self.SUPABASE_HTTP_CONNECT_TIMEOUT = float(os.getenv('SUPABASE_HTTP_CONNECT_TIMEOUT', '5'))
+        self.SUPABASE_HTTP_READ_TIMEOUT = float(os.getenv('SUPABASE_HTTP_READ_TIMEOUT', '30'))
+        self.SUPABASE_HTTP_RETRIES = int(os.getenv('SUPABASE_HTTP_RETRIES', '2'))
+        self.SUPABASE_HTTP_RETRY_BACKOFF = float(os.getenv('SUPABASE_HTTP_RETRY_BACKOFF', '0.1'))
+        
         # Flask (con defaults)
         self.FLASK_ENV = os.getenv('FLASK_ENV', 'development')
         self.FLASK_DEBUG = os.getenv('FLASK_DEBUG', '0') == '1'
         self.FLASK_SECRET_KEY = os.getenv('FLASK_SECRET_KEY', 'dev-secret-key')
         self.PORT = int(os.getenv('PORT', '5000'))
+        self.PREWARM_ON_START = os.getenv('PREWARM_ON_START', '0') == '1'
         
         # Seguridad
         self.SESSION_TIMEOUT_SECONDS = int(os.getenv('SESSION_TIMEOUT_SECONDS', '900'))
+        
+        # Cache de lecturas (opcional)
+        self.ALUMNO_CACHE_ENABLED = os.getenv('ALUMNO_CACHE_ENABLED', '0') == '1'
+        self.ALUMNO_CACHE_MAX_SIZE = int(os.getenv('ALUMNO_CACHE_MAX_SIZE', '1024'))
+        self.ALUMNO_CACHE_TTL_SECONDS = float(os.getenv('ALUMNO_CACHE_TTL_SECONDS', '60'))
+        
+        # Cache de tokens JWT verificados
+        self.JWT_CACHE_MAX_SIZE = int(os.getenv('JWT_CACHE_MAX_SIZE', '1024'))
+        
+        # Claves asimetricas (opcional)
+        self.SUPABASE_JWKS_URL = os.getenv('SUPABASE_JWKS_URL', '')
+        self.JWKS_REFRESH_SECONDS = float(os.getenv('JWKS_REFRESH_SECONDS', '600'))
     
     def _get_required(self, key: str) -> str:
         """
@@ -123,7 +194,27 @@ class Config:
             'FLASK_ENV': self.FLASK_ENV,
             'FLASK_DEBUG': self.FLASK_DEBUG,
             'PORT': self.PORT,
-            'SESSION_TIMEOUT_SECONDS': self.SESSION_TIMEOUT_SECONDS
+            'PREWARM_ON_START': self.PREWARM_ON_START,
+            'SESSION_TIMEOUT_SECONDS': self.SESSION_TIMEOUT_SECONDS,
+            'ALUMNO_CACHE_ENABLED': self.ALUMNO_CACHE_ENABLED,
+            'ALUMNO_CACHE_MAX_SIZE': self.ALUMNO_CACHE_MAX_SIZE,
+            'ALUMNO_CACHE_TTL_SECONDS': self.ALUMNO_CACHE_TTL_SECONDS,
+            'JWT_CACHE_MAX_SIZE': self.JWT_CACHE_MAX_SIZE,
+            'SUPABASE_JWKS_URL': self.SUPABASE_JWKS_URL,
+            'JWKS_REFRESH_SECONDS': self.JWKS_REFRESH_SECONDS,
+            'ALUMNO_REPOSITORY': self.ALUMNO_REPOSITORY,
+            'SQLITE_PATH': self.SQLITE_PATH,
+            'DATABASE_URL': '(configurada)' if self.DATABASE_URL else '',
+            'PG_POOL_MIN_SIZE': self.PG_POOL_MIN_SIZE,
+            'PG_POOL_MAX_SIZE': self.PG_POOL_MAX_SIZE,
+            'SUPABASE_HTTP_MAX_CONNECTIONS': self.SUPABASE_HTTP_MAX_CONNECTIONS,
+            'SUPABASE_HTTP_MAX_KEEPALIVE': self.SUPABASE_HTTP_MAX_KEEPALIVE,
+            'SUPABASE_HTTP_KEEPALIVE_SECONDS': self.SUPABASE_HTTP_KEEPALIVE_SECONDS,
+            'SUPABASE_HTTP2': self.SUPABASE_HTTP2,
+            'SUPABASE_HTTP_CONNECT_TIMEOUT': self.SUPABASE_HTTP_CONNECT_TIMEOUT,
+            'SUPABASE_HTTP_READ_TIMEOUT': self.SUPABASE_HTTP_READ_TIMEOUT,
+            'SUPABASE_HTTP_RETRIES': self.SUPABASE_HTTP_RETRIES,
+            'SUPABASE_HTTP_RETRY_BACKOFF': self.SUPABASE_HTTP_RETRY_BACKOFF
         }
 
 
@@ -0,0 +1,233 @@
+# ===========================================================================
+# Transporte HTTP del Cliente Supabase
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: Infrastructure
+# Patron: Decorator (sobre el transporte de httpx)
+# ===========================================================================
+#
+# POR QUE UN TRANSPORTE PROPIO:
+# - supabase-py crea por defecto un httpx.Client sin limites de pool ni
+#   timeouts de conexion: bajo rafagas abre y cierra conexiones, y cada
+#   conexion nueva paga un handshake TLS
+# - Con un pool acotado y keep-alive, las conexiones se reutilizan entre
+#   requests y la latencia p99 se mantiene estable
+# - HTTP/2 multiplexa varios requests sobre una misma conexion
+#
+# POR QUE REINTENTAR SOLO LECTURAS:
+# - GET/HEAD son idempotentes: repetirlos no cambia datos
+# - Un POST/PATCH/DELETE que fallo a mitad de camino pudo haberse
+#   aplicado; reintentarlo podria duplicar un alta
+# - Los errores de conexion (nada se envio) los reintenta httpx para
+#   cualquier metodo (HTTPTransport(retries=...))
+#
+# ===========================================================================
+
+"""
+Cliente httpx con pool configurable y reintentos con backoff.
+"""
+
+# Configuracion de path para pruebas atomicas
+import sys
+from pathlib import Path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import time
+from threading import Lock
+from typing import Callable
+
+import httpx
+
+
+# Metodos que se pueden repetir sin efectos secundarios
+METODOS_IDEMPOTENTES = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+# Respuestas transitorias del gateway/PostgREST que vale la pena reintentar
+CODIGOS_REINTENTABLES = frozenset({502, 503, 504})
+
+# Errores transitorios despues de conectar (los de conexion ya los
+# reintenta el pool de httpx)
+ERRORES_REINTENTABLES = (
+    httpx.ReadTimeout,
+    httpx.RemoteProtocolError,
+    httpx.PoolTimeout
+)
+
+
+class RetryTransport(httpx.BaseTransport):
+    """
+    Transporte que reintenta lecturas idempotentes con backoff exponencial.
+    
+    Envuelve a un httpx.HTTPTransport (que es quien tiene el pool) y
+    cuenta requests y reintentos para el health check.
+    
+    Patron: Decorator
+    """
+    
+    def __init__(
+        self,
+        transporte: httpx.BaseTransport,
+        reintentos: int = 2,
+        backoff: float = 0.1,
+        backoff_maximo: float = 2.0,
+        dormir: Callable[[float], None] = time.sleep
+    ):
+        """
+        Inicializa el transporte.
+        
+        Args:
+            transporte: Transporte real (normalmente httpx.HTTPTransport)
+            reintentos: Reintentos maximos por request idempotente
+            backoff: Espera inicial en segundos (se duplica en cada reintento)
+            backoff_maximo: Tope de espera entre reintentos
+            dormir: Funcion de espera (inyectable en tests)
+        """
+        self._transporte = transporte
+        self._reintentos = max(0, reintentos)
+        self._backoff = backoff
+        self._backoff_maximo = backoff_maximo
+        self._dormir = dormir
+        self._lock = Lock()
+        self._requests = 0
+        self._reintentos_hechos = 0
+        self._fallidos = 0
+    
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Envia el request, reintentando si es idempotente y fallo transitoriamente."""
+        self._contar('_requests')
+        
+        intentos = self._reintentos if request.method in METODOS_IDEMPOTENTES else 0
+        
+        for intento in range(intentos + 1):
+            ultimo = intento == intentos
+            
+            try:
+                response = self._transporte.handle_request(request)
+            except ERRORES_REINTENTABLES:
+                if ultimo:
+                    self._contar('_fallidos')
+                    raise
+            else:
+                if ultimo or response.status_code not in CODIGOS_REINTENTABLES:
+                    return response
+                # Liberar la conexion antes de volver a pedir
+                response.close()
+            
+            self._contar('_reintentos_hechos')
+            self._dormir(min(self._backoff * (2 ** intento), self._backoff_maximo))
+    
+    def close(self) -> None:
+        """Cierra el transporte y sus conexiones."""
+        self._transporte.close()
+    
+    def estadisticas(self) -> dict:
+        """
+        Retorna contadores de uso y el estado del pool de conexiones.
+        
+        Returns:
+            Diccionario con requests, reintentos, fallidos y conexiones
+            (abiertas, ociosas, en uso)
+        """
+        with self._lock:
+            stats = {
+                'requests': self._requests,
+                'reintentos': self._reintentos_hechos,
+                'fallidos': self._fallidos
+            }
+        
+        pool = getattr(self._transporte, '_pool', None)
+        conexiones = list(getattr(pool, 'connections', []))
+        ociosas = sum(1 for c in conexiones if c.is_idle())
+        
+        stats['conexiones'] = {
+            'abiertas': len(conexiones),
+            'ociosas': ociosas,
+            'en_uso': len(conexiones) - ociosas
+        }
+        return stats
+    
+    def _contar(self, contador: str) -> None:
+        """Incrementa un contador bajo el lock."""
+        with self._lock:
+            setattr(self, contador, getattr(self, contador) + 1)
+
+
+def crear_transporte(
+    max_conexiones: int = 20,
+    max_keepalive: int = 10,
+    keepalive_segundos: float = 30.0,
+    http2: bool = True,
+    reintentos: int = 2,
+    backoff: float = 0.1
+) -> RetryTransport:
+    """
+    Crea el transporte con pool acotado, keep-alive y reintentos.
+    
+    Args:
+        max_conexiones: Conexiones simultaneas maximas del pool
+        max_keepalive: Conexiones ociosas que se mantienen abiertas
+        keepalive_segundos: Tiempo que una conexion ociosa sigue abierta
+        http2: Negociar HTTP/2 (requiere el paquete h2)
+        reintentos: Reintentos de lecturas idempotentes (y de conexion)
+        backoff: Espera inicial entre reintentos
+    
+    Returns:
+        RetryTransport sobre un httpx.HTTPTransport
+    """
+    transporte = httpx.HTTPTransport(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_conexiones,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_segundos
+        ),
+        retries=reintentos
+    )
+    return RetryTransport(transporte, reintentos=reintentos, backoff=backoff)
+
+
+def crear_http_client(
+    transporte: httpx.BaseTransport,
+    timeout_conexion: float = 5.0,
+    timeout_lectura: float = 30.0
+) -> httpx.Client:
+    """
+    Crea el httpx.Client que usa supabase-py (PostgREST, Storage, Functions).
+    
+    Args:
+        transporte: Transporte a usar (normalmente de crear_transporte())
+        timeout_conexion: Segundos maximos para conectar (incluye TLS)
+        timeout_lectura: Segundos maximos esperando la respuesta
+    
+    Returns:
+        Cliente httpx configurado
+    """
+    return httpx.Client(
+        transport=transporte,
+        timeout=httpx.Timeout(timeout_lectura, connect=timeout_conexion),
+        follow_redirects=True
+    )
+
+
+# ===========================================================================
+# PRUEBA ATOMICA
+# ===========================================================================
+if __name__ == "__main__":
+    print("=== Prueba de Transporte HTTP ===\n")
+    
+    respuestas = iter([503, 503, 200])
+    
+    def responder(request):
+        return httpx.Response(next(respuestas), json={'ok': True})
+    
+    transporte = RetryTransport(
+        httpx.MockTransport(responder), reintentos=2, dormir=lambda s: None
+    )
+    client = httpx.Client(transport=transporte)
+    
+    response = client.get('https://ejemplo.supabase.co/rest/v1/alumnos')
+    print(f"[OK] Status final tras reintentos: {response.status_code}")
+    print(f"[OK] Estadisticas: {transporte.estadisticas()}")
+    
+    print("\n=== Prueba pasada ===")
@@ -0,0 +1,209 @@
+# ===========================================================================
+# Almacen de Claves Publicas (JWKS)
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: Infrastructure
+# Patron: Cache en memoria con refresco en segundo plano
+# ===========================================================================
+#
+# POR QUE UN ALMACEN DE CLAVES:
+# - Supabase puede firmar los JWT con claves asimetricas (RS256/ES256)
+# - Las claves publicas se publican como documento JWKS
+# - Cada token indica en su header ('kid') con que clave se firmo
+#
+# REGLA DE RENDIMIENTO:
+# - Verificar un token NUNCA descarga claves
+# - El JWKS se carga al iniciar y un thread lo refresca cada N segundos
+# - Si un refresco falla, se siguen usando las claves anteriores
+#
+# ===========================================================================
+
+"""
+Almacen en memoria de claves publicas JWKS, indexadas por 'kid'.
+
+Carga el JWKS desde un archivo local o una URL y lo refresca en
+segundo plano.
+"""
+
+# Configuracion de path para pruebas atomicas
+import sys
+from pathlib import Path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import json
+import time
+import urllib.request
+from threading import Event, Lock, Thread
+from typing import Dict, Optional
+
+import jwt
+
+
+class JWKSKeyStore:
+    """
+    Claves publicas de un JWKS, listas para verificar JWT.
+    
+    Responsabilidades:
+    - Leer el JWKS (archivo o URL http/https)
+    - Parsear cada clave una sola vez y guardarla por 'kid'
+    - Refrescarlo periodicamente sin bloquear los requests
+    
+    Patron: Cache en memoria + refresco en segundo plano
+    """
+    
+    # Algoritmos asimetricos aceptados
+    ALGORITMOS = ('RS256', 'ES256')
+    
+    def __init__(
+        self,
+        fuente: str,
+        intervalo_refresco: float = 600.0,
+        timeout: float = 5.0
+    ):
+        """
+        Inicializa el almacen (no carga nada todavia).
+        
+        Args:
+            fuente: Ruta a un archivo JWKS o URL http(s)
+            intervalo_refresco: Segundos entre refrescos en segundo plano
+            timeout: Segundos maximos para descargar el JWKS
+        """
+        self._fuente = fuente
+        self._intervalo = intervalo_refresco
+        self._timeout = timeout
+        
+        self._claves: Dict[str, jwt.PyJWK] = {}
+        self._lock = Lock()
+        self._detener = Event()
+        self._thread: Optional[Thread] = None
+        
+        self.ultima_carga: Optional[float] = None
+        self.ultimo_error: Optional[str] = None
+    
+    def get_key(self, kid: Optional[str]) -> Optional[jwt.PyJWK]:
+        """
+        Retorna la clave publica de un 'kid'.
+        
+        POR QUE NO DESCARGAR SI FALTA:
+        - Un 'kid' inventado en un token forzaria una descarga por request
+        - Una clave nueva se conoce en el proximo refresco
+        
+        Args:
+            kid: Identificador de clave del header del JWT
+        
+        Returns:
+            PyJWK de la clave, o None si no se conoce
+        """
+        with self._lock:
+            return self._claves.get(kid)
+    
+    def cargar(self) -> int:
+        """
+        Lee y parsea el JWKS, reemplazando las claves actuales.
+        
+        Solo se guardan claves con 'kid' y de algoritmos en ALGORITMOS.
+        
+        Returns:
+            Cantidad de claves cargadas
+        
+        Raises:
+            Exception: Si no se pudo leer o parsear el documento
+                (las claves anteriores se conservan)
+        """
+        documento = self._leer_documento()
+        claves = {}
+        
+        for jwk in documento.get('keys', []):
+            if not jwk.get('kid'):
+                continue
+            try:
+                clave = jwt.PyJWK.from_dict(jwk)
+            except jwt.PyJWKError:
+                continue
+            if clave.algorithm_name in self.ALGORITMOS:
+                claves[jwk['kid']] = clave
+        
+        with self._lock:
+            self._claves = claves
+        
+        self.ultima_carga = time.time()
+        self.ultimo_error = None
+        return len(claves)
+    
+    def iniciar_refresco(self) -> None:
+        """
+        Arranca el thread que recarga el JWKS cada intervalo_refresco.
+        
+        POR QUE DAEMON:
+        - No impide que el proceso termine
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        
+        self._detener.clear()
+        self._thread = Thread(target=self._bucle_refresco, name='jwks-refresh', daemon=True)
+        self._thread.start()
+    
+    def detener_refresco(self) -> None:
+        """Detiene el thread de refresco (tests y apagado)."""
+        self._detener.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._timeout + 1)
+            self._thread = None
+    
+    def despues_de_fork(self) -> None:
+        """
+        Rearma el almacen en el proceso hijo de un fork.
+        
+        POR QUE:
+        - El thread de refresco no sobrevive al fork: hay que relanzarlo
+        - Si ese thread tenia tomado el lock al hacer fork, en el hijo
+          quedaria tomado para siempre
+        - Las claves ya cargadas se conservan (son datos inmutables)
+        """
+        refrescaba = self._thread is not None
+        
+        self._lock = Lock()
+        self._detener = Event()
+        self._thread = None
+        
+        if refrescaba:
+            self.iniciar_refresco()
+    
+    # =========================================================================
+    # METODOS PRIVADOS
+    # =========================================================================
+    
+    def _bucle_refresco(self) -> None:
+        """Recarga hasta que se pida detener; los errores no cortan el bucle."""
+        while not self._detener.wait(self._intervalo):
+            try:
+                self.cargar()
+            except Exception as e:
+                self.ultimo_error = str(e)
+    
+    def _leer_documento(self) -> dict:
+        """Lee el JWKS desde la URL o el archivo configurado."""
+        if self._fuente.startswith(('http://', 'https://')):
+            with urllib.request.urlopen(self._fuente, timeout=self._timeout) as respuesta:
+                return json.loads(respuesta.read().decode('utf-8'))
+        
+        return json.loads(Path(self._fuente).read_text(encoding='utf-8'))
+
+
+# ===========================================================================
+# PRUEBA ATOMICA
+# ===========================================================================
+if __name__ == "__main__":
+    print("=== Prueba de JWKSKeyStore ===\n")
+    
+    if len(sys.argv) < 2:
+        print("Uso: python infrastructure/jwks_key_store.py <archivo o URL JWKS>")
+    else:
+        store = JWKSKeyStore(sys.argv[1])
+        try:
+            cantidad = store.cargar()
+            print(f"[OK] Claves cargadas: {cantidad}")
+        except Exception as e:
+            print(f"[ERROR] {e}")
@@ -0,0 +1,539 @@
+# ===========================================================================
+# Repositorio SQLite de Alumnos
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: Infrastructure
+# Patron: Repository (Implementacion)
+# ===========================================================================
+#
+# POR QUE UN REPOSITORIO SQLITE:
+# - Algunas sedes no tienen conexion confiable a Supabase
+# - Un archivo local no necesita red ni servidor de BD
+# - Sirve como motor local rapido para benchmarks
+#
+# DECISIONES DE RENDIMIENTO:
+# - WAL: los lectores no se bloquean mientras alguien escribe
+# - Una conexion por thread (sqlite3 no comparte conexiones entre threads)
+# - SQL con parametros "?" constantes: sqlite3 reutiliza la sentencia
+#   preparada de su cache por conexion
+# - executemany() para los caminos masivos (crear_lote)
+#
+# ===========================================================================
+
+"""
+Implementacion del repositorio de Alumnos sobre un archivo SQLite.
+
+Usa el mismo esquema e indices que database/init.sql.
+"""
+
+# Configuracion de path para pruebas atomicas
+import sys
+from pathlib import Path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from domain.entities.alumno import Alumno
+from domain.entities.fechas import parsear_fecha
+from domain.repositories.alumno_repository import AlumnoRepository
+from domain.exceptions import (
+    AlumnoNoEncontrado,
+    DNIDuplicado,
+    ModificacionConcurrente,
+    RepositoryError
+)
+
+
+# Esquema equivalente a database/init.sql (secciones 2, 3 y 4)
+# POR QUE TEXT PARA FECHAS: SQLite no tiene TIMESTAMPTZ; se guarda ISO8601
+# en UTC, el mismo formato que devuelve Supabase
+ESQUEMA_SQL = """
+CREATE TABLE IF NOT EXISTS alumnos (
+    id TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL CHECK (LENGTH(TRIM(nombre)) > 0 AND LENGTH(nombre) <= 100),
+    apellido TEXT NOT NULL CHECK (LENGTH(TRIM(apellido)) > 0 AND LENGTH(apellido) <= 100),
+    dni TEXT NOT NULL UNIQUE CHECK (LENGTH(TRIM(dni)) > 0 AND LENGTH(dni) <= 20),
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_alumnos_apellido ON alumnos(apellido);
+CREATE INDEX IF NOT EXISTS idx_alumnos_apellido_nombre ON alumnos(apellido, nombre, id);
+CREATE INDEX IF NOT EXISTS idx_alumnos_apellido_lower ON alumnos(LOWER(apellido));
+CREATE INDEX IF NOT EXISTS idx_alumnos_updated_at ON alumnos(updated_at);
+
+CREATE TABLE IF NOT EXISTS table_versions (
+    tabla TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO table_versions (tabla, version) VALUES ('alumnos', 0);
+
+CREATE TRIGGER IF NOT EXISTS trigger_alumnos_version_insert AFTER INSERT ON alumnos
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE tabla = 'alumnos';
+END;
+CREATE TRIGGER IF NOT EXISTS trigger_alumnos_version_update AFTER UPDATE ON alumnos
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE tabla = 'alumnos';
+END;
+CREATE TRIGGER IF NOT EXISTS trigger_alumnos_version_delete AFTER DELETE ON alumnos
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE tabla = 'alumnos';
+END;
+"""
+
+COLUMNAS = 'id, nombre, apellido, dni, created_at, updated_at'
+
+# Limite de parametros por sentencia (SQLITE_MAX_VARIABLE_NUMBER viejo = 999)
+TAMANO_LOTE_IN = 500
+
+
+class SqliteAlumnoRepository(AlumnoRepository):
+    """
+    Implementacion del repositorio de Alumnos usando SQLite.
+    
+    Esta clase:
+    - Implementa la interface AlumnoRepository
+    - Abre una conexion por thread, todas al mismo archivo
+    - Asigna ID (UUID) y timestamps como lo haria PostgreSQL
+    
+    Patron: Repository
+    """
+    
+    def __init__(self, ruta: str):
+        """
+        Inicializa el repositorio y crea el esquema si no existe.
+        
+        Args:
+            ruta: Ruta al archivo SQLite (se crea si no existe)
+        """
+        self._ruta = ruta
+        self._local = threading.local()
+        self._conexiones: Dict[threading.Thread, sqlite3.Connection] = {}
+        self._lock = threading.Lock()
+        
+        Path(ruta).parent.mkdir(parents=True, exist_ok=True)
+        
+        # WAL queda guardado en el archivo: basta con activarlo una vez
+        conexion = self._conexion()
+        conexion.execute('PRAGMA journal_mode=WAL')
+        conexion.executescript(ESQUEMA_SQL)
+    
+    # =========================================================================
+    # METODOS CRUD (Implementacion de la interface)
+    # =========================================================================
+    
+    def crear(self, alumno: Alumno) -> Alumno:
+        """
+        Inserta un alumno; el UNIQUE(dni) detecta duplicados.
+        
+        Raises:
+            DNIDuplicado: Si el DNI ya existe
+            RepositoryError: Si hay error de BD
+        """
+        fila = _fila_nueva(alumno)
+        
+        try:
+            with self._conexion() as conexion:
+                conexion.execute(
+                    f'INSERT INTO alumnos ({COLUMNAS}) VALUES (?, ?, ?, ?, ?, ?)',
+                    fila
+                )
+            return _map_to_entity(fila)
+        
+        except sqlite3.IntegrityError as e:
+            if _es_violacion_unicidad(e):
+                raise DNIDuplicado(alumno.dni)
+            raise RepositoryError(f"Error al crear alumno: {e}")
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Error al crear alumno: {e}")
+    
+    def crear_lote(self, alumnos: List[Alumno]) -> List[Alumno]:
+        """
+        Inserta varios alumnos con executemany en una sola transaccion.
+        
+        POR QUE INSERT OR IGNORE + SELECT POR ID:
+        - ON CONFLICT DO NOTHING no corta el lote por un DNI repetido
+        - Los ID se generan aca, asi que basta con ver cuales quedaron
+        """
+        if not alumnos:
+            return []
+        
+        filas = [_fila_nueva(alumno) for alumno in alumnos]
+        
+        try:
+            with self._conexion() as conexion:
+                conexion.executemany(
+                    f'INSERT INTO alumnos ({COLUMNAS}) VALUES (?, ?, ?, ?, ?, ?) '
+                    'ON CONFLICT(dni) DO NOTHING',
+                    filas
+                )
+                insertados = set()
+                for lote in _lotes([fila[0] for fila in filas]):
+                    cursor = conexion.execute(
+                        f'SELECT id FROM alumnos WHERE id IN ({_marcas(lote)})',
+                        lote
+                    )
+                    insertados.update(id for (id,) in cursor)
+            
+            return [_map_to_entity(fila) for fila in filas if fila[0] in insertados]
+        
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Error al crear lote de alumnos: {e}")
+    
+    def obtener_por_id(self, id: str) -> Optional[Alumno]:
+        """Busca un alumno por su ID."""
+        fila = self._uno(f'SELECT {COLUMNAS} FROM alumnos WHERE id = ?', (id,))
+        return _map_to_entity(fila) if fila else None
+    
+    def obtener_por_dni(self, dni: str) -> Optional[Alumno]:
+        """Busca un alumno por su DNI."""
+        fila = self._uno(
+            f'SELECT {COLUMNAS} FROM alumnos WHERE dni = ?',
+            (dni.strip().upper(),)
+        )
+        return _map_to_entity(fila) if fila else None
+    
+    def obtener_por_dni_many(self, dnis: Iterable[str]) -> Dict[str, Alumno]:
+        """Busca varios DNIs con consultas IN por lotes."""
+        encontrados = {}
+        
+        for lote in _lotes(sorted({dni.strip().upper() for dni in dnis})):
+            for fila in self._todos(
+                f'SELECT {COLUMNAS} FROM alumnos WHERE dni IN ({_marcas(lote)})',
+                lote
+            ):
+                alumno = _map_to_entity(fila)
+                encontrados[alumno.dni] = alumno
+        
+        return encontrados
+    
+    def listar_todos(self, version: Optional[int] = None) -> List[Alumno]:
+        """Obtiene todos los alumnos ordenados por apellido."""
+        filas = self._todos(
+            f'SELECT {COLUMNAS} FROM alumnos ORDER BY apellido, nombre, id'
+        )
+        return [_map_to_entity(fila) for fila in filas]
+    
+    def listar_pagina(
+        self,
+        limite: int,
+        despues_de: Optional[Tuple[str, str, str]] = None
+    ) -> List[Alumno]:
+        """
+        Obtiene una pagina con paginacion keyset.
+        
+        SQLite (3.15+) compara tuplas directamente: (a, b, c) > (?, ?, ?)
+        usa el indice idx_alumnos_apellido_nombre.
+        """
+        filas = self._pagina(COLUMNAS, limite, despues_de)
+        return [_map_to_entity(fila) for fila in filas]
+    
+    def listar_filas(
+        self,
+        campos: List[str],
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[str, str, str]] = None
+    ) -> List[dict]:
+        """Obtiene filas con solo las columnas pedidas."""
+        filas = self._pagina(', '.join(campos), limite, despues_de)
+        return [dict(zip(campos, fila)) for fila in filas]
+    
+    def obtener_fila_por_id(self, id: str, campos: List[str]) -> Optional[dict]:
+        """Obtiene un alumno con solo las columnas pedidas."""
+        fila = self._uno(f'SELECT {", ".join(campos)} FROM alumnos WHERE id = ?', (id,))
+        return dict(zip(campos, fila)) if fila else None
+    
+    def buscar(self, texto: str, limite: int) -> List[Alumno]:
+        """
+        Cada palabra del texto dentro de apellido/nombre/DNI; primero los
+        apellidos que empiezan con el texto.
+        
+        Misma regla y orden que la funcion buscar_alumnos de init.sql
+        (ver AlumnoRepository.buscar).
+        
+        POR QUE py_lower Y NO LOWER:
+        - LOWER() y LIKE de SQLite solo pasan a minusculas letras ASCII:
+          "Álvarez" no coincidiria con "álv"
+        - py_lower es str.lower, lo mismo que usa el Mock (y lower() de
+          Postgres tambien pliega acentos)
+        """
+        palabras = [_escapar_like(p) for p in texto.lower().split()]
+        if not palabras:
+            return []
+        
+        condiciones = ' AND '.join(
+            "py_lower(apellido || ' ' || nombre || ' ' || dni) LIKE '%' || ? || '%' ESCAPE '\\'"
+            for _ in palabras
+        )
+        filas = self._todos(
+            f'SELECT {COLUMNAS} FROM alumnos '
+            f'WHERE {condiciones} '
+            "ORDER BY py_lower(apellido) LIKE ? || '%' ESCAPE '\\' DESC, apellido, nombre, id "
+            'LIMIT ?',
+            (*palabras, _escapar_like(texto.strip().lower()), limite)
+        )
+        return [_map_to_entity(fila) for fila in filas]
+    
+    def actualizar(
+        self,
+        alumno: Alumno,
+        updated_at_esperado: Optional[datetime] = None
+    ) -> Alumno:
+        """
+        Actualiza con un solo UPDATE (condicional si hay precondicion).
+        
+        Raises:
+            AlumnoNoEncontrado: Si el ID no existe
+            DNIDuplicado: Si el nuevo DNI pertenece a otro alumno
+            ModificacionConcurrente: Si el alumno cambio desde updated_at_esperado
+        """
+        sql = 'UPDATE alumnos SET nombre = ?, apellido = ?, dni = ?, updated_at = ? WHERE id = ?'
+        parametros = [alumno.nombre, alumno.apellido, alumno.dni, _ahora(), alumno.id]
+        
+        if updated_at_esperado is not None:
+            sql += ' AND updated_at = ?'
+            parametros.append(updated_at_esperado.isoformat())
+        
+        try:
+            with self._conexion() as conexion:
+                cursor = conexion.execute(sql, parametros)
+                
+                if cursor.rowcount == 0:
+                    existe = conexion.execute(
+                        'SELECT 1 FROM alumnos WHERE id = ?', (alumno.id,)
+                    ).fetchone()
+                    if existe and updated_at_esperado is not None:
+                        raise ModificacionConcurrente(alumno.id)
+                    raise AlumnoNoEncontrado(alumno.id)
+                
+                fila = conexion.execute(
+                    f'SELECT {COLUMNAS} FROM alumnos WHERE id = ?', (alumno.id,)
+                ).fetchone()
+            
+            return _map_to_entity(fila)
+        
+        except sqlite3.IntegrityError as e:
+            if _es_violacion_unicidad(e):
+                raise DNIDuplicado(alumno.dni)
+            raise RepositoryError(f"Error al actualizar alumno: {e}")
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Error al actualizar alumno: {e}")
+    
+    def eliminar(self, id: str) -> bool:
+        """Elimina un alumno; rowcount dice si existia."""
+        try:
+            with self._conexion() as conexion:
+                cursor = conexion.execute('DELETE FROM alumnos WHERE id = ?', (id,))
+            return cursor.rowcount > 0
+        
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Error al eliminar alumno: {e}")
+    
+    def existe_dni(self, dni: str, excluir_id: Optional[str] = None) -> bool:
+        """Verifica si un DNI ya existe."""
+        fila = self._uno(
+            'SELECT 1 FROM alumnos WHERE dni = ? AND id IS NOT ?',
+            (dni.strip().upper(), excluir_id)
+        )
+        return fila is not None
+    
+    def existe_dni_many(self, dnis: Iterable[str]) -> Set[str]:
+        """Verifica varios DNIs con consultas IN por lotes."""
+        existentes = set()
+        
+        for lote in _lotes(sorted({dni.strip().upper() for dni in dnis})):
+            existentes.update(
+                dni for (dni,) in self._todos(
+                    f'SELECT dni FROM alumnos WHERE dni IN ({_marcas(lote)})',
+                    lote
+                )
+            )
+        
+        return existentes
+    
+    def obtener_firma(self) -> Tuple[int, Optional[datetime]]:
+        """
+        Cantidad y max(updated_at) en una sola fila.
+        
+        max() sobre el texto sirve: _ahora() escribe todas las fechas en
+        UTC con el mismo formato, asi que el orden de texto es el de fechas.
+        """
+        cantidad, ultima = self._uno('SELECT count(*), max(updated_at) FROM alumnos')
+        return cantidad, parsear_fecha(ultima) if ultima else None
+    
+    def obtener_version(self) -> Optional[int]:
+        """
+        Version de alumnos en table_versions.
+        
+        SQLite no tiene triggers FOR EACH STATEMENT: un lote incrementa la
+        version una vez por fila, dentro de la misma transaccion.
+        """
+        fila = self._uno("SELECT version FROM table_versions WHERE tabla = 'alumnos'")
+        return fila[0] if fila else None
+    
+    def cerrar(self) -> None:
+        """Cierra las conexiones de todos los threads."""
+        with self._lock:
+            for conexion in self._conexiones.values():
+                conexion.close()
+            self._conexiones.clear()
+        self._local = threading.local()
+    
+    # =========================================================================
+    # METODOS PRIVADOS
+    # =========================================================================
+    
+    def _conexion(self) -> sqlite3.Connection:
+        """
+        Retorna la conexion del thread actual (la abre la primera vez).
+        
+        POR QUE UNA POR THREAD:
+        - Una conexion sqlite3 no se puede usar desde otro thread
+        - Con WAL, varias conexiones leen en paralelo al mismo archivo
+        
+        check_same_thread=False solo para que cerrar() (y la limpieza de
+        threads terminados) pueda cerrarlas; cada conexion se usa
+        unicamente desde su thread.
+        
+        POR QUE SE CIERRAN LAS DE THREADS TERMINADOS:
+        - El servidor threaded de Flask usa un thread nuevo por request:
+          sin limpieza quedaria una conexion (y sus archivos) abierta por
+          cada request hasta cerrar()
+        - Al abrir una conexion nueva se cierran las de threads que ya no
+          estan vivos: quedan tantas como threads vivos que usaron el repo
+        """
+        conexion = getattr(self._local, 'conexion', None)
+        
+        if conexion is None:
+            conexion = sqlite3.connect(
+                self._ruta,
+                timeout=10,
+                cached_statements=256,
+                check_same_thread=False
+            )
+            conexion.execute('PRAGMA synchronous=NORMAL')
+            conexion.create_function('py_lower', 1, str.lower, deterministic=True)
+            self._local.conexion = conexion
+            with self._lock:
+                for thread in [t for t in self._conexiones if not t.is_alive()]:
+                    self._conexiones.pop(thread).close()
+                self._conexiones[threading.current_thread()] = conexion
+        
+        return conexion
+    
+    def _uno(self, sql: str, parametros: tuple = ()) -> Optional[tuple]:
+        """Ejecuta una consulta y retorna la primera fila."""
+        try:
+            return self._conexion().execute(sql, parametros).fetchone()
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Error al consultar alumnos: {e}")
+    
+    def _todos(self, sql: str, parametros: Iterable = ()) -> List[tuple]:
+        """Ejecuta una consulta y retorna todas las filas."""
+        try:
+            return self._conexion().execute(sql, tuple(parametros)).fetchall()
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Error al consultar alumnos: {e}")
+    
+    def _pagina(
+        self,
+        columnas: str,
+        limite: Optional[int],
+        despues_de: Optional[Tuple[str, str, str]]
+    ) -> List[tuple]:
+        """SELECT ordenado por (apellido, nombre, id) desde un cursor."""
+        sql = f'SELECT {columnas} FROM alumnos'
+        parametros: list = []
+        
+        if despues_de is not None:
+            sql += ' WHERE (apellido, nombre, id) > (?, ?, ?)'
+            parametros.extend(despues_de)
+        
+        sql += ' ORDER BY apellido, nombre, id'
+        
+        if limite is not None:
+            sql += ' LIMIT ?'
+            parametros.append(limite)
+        
+        return self._todos(sql, parametros)
+
+
+def _ahora() -> str:
+    """Timestamp actual en ISO8601 UTC (como NOW() en PostgreSQL)."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _fila_nueva(alumno: Alumno) -> tuple:
+    """Arma la fila a insertar, con ID y timestamps asignados aca."""
+    ahora = _ahora()
+    return (str(uuid.uuid4()), alumno.nombre, alumno.apellido, alumno.dni, ahora, ahora)
+
+
+def _map_to_entity(fila: tuple) -> Alumno:
+    """
+    Convierte una fila (en el orden de COLUMNAS) a entidad Alumno.
+    
+    Sin revalidar: la fila se valido al escribirse (ver Alumno.from_db_row).
+    Las fechas las escribio _ahora() (isoformat) y quedan como texto: se
+    parsean solo si alguien pide alumno.created_at / updated_at.
+    """
+    return Alumno.from_db_row(*fila)
+
+
+def _escapar_like(texto: str) -> str:
+    """Escapa los comodines de LIKE (ESCAPE '\\')."""
+    return texto.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _es_violacion_unicidad(error: sqlite3.IntegrityError) -> bool:
+    """Indica si el error es la constraint UNIQUE de dni."""
+    return 'UNIQUE' in str(error).upper()
+
+
+def _lotes(valores: list) -> List[list]:
+    """Parte una lista en lotes de TAMANO_LOTE_IN."""
+    return [valores[i:i + TAMANO_LOTE_IN] for i in range(0, len(valores), TAMANO_LOTE_IN)]
+
+
+def _marcas(lote: list) -> str:
+    """Marcadores "?, ?, ..." para un IN con len(lote) valores."""
+    return ', '.join('?' * len(lote))
+
+
+# ===========================================================================
+# PRUEBA ATOMICA
+# ===========================================================================
+if __name__ == "__main__":
+    print("=== Prueba de SqliteAlumnoRepository ===\n")
+    
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as carpeta:
+        repo = SqliteAlumnoRepository(str(Path(carpeta) / 'alumnos.db'))
+        
+        # Test 1: Crear
+        creado = repo.crear(Alumno(nombre="Juan", apellido="Perez", dni="11111111"))
+        print(f"[OK] Crear: {creado}")
+        
+        # Test 2: DNI duplicado
+        try:
+            repo.crear(Alumno(nombre="Otro", apellido="Perez", dni="11111111"))
+            print("[ERROR] Debio fallar por DNI duplicado")
+        except DNIDuplicado as e:
+            print(f"[OK] DNI duplicado: {e.message}")
+        
+        # Test 3: Listar
+        print(f"[OK] Listar: {len(repo.listar_todos())} alumnos")
+        
+        # Test 4: Eliminar
+        print(f"[OK] Eliminar: {repo.eliminar(creado.id)}")
+        
+        repo.cerrar()
+    
+    print("\n=== Todas las pruebas pasaron ===")
@@ -26,18 +26,22 @@ Traduce las operaciones CRUD a llamadas a la API de Supabase.
 # Configuracion de path para pruebas atomicas
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from typing import Optional, List
+from datetime import datetime
+from typing import Dict, Iterable, Optional, List, Set, Tuple
 
 from domain.entities.alumno import Alumno
+from domain.entities.fechas import parsear_fecha
 from domain.repositories.alumno_repository import AlumnoRepository
 from domain.exceptions import (
     AlumnoNoEncontrado,
     DNIDuplicado,
+    ModificacionConcurrente,
     RepositoryError
 )
-from infrastructure.supabase_client import get_supabase_client
+from infrastructure.supabase_client import get_supabase_client, reset_client
 
 
 class SupabaseAlumnoRepository(AlumnoRepository):
@@ -55,6 +59,10 @@ class SupabaseAlumnoRepository(AlumnoRepository):
     # Nombre de la tabla en Supabase
     TABLE_NAME = 'alumnos'
     
+    # Valores por filtro in_() en las busquedas masivas
+    # POR QUE UN LIMITE: el filtro viaja en la URL del GET
+    TAMANO_LOTE_IN = 200
+    
     def __init__(self):
         """
         Inicializa el repositorio.
@@ -100,12 +108,14 @@ class SupabaseAlumnoRepository(AlumnoRepository):
         Raises:
             DNIDuplicado: Si el DNI ya existe
             RepositoryError: Si hay error de BD
+        
+        POR QUE SIN existe_dni() PREVIO:
+        - La columna dni es UNIQUE: la BD ya rechaza duplicados
+        - Un SELECT previo costaba un round trip extra por alta
+        - Y no evitaba la carrera entre dos altas simultaneas del mismo DNI
+        - Ahora un solo INSERT; el error 23505 se traduce a DNIDuplicado
         """
         try:
-            # Verificar DNI unico antes de insertar
-            if self.existe_dni(alumno.dni):
-                raise DNIDuplicado(alumno.dni)
-            
             # Preparar datos para insertar
             data = {
                 'nombre': alumno.nombre,
@@ -122,14 +132,57 @@ class SupabaseAlumnoRepository(AlumnoRepository):
             # Convertir respuesta a entidad
             return self._map_to_entity(response.data[0])
             
-        except DNIDuplicado:
+        except RepositoryError:
             raise
         except Exception as e:
             # Detectar error de constraint de unicidad
-            if 'duplicate key' in str(e).lower() or 'unique' in str(e).lower():
+            if _es_violacion_unicidad(e):
                 raise DNIDuplicado(alumno.dni)
             raise RepositoryError(f"Error al crear alumno: {e}")
     
+    def crear_lote(self, alumnos: List[Alumno]) -> List[Alumno]:
+        """
+        Crea varios alumnos con un solo INSERT multi-fila.
+        
+        POR QUE UPSERT CON ignore_duplicates:
+        - PostgREST lo traduce a INSERT ... ON CONFLICT (dni) DO NOTHING
+        - Un DNI existente no aborta el INSERT de las demas filas
+        - Con return=representation solo vuelven las filas insertadas:
+          las que faltan eran duplicados
+        
+        Args:
+            alumnos: Entidades Alumno a persistir
+        
+        Returns:
+            Alumnos creados, con ID asignado
+        
+        Raises:
+            RepositoryError: Si hay error de BD
+        """
+        if not alumnos:
+            return []
+        
+        try:
+            data = [
+                {
+                    'nombre': alumno.nombre,
+                    'apellido': alumno.apellido,
+                    'dni': alumno.dni
+                }
+                for alumno in alumnos
+            ]
+            
+            response = self.table.upsert(
+                data,
+                on_conflict='dni',
+                ignore_duplicates=True
+            ).execute()
+            
+            return self._map_to_entities(response.data)
+            
+        except Exception as e:
+            raise RepositoryError(f"Error al crear lote de alumnos: {e}")
+    
     def obtener_por_id(self, id: str) -> Optional[Alumno]:
         """
         Busca un alumno por su ID.
@@ -172,7 +225,31 @@ class SupabaseAlumnoRepository(AlumnoRepository):
         except Exception as e:
             raise RepositoryError(f"Error al buscar por DNI: {e}")
     
-    def listar_todos(self) -> List[Alumno]:
+    def obtener_por_dni_many(self, dnis: Iterable[str]) -> Dict[str, Alumno]:
+        """
+        Busca varios alumnos por DNI con consultas IN por lotes.
+        
+        Args:
+            dnis: DNIs a buscar
+        
+        Returns:
+            Diccionario DNI -> Alumno, solo con los que existen
+        """
+        try:
+            encontrados = {}
+            
+            for lote in self._lotes_dni(dnis):
+                response = self.table.select('*').in_('dni', lote).execute()
+                for data in response.data:
+                    alumno = self._map_to_entity(data)
+                    encontrados[alumno.dni] = alumno
+            
+            return encontrados
+            
+        except Exception as e:
+            raise RepositoryError(f"Error al buscar por DNIs: {e}")
+    
+    def listar_todos(self, version: Optional[int] = None) -> List[Alumno]:
         """
         Obtiene todos los alumnos ordenados por apellido.
         
@@ -182,17 +259,137 @@ class SupabaseAlumnoRepository(AlumnoRepository):
         try:
             response = self.table.select('*').order('apellido').execute()
             
-            return [self._map_to_entity(data) for data in response.data]
+            return self._map_to_entities(response.data)
             
         except Exception as e:
             raise RepositoryError(f"Error al listar alumnos: {e}")
     
-    def actualizar(self, alumno: Alumno) -> Alumno:
+    def listar_pagina(
+        self,
+        limite: int,
+        despues_de: Optional[Tuple[str, str, str]] = None
+    ) -> List[Alumno]:
         """
-        Actualiza un alumno existente.
+        Obtiene una pagina de alumnos con paginacion keyset.
+        
+        Traduce la comparacion de tuplas
+        (apellido, nombre, id) > (a, n, i) a un filtro OR de PostgREST:
+            apellido > a
+            OR (apellido = a AND nombre > n)
+            OR (apellido = a AND nombre = n AND id > i)
+        
+        Args:
+            limite: Cantidad maxima de alumnos
+            despues_de: Clave (apellido, nombre, id) del ultimo alumno visto
+        
+        Returns:
+            Lista de alumnos de la pagina
+        """
+        try:
+            response = self._consulta_keyset('*', despues_de).limit(limite).execute()
+            
+            return self._map_to_entities(response.data)
+            
+        except Exception as e:
+            raise RepositoryError(f"Error al listar pagina de alumnos: {e}")
+    
+    def listar_filas(
+        self,
+        campos: List[str],
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[str, str, str]] = None
+    ) -> List[dict]:
+        """
+        Obtiene filas con solo las columnas pedidas.
+        
+        POR QUE NO select('*'):
+        - PostgREST serializa y envia solo esas columnas
+        - Las filas no pasan por Alumno.from_dict (sin validar ni
+          parsear fechas)
+        
+        Args:
+            campos: Columnas a traer
+            limite: Cantidad maxima de filas, None para todas
+            despues_de: Clave (apellido, nombre, id) de la ultima fila vista
+        
+        Returns:
+            Filas como diccionarios
+        """
+        try:
+            query = self._consulta_keyset(','.join(campos), despues_de)
+            
+            if limite is not None:
+                query = query.limit(limite)
+            
+            return query.execute().data
+            
+        except Exception as e:
+            raise RepositoryError(f"Error al listar alumnos: {e}")
+    
+    def obtener_fila_por_id(self, id: str, campos: List[str]) -> Optional[dict]:
+        """
+        Obtiene un alumno con solo las columnas pedidas.
+        
+        Args:
+            id: UUID del alumno
+            campos: Columnas a traer
+        
+        Returns:
+            Diccionario con esas columnas, None si no existe
+        """
+        try:
+            response = self.table.select(','.join(campos)).eq('id', id).execute()
+            
+            return response.data[0] if response.data else None
+            
+        except Exception as e:
+            raise RepositoryError(f"Error al buscar alumno: {e}")
+    
+    def buscar(self, texto: str, limite: int) -> List[Alumno]:
+        """
+        Busca alumnos con la funcion SQL buscar_alumnos (ver init.sql).
+        
+        POR QUE UNA FUNCION (RPC) Y NO FILTROS DE PostgREST:
+        - PostgREST no puede filtrar por LOWER(apellido), y sin eso la BD
+          no usa los indices de prefijo ni el trigram
+        - La funcion ordena primero los apellidos que empiezan con el texto
+        
+        Args:
+            texto: Texto ingresado
+            limite: Cantidad maxima de resultados
+        
+        Returns:
+            Alumnos que coinciden
+        """
+        try:
+            response = self.client.rpc(
+                'buscar_alumnos',
+                {'q': texto, 'limite': limite}
+            ).execute()
+            
+            return self._map_to_entities(response.data)
+            
+        except Exception as e:
+            raise RepositoryError(f"Error al buscar alumnos: {e}")
+    
+    def actualizar(
+        self,
+        alumno: Alumno,
+        updated_at_esperado: Optional[datetime] = None
+    ) -> Alumno:
+        """
+        Actualiza un alumno existente con un solo UPDATE.
+        
+        POR QUE SIN LECTURAS PREVIAS:
+        - UPDATE ... WHERE id = ? RETURNING * (via PostgREST) ya dice si
+          el ID existia: sin filas devueltas, no existia
+        - El DNI duplicado lo detecta la constraint UNIQUE (23505)
+        - Antes eran hasta 4 round trips, ahora 1
         
         Args:
             alumno: Entidad Alumno con los nuevos datos
+            updated_at_esperado: Si se indica, se agrega
+                "AND updated_at = ?" al WHERE (concurrencia optimista)
         
         Returns:
             Alumno actualizado
@@ -200,16 +397,9 @@ class SupabaseAlumnoRepository(AlumnoRepository):
         Raises:
             AlumnoNoEncontrado: Si el ID no existe
             DNIDuplicado: Si el nuevo DNI pertenece a otro alumno
+            ModificacionConcurrente: Si el alumno cambio desde updated_at_esperado
         """
         try:
-            # Verificar que existe
-            if not self.obtener_por_id(alumno.id):
-                raise AlumnoNoEncontrado(alumno.id)
-            
-            # Verificar DNI unico (excluyendo el actual)
-            if self.existe_dni(alumno.dni, excluir_id=alumno.id):
-                raise DNIDuplicado(alumno.dni)
-            
             # Preparar datos para actualizar
             data = {
                 'nombre': alumno.nombre,
@@ -217,18 +407,27 @@ class SupabaseAlumnoRepository(AlumnoRepository):
                 'dni': alumno.dni
             }
             
-            # Actualizar
-            response = self.table.update(data).eq('id', alumno.id).execute()
+            # Actualizar (condicional si hay precondicion)
+            query = self.table.update(data).eq('id', alumno.id)
+            
+            if updated_at_esperado is not None:
+                query = query.eq('updated_at', updated_at_esperado.isoformat())
+            
+            response = query.execute()
             
             if not response.data:
-                raise RepositoryError("No se pudo actualizar el alumno")
+                # Solo en el caso de fallo: distinguir "no existe" de
+                # "existe pero cambio" (la precondicion no se cumplio)
+                if updated_at_esperado is not None and self.obtener_por_id(alumno.id):
+                    raise ModificacionConcurrente(alumno.id)
+                raise AlumnoNoEncontrado(alumno.id)
             
             return self._map_to_entity(response.data[0])
             
-        except (AlumnoNoEncontrado, DNIDuplicado):
+        except (AlumnoNoEncontrado, DNIDuplicado, ModificacionConcurrente, RepositoryError):
             raise
         except Exception as e:
-            if 'duplicate key' in str(e).lower() or 'unique' in str(e).lower():
+            if _es_violacion_unicidad(e):
                 raise DNIDuplicado(alumno.dni)
             raise RepositoryError(f"Error al actualizar alumno: {e}")
     
@@ -241,14 +440,17 @@ class SupabaseAlumnoRepository(AlumnoRepository):
         
         Returns:
             True si se elimino, False si no existia
+        
+        POR QUE SIN obtener_por_id() PREVIO:
+        - PostgREST responde el DELETE con las filas borradas
+          (Prefer: return=representation, equivalente a DELETE ... RETURNING)
+        - Si no vino ninguna fila, el ID no existia
+        - Un solo round trip en vez de dos
         """
         try:
-            # Verificar que existe antes de eliminar
-            if not self.obtener_por_id(id):
-                return False
+            response = self.table.delete().eq('id', id).execute()
             
-            self.table.delete().eq('id', id).execute()
-            return True
+            return len(response.data) > 0
             
         except Exception as e:
             raise RepositoryError(f"Error al eliminar alumno: {e}")
@@ -277,10 +479,128 @@ class SupabaseAlumnoRepository(AlumnoRepository):
         except Exception as e:
             raise RepositoryError(f"Error al verificar DNI: {e}")
     
+    def existe_dni_many(self, dnis: Iterable[str]) -> Set[str]:
+        """
+        Verifica varios DNIs con consultas IN por lotes.
+        
+        POR QUE select('dni'):
+        - Solo importa si existe; no hace falta traer ni mapear la fila
+        
+        Args:
+            dnis: DNIs a verificar
+        
+        Returns:
+            Conjunto con los DNIs que ya existen
+        """
+        try:
+            existentes = set()
+            
+            for lote in self._lotes_dni(dnis):
+                response = self.table.select('dni').in_('dni', lote).execute()
+                existentes.update(data['dni'] for data in response.data)
+            
+            return existentes
+            
+        except Exception as e:
+            raise RepositoryError(f"Error al verificar DNIs: {e}")
+    
+    def obtener_firma(self) -> Tuple[int, Optional[datetime]]:
+        """
+        Cantidad y max(updated_at) en un solo request.
+        
+        POR QUE count='exact' + ORDER BY updated_at DESC LIMIT 1:
+        - PostgREST devuelve la cantidad en Content-Range y una sola fila
+        - 'planned' seria una estimacion: no detectaria un DELETE
+        
+        Returns:
+            (cantidad, max(updated_at) o None si la tabla esta vacia)
+        """
+        try:
+            response = (
+                self.table.select('updated_at', count='exact')
+                .order('updated_at', desc=True)
+                .limit(1)
+                .execute()
+            )
+            
+            ultima = response.data[0]['updated_at'] if response.data else None
+            return response.count or 0, parsear_fecha(ultima) if ultima else None
+            
+        except Exception as e:
+            raise RepositoryError(f"Error al obtener la firma de alumnos: {e}")
+    
+    def obtener_version(self) -> Optional[int]:
+        """
+        Version de alumnos en table_versions.
+        
+        POR QUE EL REPOSITORIO NO LA INCREMENTA AL ESCRIBIR:
+        - La incrementa el trigger de database/init.sql, en la misma
+          transaccion del INSERT/UPDATE/DELETE de PostgREST
+        - Hacerlo desde aca seria un segundo request por escritura y no
+          cubriria los cambios hechos desde el SQL Editor
+        
+        Returns:
+            Version actual o None si init.sql no creo la fila
+        """
+        try:
+            response = (
+                self.client.table('table_versions')
+                .select('version')
+                .eq('tabla', 'alumnos')
+                .limit(1)
+                .execute()
+            )
+            return response.data[0]['version'] if response.data else None
+            
+        except Exception as e:
+            raise RepositoryError(f"Error al obtener la version de alumnos: {e}")
+    
+    def cerrar(self) -> None:
+        """
+        Cierra el pool httpx del cliente Supabase (al apagar la app).
+        
+        El cliente es el singleton del proceso: si se vuelve a usar,
+        get_supabase_client() crea uno nuevo.
+        """
+        if self._client is not None:
+            self._client = None
+            reset_client()
+    
     # =========================================================================
     # METODOS PRIVADOS (Adapter)
     # =========================================================================
     
+    def _consulta_keyset(
+        self,
+        columnas: str,
+        despues_de: Optional[Tuple[str, str, str]]
+    ):
+        """
+        Arma el SELECT ordenado por (apellido, nombre, id) desde un cursor.
+        
+        Traduce la comparacion de tuplas a un filtro OR de PostgREST
+        (ver listar_pagina).
+        """
+        query = self.table.select(columnas)
+        
+        if despues_de is not None:
+            apellido, nombre, id = (_quote(v) for v in despues_de)
+            query = query.or_(
+                f'apellido.gt.{apellido},'
+                f'and(apellido.eq.{apellido},nombre.gt.{nombre}),'
+                f'and(apellido.eq.{apellido},nombre.eq.{nombre},id.gt.{id})'
+            )
+        
+        return query.order('apellido').order('nombre').order('id')
+    
+    def _lotes_dni(self, dnis: Iterable[str]) -> List[List[str]]:
+        """Normaliza, quita repetidos y parte los DNIs en lotes para in_()."""
+        unicos = sorted({dni.strip().upper() for dni in dnis})
+        return [
+            unicos[i:i + self.TAMANO_LOTE_IN]
+            for i in range(0, len(unicos), self.TAMANO_LOTE_IN)
+        ]
+    
     def _map_to_entity(self, data: dict) -> Alumno:
         """
         Convierte un dict de Supabase a entidad Alumno.
@@ -288,8 +608,53 @@ class SupabaseAlumnoRepository(AlumnoRepository):
         POR QUE METODO SEPARADO (ADAPTER):
         - Centraliza la conversion
         - Si Supabase cambia formato, solo se modifica aqui
+        
+        POR QUE from_db_dict Y NO from_dict:
+        - La fila ya se valido y normalizo al escribirse; revalidarla en
+          cada lectura era la mayor parte del costo de listar
+        """
+        return Alumno.from_db_dict(data)
+    
+    def _map_to_entities(self, filas: List[dict]) -> List[Alumno]:
+        """
+        Convierte todas las filas de una respuesta a entidades Alumno.
+        
+        POR QUE NO [_map_to_entity(f) for f in filas]:
+        - from_db_dicts arma la lista en un solo bucle, sin dos llamadas
+          por fila, y deja las fechas como texto (ver domain/entities/fechas.py)
         """
-        return Alumno.from_dict(data)
+        return Alumno.from_db_dicts(filas)
+
+
+# Codigo SQLSTATE de PostgreSQL para unique_violation
+PG_UNIQUE_VIOLATION = '23505'
+
+
+def _es_violacion_unicidad(error: Exception) -> bool:
+    """
+    Indica si un error de PostgREST es una violacion de UNIQUE.
+    
+    POR QUE MIRAR EL CODIGO PRIMERO:
+    - APIError de postgrest trae el SQLSTATE en .code
+    - El texto del mensaje queda como respaldo para otras versiones
+    """
+    if getattr(error, 'code', None) == PG_UNIQUE_VIOLATION:
+        return True
+    
+    mensaje = str(error).lower()
+    return PG_UNIQUE_VIOLATION in mensaje or 'duplicate key' in mensaje
+
+
+def _quote(valor: str) -> str:
+    """
+    Escapa un valor para usarlo dentro de un filtro or_() de PostgREST.
+    
+    POR QUE COMILLAS:
+    - Apellidos con comas, puntos o parentesis romperian el filtro
+    - PostgREST acepta valores entre comillas dobles con \\ y \" escapados
+    """
+    escapado = str(valor).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escapado}"'
 
 
 # ===========================================================================
@@ -11,6 +11,17 @@
 # - Evita crear multiples clientes innecesarios
 # - Thread-safe para concurrencia
 #
+# POR QUE UN httpx.Client PROPIO:
+# - El cliente por defecto no tiene limites de pool ni timeouts de conexion
+# - El transporte (pool, keep-alive, HTTP/2, timeouts, reintentos) se arma
+#   en infrastructure/http_transport.py a partir de la configuracion
+#
+# POR QUE FORK-AWARE:
+# - Con gunicorn --preload el cliente puede crearse en el proceso master;
+#   cada worker heredaria los mismos sockets/TLS y se mezclarian respuestas
+# - Despues de un fork, el hijo descarta el cliente heredado SIN cerrarlo
+#   (cerrarlo cortaria las conexiones del padre) y crea uno propio
+#
 # NOTA STATELESS:
 # - Este singleton es SEGURO en serverless porque:
 #   - Solo mantiene configuracion de conexion
@@ -28,17 +39,31 @@ Proporciona una unica instancia del cliente para toda la aplicacion.
 # Configuracion de path para pruebas atomicas
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+import os
 from threading import Lock
-from typing import Optional
-from supabase import create_client, Client
+from typing import List, Optional
+from supabase import create_client, Client, ClientOptions
+
+from infrastructure.http_transport import (
+    RetryTransport,
+    crear_http_client,
+    crear_transporte
+)
 
 
 # Variables del singleton
 _supabase_client: Optional[Client] = None
+_transporte: Optional[RetryTransport] = None
+_pid: Optional[int] = None
 _lock = Lock()
 
+# Clientes heredados de un fork: se conservan para que el GC no cierre
+# conexiones que siguen siendo del proceso padre
+_heredados: List[Client] = []
+
 
 def get_supabase_client() -> Client:
     """
@@ -58,7 +83,7 @@ def get_supabase_client() -> Client:
     Raises:
         EnvironmentError: Si faltan las credenciales
     """
-    global _supabase_client
+    global _supabase_client, _transporte, _pid
     
     if _supabase_client is None:
         with _lock:
@@ -69,27 +94,95 @@ def get_supabase_client() -> Client:
                 
                 config = get_config()
                 
+                transporte = crear_transporte(
+                    max_conexiones=config.SUPABASE_HTTP_MAX_CONNECTIONS,
+                    max_keepalive=config.SUPABASE_HTTP_MAX_KEEPALIVE,
+                    keepalive_segundos=config.SUPABASE_HTTP_KEEPALIVE_SECONDS,
+                    http2=config.SUPABASE_HTTP2,
+                    reintentos=config.SUPABASE_HTTP_RETRIES,
+                    backoff=config.SUPABASE_HTTP_RETRY_BACKOFF
+                )
+                http_client = crear_http_client(
+                    transporte,
+                    timeout_conexion=config.SUPABASE_HTTP_CONNECT_TIMEOUT,
+                    timeout_lectura=config.SUPABASE_HTTP_READ_TIMEOUT
+                )
+                
                 # Crear cliente con credenciales de entorno
                 # NUNCA hardcodear las credenciales aqui
                 _supabase_client = create_client(
                     config.SUPABASE_URL,
-                    config.SUPABASE_KEY
+                    config.SUPABASE_KEY,
+                    options=ClientOptions(httpx_client=http_client)
                 )
+                _transporte = transporte
+                _pid = os.getpid()
     
     return _supabase_client
 
 
+def get_pool_stats() -> Optional[dict]:
+    """
+    Retorna las estadisticas del pool HTTP del cliente (para el health check).
+    
+    POR QUE NO CREA EL CLIENTE:
+    - El health check debe responder aunque no haya credenciales
+      y no debe abrir conexiones a Supabase por si mismo
+    
+    Returns:
+        Diccionario de RetryTransport.estadisticas(), o None si el
+        cliente todavia no se creo
+    """
+    transporte = _transporte
+    return transporte.estadisticas() if transporte is not None else None
+
+
 def reset_client() -> None:
     """
-    Resetea el cliente singleton (solo para testing).
+    Resetea el cliente singleton.
     
     POR QUE RESET:
     - Util en tests para limpiar estado entre pruebas
-    - NO usar en produccion
+    - Seguro despues de un fork: solo cierra las conexiones si el cliente
+      se creo en este proceso; uno heredado se descarta sin tocar sus sockets
     """
-    global _supabase_client
+    global _supabase_client, _transporte, _pid
+    
+    if _pid is not None and _pid != os.getpid():
+        _descartar_heredado()
+        return
+    
     with _lock:
+        if _transporte is not None:
+            _transporte.close()
         _supabase_client = None
+        _transporte = None
+        _pid = None
+
+
+def _descartar_heredado() -> None:
+    """
+    Olvida el cliente creado por otro proceso (se llama en el hijo de un fork).
+    
+    POR QUE UN LOCK NUEVO:
+    - Si otro thread del padre tenia tomado _lock al hacer fork, en el
+      hijo quedaria tomado para siempre
+    """
+    global _supabase_client, _transporte, _pid, _lock
+    
+    if _supabase_client is not None:
+        _heredados.append(_supabase_client)
+    
+    _lock = Lock()
+    _supabase_client = None
+    _transporte = None
+    _pid = None
+
+
+# POR QUE register_at_fork: cubre cualquier servidor que haga fork
+# (gunicorn, uWSGI, multiprocessing), no solo el hook de gunicorn.conf.py
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_descartar_heredado)
 
 
 # ===========================================================================
@@ -108,6 +201,7 @@ if __name__ == "__main__":
         client2 = get_supabase_client()
         es_mismo = client is client2
         print(f"[OK] Es singleton: {es_mismo}")
+        print(f"[OK] Pool HTTP: {get_pool_stats()}")
         
         # Intentar una operacion simple (health check)
         # Esto verifica que las credenciales son validas
@@ -121,10 +215,10 @@ if __name__ == "__main__":
             print("     Esto puede ser normal si la tabla no existe aun")
         
         print("\n=== Prueba pasada ===")
-        
+    
     except EnvironmentError as e:
         print(f"[ADVERTENCIA] {e}")
         print("\nEsto es esperado si no tienes un archivo .env configurado.")
-        
+    
     except Exception as e:
         print(f"[ERROR] {e}")
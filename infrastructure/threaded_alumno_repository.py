@@ -0,0 +1,170 @@
+# ===========================================================================
+# Adaptador Async de Repositorios Sincronicos
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Capa: Infrastructure
+# Patron: Adapter
+# ===========================================================================
+#
+# POR QUE UN ADAPTADOR:
+# - Supabase y SQLite solo tienen repositorio sincronico
+# - Llamarlo directo desde la app ASGI bloquearia el event loop
+# - Cada llamada se ejecuta en un pool de threads propio y el event loop
+#   sigue atendiendo otros requests mientras tanto
+#
+# LIMITE:
+# - La concurrencia real contra la BD es la cantidad de threads
+#   (max_workers); el backend 'postgres' usa un driver async de verdad
+#
+# ===========================================================================
+
+"""
+Adapta un AlumnoRepository sincronico a la interface AsyncAlumnoRepository.
+"""
+
+# Configuracion de path para pruebas atomicas
+import sys
+from pathlib import Path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from domain.entities.alumno import Alumno
+from domain.repositories.alumno_repository import AlumnoRepository
+from domain.repositories.async_alumno_repository import AsyncAlumnoRepository
+
+
+class ThreadedAlumnoRepository(AsyncAlumnoRepository):
+    """
+    Ejecuta cada metodo del repositorio sincronico en un thread aparte.
+    
+    Patron: Adapter
+    """
+    
+    def __init__(self, repository: AlumnoRepository, max_workers: int = 32):
+        """
+        Inicializa el adaptador.
+        
+        Args:
+            repository: Repositorio sincronico a envolver
+            max_workers: Threads que atienden llamadas a la vez
+        """
+        self._repository = repository
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='alumnos-repo'
+        )
+    
+    # =========================================================================
+    # OPERACIONES (Delegan en un thread)
+    # =========================================================================
+    
+    async def crear(self, alumno: Alumno) -> Alumno:
+        """Delega en un thread."""
+        return await self._en_thread(self._repository.crear, alumno)
+    
+    async def crear_lote(self, alumnos: List[Alumno]) -> List[Alumno]:
+        """Delega en un thread."""
+        return await self._en_thread(self._repository.crear_lote, alumnos)
+    
+    async def obtener_por_id(self, id: str) -> Optional[Alumno]:
+        """Delega en un thread."""
+        return await self._en_thread(self._repository.obtener_por_id, id)
+    
+    async def obtener_por_dni(self, dni: str) -> Optional[Alumno]:
+        """Delega en un thread."""
+        return await self._en_thread(self._repository.obtener_por_dni, dni)
+    
+    async def obtener_por_dni_many(self, dnis: Iterable[str]) -> Dict[str, Alumno]:
+        """Delega en un thread."""
+        return await self._en_thread(self._repository.obtener_por_dni_many, list(dnis))
+    
+    async def listar_todos(self, version: Optional[int] = None) -> List[Alumno]:
+        """Delega en un thread."""
+        return await self._en_thread(self._repository.listar_todos, version)
+    
+    async def listar_pagina(
+        self,
+        limite: int,
+        despues_de: Optional[Tuple[str, str, str]] = None
+    ) -> List[Alumno]:
+        """Delega en un thread."""
+        return await self._en_thread(self._repository.listar_pagina, limite, despues_de)
+    
+    async def listar_filas(
+        self,
+        campos: List[str],
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[str, str, str]] = None
+    ) -> List[dict]:
+        """Delega en un thread."""
+        return await self._en_thread(
+            self._repository.listar_filas, campos, limite, despues_de
+        )
+    
+    async def obtener_fila_por_id(self, id: str, campos: List[str]) -> Optional[dict]:
+        """Delega en un thread."""
+        return await self._en_thread(self._repository.obtener_fila_por_id, id, campos)
+    
+    async def buscar(self, texto: str, limite: int) -> List[Alumno]:
+        """Delega en un thread."""
+        return await self._en_thread(self._repository.buscar, texto, limite)
+    
+    async def actualizar(
+        self,
+        alumno: Alumno,
+        updated_at_esperado: Optional[datetime] = None
+    ) -> Alumno:
+        """Delega en un thread."""
+        return await self._en_thread(
+            self._repository.actualizar, alumno, updated_at_esperado
+        )
+    
+    async def eliminar(self, id: str) -> bool:
+        """Delega en un thread."""
+        return await self._en_thread(self._repository.eliminar, id)
+    
+    async def existe_dni(self, dni: str, excluir_id: Optional[str] = None) -> bool:
+        """Delega en un thread."""
+        return await self._en_thread(self._repository.existe_dni, dni, excluir_id)
+    
+    async def existe_dni_many(self, dnis: Iterable[str]) -> Set[str]:
+        """Delega en un thread."""
+        return await self._en_thread(self._repository.existe_dni_many, list(dnis))
+    
+    async def obtener_firma(self) -> Tuple[int, Optional[datetime]]:
+        """Delega en un thread."""
+        return await self._en_thread(self._repository.obtener_firma)
+    
+    async def obtener_version(self) -> Optional[int]:
+        """Delega en un thread."""
+        return await self._en_thread(self._repository.obtener_version)
+    
+    async def cerrar(self) -> None:
+        """
+        Espera las llamadas en curso, libera los threads y cierra el
+        repositorio envuelto (si tiene cerrar()).
+        
+        POR QUE to_thread:
+        - shutdown(wait=True) y el cerrar() sincronico bloquean; llamados
+          directo frenarian el event loop durante after_serving
+        """
+        await asyncio.to_thread(self._executor.shutdown, True)
+        
+        cerrar = getattr(self._repository, 'cerrar', None)
+        if cerrar is not None:
+            await asyncio.to_thread(cerrar)
+    
+    # =========================================================================
+    # METODOS PRIVADOS
+    # =========================================================================
+    
+    async def _en_thread(self, metodo, *args):
+        """Ejecuta metodo(*args) en el pool de threads sin bloquear el loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(metodo, *args))
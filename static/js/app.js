@@ -66,6 +66,8 @@ const App = {
         user: null,
         token: null,
         alumnos: [],
+        // Ultima respuesta de cada GET con su ETag: url -> { etag, datos }
+        respuestasGET: new Map(),
         editandoId: null,
         sessionTimer: null,
         sessionSecondsLeft: SESSION_TIMEOUT_SECONDS,
@@ -289,6 +291,7 @@ const App = {
 
         this.state.user = null;
         this.state.token = null;
+        this.state.respuestasGET.clear();
         this.stopSessionTimer();
         this.mostrarLogin();
         this.toast('Sesion cerrada', 'success');
@@ -368,6 +371,7 @@ const App = {
         this.stopSessionTimer();
         this.state.user = null;
         this.state.token = null;
+        this.state.respuestasGET.clear();
 
         // Mostrar modal de sesion expirada
         document.getElementById('modal-sesion-expirada').style.display = 'flex';
@@ -464,7 +468,8 @@ const App = {
         tbody.innerHTML = '';
 
         try {
-            const response = await this.fetchAPI('/api/alumnos', {
+            // Solo las columnas que muestra la tabla
+            const response = await this.fetchAPI('/api/alumnos?fields=id,nombre,apellido,dni', {
                 method: 'GET'
             });
 
@@ -649,6 +654,11 @@ const App = {
     /**
      * Realiza una peticion a la API con autenticacion.
      * Incluye interceptor de 401 para manejar sesiones expiradas.
+     *
+     * POR QUE If-None-Match EN LOS GET:
+     * - La lista se vuelve a pedir despues de cada cambio y casi siempre
+     *   es la misma; con el ETag de la ultima respuesta el servidor
+     *   contesta 304 sin cuerpo y se reusan los datos ya recibidos
      */
     async fetchAPI(url, options = {}) {
         // Agregar headers por defecto
@@ -662,9 +672,21 @@ const App = {
             options.headers['Authorization'] = `Bearer ${this.state.token}`;
         }
 
+        // Validador de la ultima respuesta a este mismo GET
+        const esGET = (options.method || 'GET').toUpperCase() === 'GET';
+        const anterior = esGET ? this.state.respuestasGET.get(url) : null;
+        if (anterior) {
+            options.headers['If-None-Match'] = anterior.etag;
+        }
+
         try {
             const response = await fetch(url, options);
 
+            // 304: los datos no cambiaron desde la ultima respuesta
+            if (response.status === 304 && anterior) {
+                return anterior.datos;
+            }
+
             // Interceptor de 401: sesion expirada
             if (response.status === 401) {
                 const data = await response.json();
@@ -690,7 +712,14 @@ const App = {
                 return null;
             }
 
-            return await response.json();
+            const datos = await response.json();
+
+            const etag = response.headers.get('ETag');
+            if (esGET && etag) {
+                this.state.respuestasGET.set(url, { etag, datos });
+            }
+
+            return datos;
 
         } catch (error) {
             // Re-throw para que el llamador maneje el error
@@ -183,6 +183,67 @@ class TestAlumnoFactoryMethods:
         assert 'updated_at' in result
 
 
+class TestAlumnoHidratacionConfiable:
+    """Tests de from_db_row / from_db_dict (filas ya validadas de la BD)."""
+    
+    def test_from_db_row_no_revalida_ni_normaliza(self):
+        """Verifica que los valores se guardan tal cual llegan."""
+        fecha = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        alumno = Alumno.from_db_row('abc', 'de la Cruz', 'Perez', 'x1', fecha, fecha)
+        
+        assert alumno.nombre == 'de la Cruz'
+        assert alumno.dni == 'x1'
+        assert alumno.created_at == fecha
+    
+    def test_from_db_dict_parsea_fechas_al_pedirlas(self):
+        """Verifica que las fechas se parsean igual que en from_dict."""
+        data = {
+            'id': 'abc', 'nombre': 'Juan', 'apellido': 'Perez', 'dni': '1',
+            'created_at': '2024-01-15T10:30:00Z',
+            'updated_at': '2024-01-16T10:30:00+00:00'
+        }
+        
+        alumno = Alumno.from_db_dict(data)
+        esperado = Alumno.from_dict(data)
+        
+        assert alumno.created_at == esperado.created_at
+        assert alumno.updated_at == esperado.updated_at
+    
+    def test_from_db_dict_devuelve_fechas_sin_reformatear(self):
+        """Verifica que to_dict() reenvia el texto original de la BD."""
+        data = {
+            'id': 'abc', 'nombre': 'Juan', 'apellido': 'Perez', 'dni': '1',
+            'created_at': '2024-01-15T10:30:00.12+00:00',
+            'updated_at': '2024-01-16T10:30:00Z'
+        }
+        
+        alumno = Alumno.from_db_dict(data)
+        alumno.updated_at
+        
+        assert alumno.to_dict() == data
+    
+    def test_from_db_dicts_equivale_a_from_db_dict(self):
+        """Verifica el camino de listas contra el de una fila."""
+        filas = [
+            {'id': str(i), 'nombre': 'Juan', 'apellido': 'Perez', 'dni': str(i),
+             'created_at': '2024-01-15T10:30:00+00:00', 'updated_at': None}
+            for i in range(3)
+        ]
+        
+        alumnos = Alumno.from_db_dicts(filas)
+        
+        assert [a.to_dict() for a in alumnos] == filas
+        assert alumnos[0].updated_at is None
+    
+    def test_alumno_usa_slots(self):
+        """Verifica que las instancias no tienen __dict__."""
+        alumno = Alumno(nombre="Juan", apellido="Perez", dni="123")
+        
+        assert not hasattr(alumno, '__dict__')
+        with pytest.raises(AttributeError):
+            alumno.otro_atributo = 1
+
+
 class TestAlumnoActualizar:
     """Tests del metodo actualizar."""
     
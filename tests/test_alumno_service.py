@@ -28,7 +28,12 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from domain.entities.alumno import Alumno
 from domain.repositories.alumno_repository import MockAlumnoRepository
-from domain.exceptions import ValidacionError, AlumnoNoEncontrado, DNIDuplicado
+from domain.exceptions import (
+    ValidacionError,
+    AlumnoNoEncontrado,
+    DNIDuplicado,
+    ModificacionConcurrente
+)
 from application.alumno_service import AlumnoService
 
 
@@ -89,6 +94,81 @@ class TestCrearAlumno:
         # Act & Assert: intentar crear con mismo DNI
         with pytest.raises(DNIDuplicado):
             service.crear_alumno("Maria", "Garcia", "12345678")
+    
+    def test_crear_concurrente_mismo_dni_crea_uno(self, service):
+        """Verifica que el repositorio en memoria es seguro entre threads."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        def crear(i):
+            try:
+                return service.crear_alumno(f"Nombre{i}", "Perez", "12345678")
+            except DNIDuplicado:
+                return None
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            creados = [a for a in pool.map(crear, range(50)) if a is not None]
+        
+        assert len(creados) == 1
+        assert len(service.listar_alumnos()) == 1
+
+
+class TestCrearAlumnosLote:
+    """Tests del caso de uso: Importar Alumnos por lotes."""
+    
+    def test_lote_reporta_cada_fila(self, service):
+        """Verifica creado, duplicado en BD, duplicado en lote e invalido."""
+        # Arrange
+        service.crear_alumno("Juan", "Perez", "11111111")
+        filas = [
+            {"nombre": "Ana", "apellido": "Alvarez", "dni": "22222222"},
+            {"nombre": "Otro", "apellido": "Perez", "dni": "11111111"},
+            {"nombre": "", "apellido": "Lopez", "dni": "33333333"},
+            {"nombre": "Ana", "apellido": "Alvarez", "dni": "22222222"},
+            "no-es-un-objeto",
+        ]
+        
+        # Act
+        resultados = service.crear_alumnos_lote(filas)
+        
+        # Assert
+        assert [r["fila"] for r in resultados] == [1, 2, 3, 4, 5]
+        assert [r["estado"] for r in resultados] == [
+            "creado", "dni_duplicado", "error_validacion",
+            "dni_duplicado", "error_validacion"
+        ]
+        assert resultados[0]["alumno"].id is not None
+        assert resultados[2]["error"].campo == "nombre"
+        assert len(service.listar_alumnos()) == 2
+    
+    def test_lote_acepta_dni_numerico(self, service):
+        """Verifica que un DNI numerico (JSON) se importa como texto."""
+        resultados = service.crear_alumnos_lote(
+            [{"nombre": "Ana", "apellido": "Alvarez", "dni": 22222222}]
+        )
+        
+        assert resultados[0]["alumno"].dni == "22222222"
+    
+    def test_lote_inserta_de_a_lotes(self, mock_repository):
+        """Verifica que se hace un crear_lote por cada lote."""
+        llamadas = []
+        original = mock_repository.crear_lote
+        mock_repository.crear_lote = lambda a: llamadas.append(len(a)) or original(a)
+        service = AlumnoService(mock_repository)
+        filas = [
+            {"nombre": "Juan", "apellido": "Perez", "dni": f"3000000{i}"}
+            for i in range(5)
+        ]
+        
+        service.crear_alumnos_lote(filas, tamano_lote=2)
+        
+        assert llamadas == [2, 2, 1]
+    
+    def test_lote_tamano_invalido_falla(self, service):
+        """Verifica que un tamano de lote fuera de rango lanza ValidacionError."""
+        with pytest.raises(ValidacionError) as exc_info:
+            service.crear_alumnos_lote([], tamano_lote=0)
+        
+        assert exc_info.value.campo == "chunk_size"
 
 
 class TestObtenerAlumno:
@@ -150,6 +230,138 @@ class TestListarAlumnos:
         assert apellidos == sorted(apellidos)
 
 
+class TestListarAlumnosPaginado:
+    """Tests del caso de uso: Listar Alumnos paginado (keyset)."""
+    
+    def test_primera_pagina_con_cursor_siguiente(self, service):
+        """Verifica que si hay mas alumnos se retorna un cursor."""
+        # Arrange
+        service.crear_alumno("Juan", "Perez", "11111111")
+        service.crear_alumno("Maria", "Garcia", "22222222")
+        service.crear_alumno("Carlos", "Lopez", "33333333")
+        
+        # Act
+        pagina, cursor = service.listar_alumnos_paginado(limite=2)
+        
+        # Assert
+        assert [a.apellido for a in pagina] == ["Garcia", "Lopez"]
+        assert cursor is not None
+    
+    def test_recorrer_todas_las_paginas(self, service):
+        """Verifica que recorrer con cursores devuelve todos sin repetir."""
+        # Arrange: apellidos repetidos para forzar desempate por id
+        for i in range(7):
+            service.crear_alumno(f"Nombre{i % 2}", "Perez", f"1000000{i}")
+        
+        # Act
+        vistos = []
+        cursor = None
+        while True:
+            pagina, cursor = service.listar_alumnos_paginado(limite=3, cursor=cursor)
+            vistos.extend(a.id for a in pagina)
+            if cursor is None:
+                break
+        
+        # Assert
+        assert len(vistos) == 7
+        assert len(set(vistos)) == 7
+    
+    def test_ultima_pagina_sin_cursor(self, service):
+        """Verifica que la ultima pagina no tiene cursor siguiente."""
+        service.crear_alumno("Juan", "Perez", "11111111")
+        
+        pagina, cursor = service.listar_alumnos_paginado(limite=5)
+        
+        assert len(pagina) == 1
+        assert cursor is None
+    
+    def test_limite_fuera_de_rango_falla(self, service):
+        """Verifica que un limite invalido lanza ValidacionError."""
+        with pytest.raises(ValidacionError) as exc_info:
+            service.listar_alumnos_paginado(limite=0)
+        
+        assert exc_info.value.campo == "limit"
+    
+    def test_cursor_invalido_falla(self, service):
+        """Verifica que un cursor corrupto lanza ValidacionError."""
+        with pytest.raises(ValidacionError) as exc_info:
+            service.listar_alumnos_paginado(limite=5, cursor="no-es-un-cursor")
+        
+        assert exc_info.value.campo == "after"
+
+
+class TestProyeccionDeCampos:
+    """Tests de listado/obtencion con solo algunas columnas."""
+    
+    def test_listar_campos_retorna_solo_esas_columnas(self, service):
+        """Verifica que las filas traen solo los campos pedidos."""
+        service.crear_alumno("Juan", "Perez", "11111111")
+        
+        filas = service.listar_alumnos_campos(["nombre", "dni"])
+        
+        assert filas == [{"nombre": "Juan", "dni": "11111111"}]
+    
+    def test_paginado_con_campos_sin_clave(self, service):
+        """Verifica que el cursor funciona aunque no se pidan apellido/id."""
+        for i in range(3):
+            service.crear_alumno("Juan", f"Apellido{i}", f"2000000{i}")
+        
+        primera, cursor = service.listar_alumnos_campos_paginado(["dni"], limite=2)
+        segunda, fin = service.listar_alumnos_campos_paginado(["dni"], limite=2, cursor=cursor)
+        
+        assert primera == [{"dni": "20000000"}, {"dni": "20000001"}]
+        assert segunda == [{"dni": "20000002"}]
+        assert fin is None
+    
+    def test_limite_cero_no_trae_filas(self, service, mock_repository):
+        """Verifica que el Mock trata limite=0 como los backends SQL (LIMIT 0)."""
+        service.crear_alumno("Juan", "Perez", "11111111")
+        
+        assert mock_repository.listar_filas(["dni"], limite=0) == []
+        assert mock_repository.listar_filas(["dni"]) == [{"dni": "11111111"}]
+    
+    def test_campo_desconocido_falla(self, service):
+        """Verifica que un campo inexistente lanza ValidacionError."""
+        with pytest.raises(ValidacionError) as exc_info:
+            service.listar_alumnos_campos(["nombre", "password"])
+        
+        assert exc_info.value.campo == "fields"
+    
+    def test_obtener_campos_inexistente_falla(self, service):
+        """Verifica que obtener filas de un ID inexistente lanza error."""
+        with pytest.raises(AlumnoNoEncontrado):
+            service.obtener_alumno_campos("id-que-no-existe", ["nombre"])
+
+
+class TestExportarAlumnos:
+    """Tests del caso de uso: Exportar Alumnos (generador por paginas)."""
+    
+    def test_exportar_recorre_todas_las_paginas(self, service):
+        """Verifica que el generador entrega todos los alumnos en orden."""
+        # Arrange
+        for i in range(5):
+            service.crear_alumno("Juan", f"Apellido{i}", f"2000000{i}")
+        
+        # Act
+        exportados = list(service.exportar_alumnos(tamano_pagina=2))
+        
+        # Assert
+        assert [a.apellido for a in exportados] == [f"Apellido{i}" for i in range(5)]
+    
+    def test_exportar_es_perezoso(self, mock_repository):
+        """Verifica que no se consulta el repositorio hasta iterar."""
+        llamadas = []
+        original = mock_repository.listar_pagina
+        mock_repository.listar_pagina = lambda *a: llamadas.append(a) or original(*a)
+        service = AlumnoService(mock_repository)
+        
+        generador = service.exportar_alumnos()
+        assert llamadas == []
+        
+        list(generador)
+        assert len(llamadas) == 1
+
+
 class TestActualizarAlumno:
     """Tests del caso de uso: Actualizar Alumno."""
     
@@ -212,6 +424,40 @@ class TestActualizarAlumno:
         assert actualizado.nombre == "Juan Carlos"
 
 
+class TestActualizarAlumnoCondicional:
+    """Tests de actualizacion con precondicion (concurrencia optimista)."""
+    
+    def test_actualizar_con_updated_at_vigente_ok(self, service):
+        """Verifica que con el updated_at actual se actualiza."""
+        creado = service.crear_alumno("Juan", "Perez", "12345678")
+        
+        actualizado = service.actualizar_alumno(
+            creado.id, "Juan Carlos", "Perez", "12345678",
+            updated_at_esperado=creado.updated_at
+        )
+        
+        assert actualizado.nombre == "Juan Carlos"
+    
+    def test_actualizar_con_updated_at_viejo_falla(self, service):
+        """Verifica que si el alumno cambio se lanza ModificacionConcurrente."""
+        creado = service.crear_alumno("Juan", "Perez", "12345678")
+        service.actualizar_alumno(creado.id, "Otro", "Perez", "12345678")
+        
+        with pytest.raises(ModificacionConcurrente):
+            service.actualizar_alumno(
+                creado.id, "Juan Carlos", "Perez", "12345678",
+                updated_at_esperado=creado.updated_at
+            )
+    
+    def test_actualizar_conserva_created_at(self, service):
+        """Verifica que actualizar no pisa created_at."""
+        creado = service.crear_alumno("Juan", "Perez", "12345678")
+        
+        actualizado = service.actualizar_alumno(creado.id, "Juan", "Perez", "12345678")
+        
+        assert actualizado.created_at == creado.created_at
+
+
 class TestEliminarAlumno:
     """Tests del caso de uso: Eliminar Alumno."""
     
@@ -242,6 +488,56 @@ class TestEliminarAlumno:
         """Verifica que eliminar ID inexistente lanza error."""
         with pytest.raises(AlumnoNoEncontrado):
             service.eliminar_alumno("id-que-no-existe")
+    
+    def test_eliminar_no_busca_antes(self, mock_repository):
+        """Verifica que eliminar no hace una lectura previa por defecto."""
+        service = AlumnoService(mock_repository)
+        creado = service.crear_alumno("Juan", "Perez", "12345678")
+        lecturas = []
+        mock_repository.obtener_por_id = lambda id: lecturas.append(id)
+        
+        service.eliminar_alumno(creado.id)
+        
+        assert lecturas == []
+
+
+class TestBuscar:
+    """Tests del caso de uso: Buscar alumnos por texto."""
+    
+    def test_buscar_por_prefijo_de_apellido_nombre_o_dni(self, service):
+        """Verifica que cada palabra del texto se busca en apellido, nombre y DNI."""
+        creado = service.crear_alumno("Juan Pablo", "Perez", "12345678")
+        service.crear_alumno("Maria", "Garcia", "22222222")
+        
+        for texto in ("pe", "PAB", "1234", "per ju"):
+            assert [a.id for a in service.buscar(texto)] == [creado.id]
+    
+    def test_buscar_prioriza_prefijo_de_apellido(self, service):
+        """Verifica que los apellidos con el prefijo van primero."""
+        service.crear_alumno("Lopez", "Alvarez", "11111111")
+        service.crear_alumno("Ana", "Lopez", "22222222")
+        
+        resultado = service.buscar("lop")
+        
+        assert [a.apellido for a in resultado] == ["Lopez", "Alvarez"]
+    
+    def test_buscar_refleja_actualizaciones_y_bajas(self, service):
+        """Verifica que el indice se mantiene al editar y eliminar."""
+        creado = service.crear_alumno("Juan", "Perez", "12345678")
+        service.actualizar_alumno(creado.id, "Juan", "Gomez", "12345678")
+        
+        assert service.buscar("perez") == []
+        assert len(service.buscar("gomez")) == 1
+        
+        service.eliminar_alumno(creado.id)
+        assert service.buscar("gomez") == []
+    
+    def test_buscar_texto_vacio_falla(self, service):
+        """Verifica que un texto vacio lanza ValidacionError."""
+        with pytest.raises(ValidacionError) as exc_info:
+            service.buscar("   ")
+        
+        assert exc_info.value.campo == "q"
 
 
 class TestBuscarPorDni:
@@ -264,6 +560,24 @@ class TestBuscarPorDni:
         resultado = service.buscar_por_dni("99999999")
         
         assert resultado is None
+    
+    def test_dnis_existentes_retorna_solo_los_registrados(self, service):
+        """Verifica la verificacion masiva de DNIs (normalizados)."""
+        service.crear_alumno("Juan", "Perez", "12345678")
+        service.crear_alumno("Ana", "Alvarez", "X123")
+        
+        existentes = service.dnis_existentes(["12345678", " x123 ", "99999999"])
+        
+        assert existentes == {"12345678", "X123"}
+    
+    def test_buscar_por_dnis_retorna_alumnos(self, service):
+        """Verifica la busqueda masiva por DNI."""
+        creado = service.crear_alumno("Juan", "Perez", "12345678")
+        
+        encontrados = service.buscar_por_dnis(["12345678", "99999999"])
+        
+        assert list(encontrados) == ["12345678"]
+        assert encontrados["12345678"].id == creado.id
 
 
 # ===========================================================================
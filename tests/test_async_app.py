@@ -0,0 +1,221 @@
+# ===========================================================================
+# Tests de la App ASGI y el Servicio Async
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Fase: 5 - Testing Formal
+# ===========================================================================
+#
+# REGLAS DE TESTING:
+# - Sin credenciales reales: MockAlumnoRepository detras del adaptador
+# - Usa el test client de Quart (async) desde tests sincronicos
+# - Mockea la validacion del JWT como en test_routes.py
+#
+# ===========================================================================
+
+"""
+Tests del AsyncAlumnoService y de los endpoints de api/asgi.py.
+"""
+
+import asyncio
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+pytest.importorskip('quart')
+
+from api.asgi import create_asgi_app
+from application.async_alumno_service import AsyncAlumnoService, create_async_alumno_service
+from domain.exceptions import AlumnoNoEncontrado, ValidacionError
+from domain.repositories.alumno_repository import MockAlumnoRepository
+from infrastructure.cached_alumno_repository import CachedAlumnoRepository
+from infrastructure.threaded_alumno_repository import ThreadedAlumnoRepository
+
+
+AUTH = {'Authorization': 'Bearer mock-token'}
+
+
+@pytest.fixture
+def service():
+    """Servicio async sobre MockAlumnoRepository."""
+    return AsyncAlumnoService(ThreadedAlumnoRepository(MockAlumnoRepository()))
+
+
+@pytest.fixture(autouse=True)
+def jwt_valido():
+    """Acepta cualquier token."""
+    with patch('api.middleware.auth._validate_jwt') as mock:
+        mock.return_value = {'sub': 'user-123', 'exp': 9999999999}
+        yield mock
+
+
+def _pedir(app, metodo, url, **kwargs):
+    """Ejecuta un request con el test client de Quart y retorna (status, json)."""
+    async def pedir():
+        client = app.test_client()
+        response = await getattr(client, metodo)(url, **kwargs)
+        datos = await response.get_json() if response.mimetype == 'application/json' else None
+        return response.status_code, datos
+    
+    return asyncio.run(pedir())
+
+
+class TestAsyncAlumnoService:
+    """Tests de casos de uso async."""
+    
+    def test_crear_y_paginar(self, service):
+        async def probar():
+            for apellido in ["Gomez", "Alvarez", "Perez"]:
+                await service.crear_alumno("Juan", apellido, apellido.upper())
+            
+            pagina, cursor = await service.listar_alumnos_paginado(limite=2)
+            resto, fin = await service.listar_alumnos_paginado(limite=2, cursor=cursor)
+            return [a.apellido for a in pagina + resto], fin
+        
+        apellidos, fin = asyncio.run(probar())
+        
+        assert apellidos == ["Alvarez", "Gomez", "Perez"]
+        assert fin is None
+    
+    def test_importar_lote(self, service):
+        resultados = asyncio.run(service.crear_alumnos_lote([
+            {'nombre': 'Ana', 'apellido': 'Lopez', 'dni': '1'},
+            {'nombre': 'Ana', 'apellido': 'Lopez', 'dni': '1'},
+            {'nombre': '', 'apellido': 'X', 'dni': '2'},
+        ]))
+        
+        assert [r['estado'] for r in resultados] == [
+            'creado', 'dni_duplicado', 'error_validacion'
+        ]
+    
+    def test_validaciones_compartidas(self, service):
+        with pytest.raises(ValidacionError):
+            asyncio.run(service.buscar("   "))
+        
+        with pytest.raises(AlumnoNoEncontrado):
+            asyncio.run(service.eliminar_alumno("no-existe"))
+    
+    def test_exportar_recorre_todas_las_paginas(self, service):
+        async def probar():
+            for i in range(5):
+                await service.crear_alumno("N", f"A{i}", f"D{i}")
+            return [a.dni async for a in service.exportar_alumnos(tamano_pagina=2)]
+        
+        assert asyncio.run(probar()) == ["D0", "D1", "D2", "D3", "D4"]
+    
+    def test_con_supabase_hay_un_thread_por_conexion_http(self):
+        config = MagicMock(
+            ALUMNO_REPOSITORY='supabase',
+            ALUMNO_CACHE_ENABLED=False,
+            SUPABASE_HTTP_MAX_CONNECTIONS=7
+        )
+        
+        with patch('infrastructure.config.get_config', return_value=config):
+            service = asyncio.run(create_async_alumno_service())
+        
+        assert service._repository._executor._max_workers == 7
+
+
+class TestCerrar:
+    """Tests del apagado del adaptador con threads."""
+    
+    def test_cierra_el_repositorio_envuelto(self):
+        repositorio = MagicMock(spec=['cerrar'])
+        adaptador = ThreadedAlumnoRepository(CachedAlumnoRepository(repositorio))
+        
+        asyncio.run(adaptador.cerrar())
+        
+        repositorio.cerrar.assert_called_once_with()
+        assert adaptador._executor._shutdown
+    
+    def test_no_bloquea_el_event_loop(self):
+        hilos = []
+        repositorio = MagicMock(spec=['cerrar'])
+        repositorio.cerrar.side_effect = lambda: hilos.append(threading.current_thread())
+        
+        asyncio.run(ThreadedAlumnoRepository(repositorio).cerrar())
+        
+        assert hilos and hilos[0] is not threading.main_thread()
+    
+    def test_repositorio_sin_cerrar(self):
+        asyncio.run(ThreadedAlumnoRepository(MockAlumnoRepository()).cerrar())
+
+
+class TestAsgiEndpoints:
+    """Tests de las rutas async (mismo contrato que api/routes.py)."""
+    
+    def test_health_publico(self, service):
+        status, datos = _pedir(create_asgi_app(service), 'get', '/api/health')
+        
+        assert status == 200
+        assert datos['status'] == 'healthy'
+    
+    def test_sin_token_retorna_401(self, service, jwt_valido):
+        status, datos = _pedir(create_asgi_app(service), 'get', '/api/alumnos')
+        
+        assert status == 401
+    
+    def test_crud_completo(self, service):
+        app = create_asgi_app(service)
+        
+        status, creado = _pedir(app, 'post', '/api/alumnos', headers=AUTH, json={
+            'nombre': 'Juan', 'apellido': 'Perez', 'dni': '12345678'
+        })
+        assert status == 201
+        
+        status, _ = _pedir(app, 'post', '/api/alumnos', headers=AUTH, json={
+            'nombre': 'Otro', 'apellido': 'Perez', 'dni': '12345678'
+        })
+        assert status == 409
+        
+        status, datos = _pedir(app, 'get', f"/api/alumnos/{creado['id']}?fields=dni", headers=AUTH)
+        assert (status, datos) == (200, {'dni': '12345678'})
+        
+        status, _ = _pedir(app, 'put', f"/api/alumnos/{creado['id']}", headers=AUTH, json={
+            'nombre': 'Juan', 'apellido': 'Perez', 'dni': '12345678',
+            'updated_at': '2000-01-01T00:00:00+00:00'
+        })
+        assert status == 412
+        
+        status, _ = _pedir(app, 'delete', f"/api/alumnos/{creado['id']}", headers=AUTH)
+        assert status == 204
+        
+        status, _ = _pedir(app, 'get', f"/api/alumnos/{creado['id']}", headers=AUTH)
+        assert status == 404
+    
+    def test_listar_revalida_con_etag(self, service):
+        app = create_asgi_app(service)
+        
+        async def pedir():
+            client = app.test_client()
+            primera = await client.get('/api/alumnos', headers=AUTH)
+            etag = primera.headers['ETag']
+            repetida = await client.get('/api/alumnos', headers=dict(AUTH, **{'If-None-Match': etag}))
+            await service.crear_alumno("Juan", "Perez", "1")
+            cambiada = await client.get('/api/alumnos', headers=dict(AUTH, **{'If-None-Match': etag}))
+            return repetida.status_code, cambiada.status_code
+        
+        assert asyncio.run(pedir()) == (304, 200)
+    
+    def test_limite_invalido_retorna_400(self, service):
+        status, datos = _pedir(create_asgi_app(service), 'get', '/api/alumnos?limit=abc', headers=AUTH)
+        
+        assert status == 400
+        assert datos['campo'] == 'limit'
+    
+    def test_exportar_ndjson(self, service):
+        app = create_asgi_app(service)
+        asyncio.run(service.crear_alumno("Juan", "Perez", "1"))
+        
+        async def pedir():
+            response = await app.test_client().get('/api/alumnos/export', headers=AUTH)
+            return response.status_code, await response.get_data(as_text=True)
+        
+        status, cuerpo = asyncio.run(pedir())
+        
+        assert status == 200
+        assert cuerpo.count('\n') == 1
@@ -0,0 +1,230 @@
+# ===========================================================================
+# Tests del Repositorio PostgreSQL Async
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Fase: 5 - Testing Formal
+# ===========================================================================
+#
+# REGLAS DE TESTING:
+# - Sin BD: un AsyncConnectionPool falso registra el SQL y devuelve filas
+#   preparadas (igual que en test_postgres_alumno_repository.py)
+# - Cada test corre su corrutina con asyncio.run()
+#
+# ===========================================================================
+
+"""
+Tests unitarios para AsyncPostgresAlumnoRepository.
+
+Verifica traduccion de errores, 412 vs 404, decodificacion de filas y COPY.
+"""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+psycopg = pytest.importorskip('psycopg')
+pytest.importorskip('psycopg_pool')
+
+from domain.entities.alumno import Alumno
+from domain.exceptions import (
+    AlumnoNoEncontrado,
+    DNIDuplicado,
+    ModificacionConcurrente,
+    RepositoryError
+)
+from infrastructure.async_postgres_alumno_repository import AsyncPostgresAlumnoRepository
+from infrastructure.postgres_alumno_repository import SQL_FIRMA, SQL_VERSION
+
+
+AHORA = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _fila(dni='12345678', id=None):
+    """Fila como la devuelve el cursor binario (UUID y datetime nativos)."""
+    return (id or uuid.uuid4(), 'Juan', 'Perez', dni, AHORA, AHORA)
+
+
+class CursorFalso:
+    """AsyncCursor que responde con resultados encolados."""
+    
+    def __init__(self, pool):
+        self._pool = pool
+        self._filas = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *args):
+        return False
+    
+    async def execute(self, consulta, parametros=()):
+        self._pool.ejecutadas.append((consulta, parametros))
+        respuesta = self._pool.respuestas.pop(0)
+        if isinstance(respuesta, Exception):
+            raise respuesta
+        self._filas = respuesta
+    
+    async def fetchone(self):
+        return self._filas[0] if self._filas else None
+    
+    async def fetchall(self):
+        return list(self._filas)
+    
+    @asynccontextmanager
+    async def copy(self, consulta):
+        copia = CopiaFalsa()
+        yield copia
+        self._pool.copiadas.extend(copia.filas)
+
+
+class CopiaFalsa:
+    """Destino de COPY async que solo guarda las filas."""
+    
+    def __init__(self):
+        self.filas = []
+    
+    def set_types(self, tipos):
+        pass
+    
+    async def write_row(self, fila):
+        self.filas.append(fila)
+
+
+class PoolFalso:
+    """Stand-in de AsyncConnectionPool: una conexion que devuelve CursorFalso."""
+    
+    def __init__(self, *respuestas):
+        self.respuestas = list(respuestas)
+        self.ejecutadas = []
+        self.copiadas = []
+        self.cerrado = False
+    
+    @asynccontextmanager
+    async def connection(self):
+        yield self
+    
+    def cursor(self, binary=False):
+        assert binary, "el repositorio debe pedir resultados binarios"
+        return CursorFalso(self)
+    
+    async def close(self):
+        self.cerrado = True
+
+
+def _alumno_con_id():
+    return Alumno(nombre="Juan", apellido="Perez", dni="1", id=str(uuid.uuid4()))
+
+
+class TestConPoolFalso:
+    """Tests sin base de datos."""
+    
+    def test_crear_traduce_unique_violation(self):
+        repo = AsyncPostgresAlumnoRepository(pool=PoolFalso(psycopg.errors.UniqueViolation('dup')))
+        
+        with pytest.raises(DNIDuplicado):
+            asyncio.run(repo.crear(Alumno(nombre="Juan", apellido="Perez", dni="1")))
+    
+    def test_crear_decodifica_returning(self):
+        id = uuid.uuid4()
+        pool = PoolFalso([_fila(id=id)])
+        repo = AsyncPostgresAlumnoRepository(pool=pool)
+        
+        creado = asyncio.run(repo.crear(Alumno(nombre="Juan", apellido="Perez", dni="12345678")))
+        
+        assert creado.id == str(id)
+        assert creado.created_at == AHORA
+        assert pool.ejecutadas[0][1] == ('Juan', 'Perez', '12345678')
+    
+    def test_error_de_bd_es_repository_error(self):
+        repo = AsyncPostgresAlumnoRepository(pool=PoolFalso(psycopg.OperationalError('caida')))
+        
+        with pytest.raises(RepositoryError):
+            asyncio.run(repo.listar_todos())
+    
+    def test_actualizar_con_precondicion_vieja(self):
+        pool = PoolFalso([], [_fila()])
+        repo = AsyncPostgresAlumnoRepository(pool=pool)
+        
+        with pytest.raises(ModificacionConcurrente):
+            asyncio.run(repo.actualizar(_alumno_con_id(), AHORA))
+        
+        consulta, parametros = pool.ejecutadas[0]
+        assert 'AND updated_at = %s' in consulta
+        assert parametros[-1] == AHORA
+    
+    def test_actualizar_inexistente_con_precondicion(self):
+        repo = AsyncPostgresAlumnoRepository(pool=PoolFalso([], []))
+        
+        with pytest.raises(AlumnoNoEncontrado):
+            asyncio.run(repo.actualizar(_alumno_con_id(), AHORA))
+    
+    def test_actualizar_inexistente_sin_precondicion_no_relee(self):
+        pool = PoolFalso([])
+        repo = AsyncPostgresAlumnoRepository(pool=pool)
+        
+        with pytest.raises(AlumnoNoEncontrado):
+            asyncio.run(repo.actualizar(_alumno_con_id()))
+        
+        assert len(pool.ejecutadas) == 1
+    
+    def test_actualizar_dni_de_otro_es_dni_duplicado(self):
+        repo = AsyncPostgresAlumnoRepository(pool=PoolFalso(psycopg.errors.UniqueViolation('dup')))
+        
+        with pytest.raises(DNIDuplicado):
+            asyncio.run(repo.actualizar(_alumno_con_id()))
+    
+    def test_crear_lote_usa_copy_y_respeta_orden(self):
+        pool = PoolFalso([], [_fila(dni='333'), _fila(dni='111')])
+        repo = AsyncPostgresAlumnoRepository(pool=pool)
+        
+        creados = asyncio.run(repo.crear_lote([
+            Alumno(nombre="A", apellido="A", dni="111"),
+            Alumno(nombre="B", apellido="B", dni="222"),
+            Alumno(nombre="C", apellido="C", dni="333"),
+        ]))
+        
+        assert [fila[0] for fila in pool.copiadas] == [0, 1, 2]
+        assert [fila[3] for fila in pool.copiadas] == ['111', '222', '333']
+        assert [a.dni for a in creados] == ['111', '333']
+    
+    def test_crear_lote_vacio_no_consulta(self):
+        pool = PoolFalso()
+        
+        assert asyncio.run(AsyncPostgresAlumnoRepository(pool=pool).crear_lote([])) == []
+        assert pool.ejecutadas == []
+    
+    def test_eliminar_retorna_si_existia(self):
+        repo = AsyncPostgresAlumnoRepository(pool=PoolFalso([(uuid.uuid4(),)], []))
+        
+        assert asyncio.run(repo.eliminar('a')) is True
+        assert asyncio.run(repo.eliminar('b')) is False
+    
+    def test_firma_y_version_una_consulta_cada_una(self):
+        pool = PoolFalso([(3, AHORA)], [(7,)])
+        repo = AsyncPostgresAlumnoRepository(pool=pool)
+        
+        assert asyncio.run(repo.obtener_firma()) == (3, AHORA)
+        assert asyncio.run(repo.obtener_version()) == 7
+        assert pool.ejecutadas == [(SQL_FIRMA, ()), (SQL_VERSION, ())]
+    
+    def test_cerrar_cierra_el_pool(self):
+        pool = PoolFalso()
+        
+        asyncio.run(AsyncPostgresAlumnoRepository(pool=pool).cerrar())
+        
+        assert pool.cerrado
+
+
+# ===========================================================================
+# Ejecucion directa (para debug)
+# ===========================================================================
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
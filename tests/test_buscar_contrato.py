@@ -0,0 +1,94 @@
+# ===========================================================================
+# Tests de Contrato de buscar()
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Fase: 5 - Testing Formal
+# ===========================================================================
+#
+# REGLAS DE TESTING:
+# - Los mismos casos corren contra cada backend disponible sin red
+#   (MockAlumnoRepository y SqliteAlumnoRepository)
+# - La regla es la de AlumnoRepository.buscar; SQLite usa el mismo SQL
+#   que la funcion buscar_alumnos de init.sql
+#
+# ===========================================================================
+
+"""
+Contrato de AlumnoRepository.buscar: mismos resultados en cada backend.
+"""
+
+import pytest
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from domain.entities.alumno import Alumno
+from domain.repositories.alumno_repository import MockAlumnoRepository
+from infrastructure.sqlite_alumno_repository import SqliteAlumnoRepository
+
+
+@pytest.fixture(params=['mock', 'sqlite'])
+def repo(request, tmp_path):
+    """Repositorio de cada backend con los mismos alumnos cargados."""
+    if request.param == 'mock':
+        repositorio = MockAlumnoRepository()
+    else:
+        repositorio = SqliteAlumnoRepository(str(tmp_path / 'alumnos.db'))
+    
+    repositorio.crear(Alumno(nombre="Juan Pablo", apellido="Perez", dni="12345678"))
+    repositorio.crear(Alumno(nombre="Maria", apellido="Gonzalez", dni="23456789"))
+    repositorio.crear(Alumno(nombre="Perla", apellido="Alvarez", dni="34567890"))
+    repositorio.crear(Alumno(nombre="Íñigo", apellido="Álvaro", dni="45678901"))
+    
+    yield repositorio
+    
+    if request.param == 'sqlite':
+        repositorio.cerrar()
+
+
+def _apellidos(repo, texto, limite=10):
+    return [a.apellido for a in repo.buscar(texto, limite)]
+
+
+class TestReglaDeBusqueda:
+    """Cada palabra debe aparecer dentro de "apellido nombre dni"."""
+    
+    @pytest.mark.parametrize('texto, esperados', [
+        ("per ju", ["Perez"]),
+        ("ju per", ["Perez"]),
+        ("erez", ["Perez"]),
+        ("onza", ["Gonzalez"]),
+        ("23", ["Perez", "Gonzalez"]),
+        ("PABLO", ["Perez"]),
+        ("maria 2345", ["Gonzalez"]),
+        ("per maria", []),
+        ("xyz", []),
+        ("álv", ["Álvaro"]),
+        ("ÁLV", ["Álvaro"]),
+        ("ÍÑIGO", ["Álvaro"]),
+    ])
+    def test_coincidencias(self, repo, texto, esperados):
+        assert sorted(_apellidos(repo, texto)) == sorted(esperados)
+    
+    def test_primero_apellidos_con_el_prefijo(self, repo):
+        # "per" esta en Perez (apellido) y en Perla (nombre de Alvarez)
+        assert _apellidos(repo, "per") == ["Perez", "Alvarez"]
+    
+    def test_sin_prefijo_ordena_por_apellido(self, repo):
+        assert _apellidos(repo, "ez") == ["Alvarez", "Gonzalez", "Perez"]
+    
+    def test_respeta_el_limite(self, repo):
+        assert _apellidos(repo, "ez", limite=2) == ["Alvarez", "Gonzalez"]
+    
+    def test_comodines_son_texto(self, repo):
+        assert _apellidos(repo, "%") == []
+        assert _apellidos(repo, "_") == []
+
+
+# ===========================================================================
+# Ejecucion directa (para debug)
+# ===========================================================================
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,240 @@
+# ===========================================================================
+# Tests del Repositorio con Cache
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Fase: 5 - Testing Formal
+# ===========================================================================
+#
+# REGLAS DE TESTING:
+# - Envuelve MockAlumnoRepository (sin BD real)
+# - Reloj inyectado: los tests de TTL no usan sleep
+#
+# ===========================================================================
+
+"""
+Tests unitarios para CachedAlumnoRepository.
+
+Verifica hits/misses, invalidacion en escrituras, LRU, TTL y el
+listado revalidado por version.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from domain.entities.alumno import Alumno
+from domain.repositories.alumno_repository import MockAlumnoRepository
+from infrastructure.cached_alumno_repository import CachedAlumnoRepository
+
+
+class RelojFalso:
+    """Reloj controlable para probar vencimientos."""
+    
+    def __init__(self):
+        self.ahora = 0.0
+    
+    def __call__(self) -> float:
+        return self.ahora
+
+
+@pytest.fixture
+def reloj():
+    """Fixture con un reloj controlable."""
+    return RelojFalso()
+
+
+@pytest.fixture
+def repo(reloj):
+    """Fixture con un cache chico sobre un repositorio mock."""
+    return CachedAlumnoRepository(
+        MockAlumnoRepository(),
+        max_size=4,
+        ttl_seconds=10,
+        reloj=reloj
+    )
+
+
+@pytest.fixture
+def alumno(repo):
+    """Fixture con un alumno ya persistido."""
+    return repo.crear(Alumno(nombre="Juan", apellido="Perez", dni="11111111"))
+
+
+class TestLecturas:
+    """Tests de lecturas cacheadas."""
+    
+    def test_segunda_lectura_es_hit(self, repo, alumno):
+        """Verifica que la segunda lectura por ID no va al repositorio."""
+        repo.obtener_por_id(alumno.id)
+        repo.obtener_por_id(alumno.id)
+        
+        stats = repo.estadisticas()
+        assert stats['misses'] == 1
+        assert stats['hits'] == 1
+    
+    def test_lectura_por_id_carga_tambien_dni(self, repo, alumno):
+        """Verifica que leer por ID deja cacheado el DNI normalizado."""
+        repo.obtener_por_id(alumno.id)
+        
+        encontrado = repo.obtener_por_dni("  11111111 ")
+        
+        assert encontrado.id == alumno.id
+        assert repo.estadisticas()['hits'] == 1
+    
+    def test_inexistente_no_se_cachea(self, repo):
+        """Verifica que un None no queda cacheado."""
+        assert repo.obtener_por_id("no-existe") is None
+        assert repo.estadisticas()['size'] == 0
+    
+    def test_dni_many_usa_cache_y_busca_faltantes(self, repo, alumno):
+        """Verifica que la busqueda masiva combina hits y una consulta."""
+        otro = repo.crear(Alumno(nombre="Ana", apellido="Lopez", dni="22222222"))
+        repo.obtener_por_id(alumno.id)
+        
+        encontrados = repo.obtener_por_dni_many(["11111111", "22222222", "99999999"])
+        
+        assert set(encontrados) == {"11111111", "22222222"}
+        assert encontrados["22222222"].id == otro.id
+        assert repo.obtener_por_dni("22222222").id == otro.id
+        assert repo.estadisticas()['hits'] == 2
+
+
+class TestInvalidacion:
+    """Tests de invalidacion en escrituras."""
+    
+    def test_actualizar_invalida_id_y_dni_viejo(self, repo, alumno):
+        """Verifica que tras cambiar el DNI, el viejo ya no resuelve."""
+        repo.obtener_por_id(alumno.id)
+        
+        repo.actualizar(alumno.actualizar(dni="22222222"))
+        
+        assert repo.obtener_por_dni("11111111") is None
+        assert repo.obtener_por_id(alumno.id).dni == "22222222"
+    
+    def test_lectura_durante_la_escritura_no_queda_en_cache(self, repo, alumno):
+        """Verifica que una lectura intercalada en la escritura no deja la fila vieja."""
+        interno = repo._repository
+        actualizar_real = interno.actualizar
+        
+        def actualizar_con_lectura(*args):
+            # Otro request lee mientras la escritura todavia no termino
+            assert repo.obtener_por_id(alumno.id).nombre == "Juan"
+            return actualizar_real(*args)
+        
+        with patch.object(interno, 'actualizar', side_effect=actualizar_con_lectura):
+            repo.actualizar(alumno.actualizar(nombre="Pedro"))
+        
+        assert repo.obtener_por_id(alumno.id).nombre == "Pedro"
+    
+    def test_escritura_fallida_tambien_invalida(self, repo, alumno):
+        """Verifica que si el repositorio falla el cache no queda vigente."""
+        repo.obtener_por_id(alumno.id)
+        
+        with patch.object(repo._repository, 'eliminar', side_effect=RuntimeError("BD caida")):
+            with pytest.raises(RuntimeError):
+                repo.eliminar(alumno.id)
+        
+        repo.obtener_por_id(alumno.id)
+        assert repo.estadisticas()['misses'] == 2
+    
+    def test_eliminar_invalida(self, repo, alumno):
+        """Verifica que un alumno eliminado no se sirve desde cache."""
+        repo.obtener_por_id(alumno.id)
+        
+        repo.eliminar(alumno.id)
+        
+        assert repo.obtener_por_id(alumno.id) is None
+        assert repo.obtener_por_dni(alumno.dni) is None
+
+
+class TestListado:
+    """Tests de listar_todos() revalidado con la version de la tabla."""
+    
+    def test_listado_sin_cambios_no_recorre_la_tabla(self, repo, alumno):
+        """Verifica que la segunda llamada solo lee la version."""
+        repo.listar_todos()
+        
+        with patch.object(repo._repository, 'listar_todos') as listar:
+            assert [a.id for a in repo.listar_todos()] == [alumno.id]
+        
+        listar.assert_not_called()
+        assert repo.estadisticas()['hits'] == 1
+    
+    def test_escritura_de_otro_proceso_invalida(self, repo, alumno):
+        """Verifica que una escritura que no paso por el cache se ve igual."""
+        repo.listar_todos()
+        
+        # Otro worker escribe directo en la BD: solo cambia la version
+        repo._repository.crear(Alumno(nombre="Ana", apellido="Lopez", dni="22222222"))
+        
+        assert len(repo.listar_todos()) == 2
+    
+    def test_escritura_local_invalida(self, repo, alumno):
+        """Verifica que eliminar descarta el listado guardado."""
+        repo.listar_todos()
+        
+        repo.eliminar(alumno.id)
+        
+        assert repo.listar_todos() == []
+    
+    def test_version_recibida_no_se_relee(self, repo, alumno):
+        """Verifica que con la version de la ruta (ETag) no hay otra lectura."""
+        version = repo.obtener_version()
+        repo.listar_todos(version)
+        
+        with patch.object(repo._repository, 'obtener_version') as obtener:
+            assert [a.id for a in repo.listar_todos(version)] == [alumno.id]
+        
+        obtener.assert_not_called()
+        assert repo.estadisticas()['hits'] == 1
+    
+    def test_sin_version_no_cachea(self, repo, alumno):
+        """Verifica que sin table_versions cada llamada va al repositorio."""
+        with patch.object(repo._repository, 'obtener_version', return_value=None):
+            repo.listar_todos()
+            repo.listar_todos()
+        
+        assert repo.estadisticas()['hits'] == 0
+    
+    def test_modificar_el_resultado_no_altera_el_cache(self, repo, alumno):
+        """Verifica que cada llamada recibe su propia lista."""
+        repo.listar_todos().clear()
+        
+        assert len(repo.listar_todos()) == 1
+
+
+class TestPoliticas:
+    """Tests de LRU y TTL."""
+    
+    def test_entrada_vencida_es_miss(self, repo, alumno, reloj):
+        """Verifica que pasado el TTL se vuelve a leer del repositorio."""
+        repo.obtener_por_id(alumno.id)
+        reloj.ahora = 11
+        
+        repo.obtener_por_id(alumno.id)
+        
+        stats = repo.estadisticas()
+        assert stats['misses'] == 2
+        assert stats['evictions'] == 1
+    
+    def test_lru_respeta_tamano_maximo(self, repo):
+        """Verifica que el cache no supera max_size."""
+        for i in range(5):
+            creado = repo.crear(Alumno(nombre="Ana", apellido="Lopez", dni=f"3000000{i}"))
+            repo.obtener_por_id(creado.id)
+        
+        stats = repo.estadisticas()
+        assert stats['size'] == 4
+        assert stats['evictions'] > 0
+
+
+# ===========================================================================
+# Ejecucion directa (para debug)
+# ===========================================================================
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
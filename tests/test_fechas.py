@@ -0,0 +1,67 @@
+# ===========================================================================
+# Tests del Codec de Fechas
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Fase: 5 - Testing Formal
+# ===========================================================================
+#
+# REGLAS DE TESTING:
+# - Tests aislados (sin dependencias externas)
+# - El camino de Python < 3.11 se prueba directo con _normalizar
+#
+# ===========================================================================
+
+"""
+Tests de domain/entities/fechas.py.
+"""
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from datetime import datetime, timezone
+
+import pytest
+
+from domain.entities.fechas import _normalizar, formatear_fecha, parsear_fecha
+
+
+class TestParsearFecha:
+    """Tests de parsear_fecha."""
+    
+    def test_formato_postgrest(self):
+        fecha = parsear_fecha('2024-03-01T12:34:56.123456+00:00')
+        
+        assert fecha == datetime(2024, 3, 1, 12, 34, 56, 123456, tzinfo=timezone.utc)
+    
+    def test_z_y_fraccion_corta(self):
+        fecha = parsear_fecha('2024-03-01T12:34:56.12Z')
+        
+        assert fecha == datetime(2024, 3, 1, 12, 34, 56, 120000, tzinfo=timezone.utc)
+    
+    def test_normaliza_para_python_anterior(self):
+        assert _normalizar('2024-03-01T12:34:56.12Z') == '2024-03-01T12:34:56.120000+00:00'
+        assert _normalizar('2024-03-01T12:34:56+00:00') == '2024-03-01T12:34:56+00:00'
+    
+    def test_repite_desde_cache(self):
+        texto = '2031-07-07T07:07:07.777+00:00'
+        
+        assert parsear_fecha(texto) is parsear_fecha(texto)
+    
+    def test_texto_invalido(self):
+        with pytest.raises(ValueError):
+            parsear_fecha('ayer')
+
+
+class TestFormatearFecha:
+    """Tests de formatear_fecha."""
+    
+    def test_datetime_a_isoformat(self):
+        fecha = datetime(2024, 3, 1, tzinfo=timezone.utc)
+        
+        assert formatear_fecha(fecha) == '2024-03-01T00:00:00+00:00'
+    
+    def test_texto_y_none_pasan_tal_cual(self):
+        assert formatear_fecha('2024-03-01T00:00:00Z') == '2024-03-01T00:00:00Z'
+        assert formatear_fecha(None) is None
@@ -0,0 +1,148 @@
+# ===========================================================================
+# Tests del Transporte HTTP del Cliente Supabase
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Fase: 5 - Testing Formal
+# ===========================================================================
+#
+# REGLAS DE TESTING:
+# - Sin red: httpx.MockTransport responde en memoria
+# - Espera inyectada: los tests de backoff no usan sleep
+#
+# ===========================================================================
+
+"""
+Tests unitarios para RetryTransport, crear_http_client y get_pool_stats.
+
+Verifica que solo se reintentan lecturas idempotentes, el backoff
+exponencial y los contadores que se publican en el health check.
+"""
+
+import pytest
+from unittest.mock import patch
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+from infrastructure import supabase_client
+from infrastructure.http_transport import RetryTransport, crear_http_client
+
+
+URL = 'https://ejemplo.supabase.co/rest/v1/alumnos'
+
+
+class ServidorFalso:
+    """Responde una secuencia de status (o excepciones) y registra los pedidos."""
+    
+    def __init__(self, *respuestas):
+        self.respuestas = list(respuestas)
+        self.pedidos = []
+    
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.pedidos.append(request.method)
+        respuesta = self.respuestas.pop(0)
+        if isinstance(respuesta, Exception):
+            raise respuesta
+        return httpx.Response(respuesta, json=[])
+
+
+@pytest.fixture
+def esperas():
+    """Registra las esperas de backoff en lugar de dormir."""
+    return []
+
+
+def _cliente(servidor, esperas, reintentos=2):
+    """Cliente httpx con RetryTransport sobre el servidor falso."""
+    transporte = RetryTransport(
+        httpx.MockTransport(servidor),
+        reintentos=reintentos,
+        backoff=0.1,
+        dormir=esperas.append
+    )
+    return crear_http_client(transporte), transporte
+
+
+class TestReintentos:
+    """Tests de reintentos con backoff."""
+    
+    def test_get_reintenta_503_con_backoff_exponencial(self, esperas):
+        servidor = ServidorFalso(503, 503, 200)
+        cliente, transporte = _cliente(servidor, esperas)
+        
+        response = cliente.get(URL)
+        
+        assert response.status_code == 200
+        assert esperas == [0.1, 0.2]
+        assert transporte.estadisticas()['reintentos'] == 2
+    
+    def test_get_reintenta_timeout_de_lectura(self, esperas):
+        servidor = ServidorFalso(httpx.ReadTimeout('lento'), 200)
+        cliente, _ = _cliente(servidor, esperas)
+        
+        assert cliente.get(URL).status_code == 200
+        assert servidor.pedidos == ['GET', 'GET']
+    
+    def test_agotados_los_reintentos_retorna_ultima_respuesta(self, esperas):
+        servidor = ServidorFalso(503, 503, 503)
+        cliente, _ = _cliente(servidor, esperas)
+        
+        assert cliente.get(URL).status_code == 503
+        assert len(servidor.pedidos) == 3
+    
+    def test_agotados_los_reintentos_propaga_el_error(self, esperas):
+        servidor = ServidorFalso(*[httpx.ReadTimeout('lento')] * 3)
+        cliente, transporte = _cliente(servidor, esperas)
+        
+        with pytest.raises(httpx.ReadTimeout):
+            cliente.get(URL)
+        
+        assert transporte.estadisticas()['fallidos'] == 1
+    
+    @pytest.mark.parametrize('metodo', ['post', 'patch', 'delete'])
+    def test_escrituras_no_se_reintentan(self, esperas, metodo):
+        servidor = ServidorFalso(503)
+        cliente, _ = _cliente(servidor, esperas)
+        
+        response = getattr(cliente, metodo)(URL)
+        
+        assert response.status_code == 503
+        assert len(servidor.pedidos) == 1
+        assert esperas == []
+    
+    def test_error_no_transitorio_no_se_reintenta(self, esperas):
+        servidor = ServidorFalso(404)
+        cliente, _ = _cliente(servidor, esperas)
+        
+        assert cliente.get(URL).status_code == 404
+        assert len(servidor.pedidos) == 1
+
+
+class TestEstadisticas:
+    """Tests de las estadisticas del pool."""
+    
+    def test_contadores_y_conexiones(self, esperas):
+        cliente, transporte = _cliente(ServidorFalso(200, 200), esperas)
+        cliente.get(URL)
+        cliente.get(URL)
+        
+        stats = transporte.estadisticas()
+        
+        assert stats['requests'] == 2
+        assert stats['reintentos'] == 0
+        assert stats['conexiones'] == {'abiertas': 0, 'ociosas': 0, 'en_uso': 0}
+    
+    def test_get_pool_stats_sin_cliente_es_none(self):
+        supabase_client.reset_client()
+        
+        assert supabase_client.get_pool_stats() is None
+    
+    def test_get_pool_stats_con_cliente_creado(self, esperas):
+        _, transporte = _cliente(ServidorFalso(), esperas)
+        
+        with patch.object(supabase_client, '_transporte', transporte):
+            assert supabase_client.get_pool_stats()['requests'] == 0
@@ -0,0 +1,96 @@
+# ===========================================================================
+# Tests del Proveedor JSON
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Fase: 5 - Testing Formal
+# ===========================================================================
+#
+# REGLAS DE TESTING:
+# - Cada caso se corre con orjson y con la stdlib (orjson = None)
+# - Las dos salidas deben decodificar al mismo JSON
+#
+# ===========================================================================
+
+"""
+Tests de api/json_provider.py.
+"""
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+
+import api.json_provider as json_provider
+from api.json_provider import AlumnoJSONProvider
+from domain.entities.alumno import Alumno
+
+
+FECHA = datetime(2024, 3, 1, 12, 34, 56, 123456, tzinfo=timezone.utc)
+
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def app(request):
+    """App Flask con el proveedor, con y sin orjson."""
+    if request.param == 'orjson' and json_provider.orjson is None:
+        pytest.skip("orjson no instalado")
+    
+    app = Flask(__name__)
+    app.json = AlumnoJSONProvider(app)
+    
+    if request.param == 'stdlib':
+        with patch.object(json_provider, 'orjson', None):
+            yield app
+    else:
+        yield app
+
+
+def _alumnos():
+    return [
+        Alumno.from_db_row('a1', 'Ana', 'Lopez', '1', FECHA, FECHA),
+        Alumno.from_db_dict({
+            'id': 'a2', 'nombre': 'José', 'apellido': 'Núñez', 'dni': '2',
+            'created_at': '2024-03-01T12:34:56.12+00:00', 'updated_at': None
+        })
+    ]
+
+
+class TestAlumnoJSONProvider:
+    """Tests de jsonify() con el proveedor registrado."""
+    
+    def test_codifica_alumnos_como_to_dict(self, app):
+        alumnos = _alumnos()
+        
+        with app.app_context():
+            respuesta = app.json.response(alumnos)
+        
+        assert respuesta.mimetype == 'application/json'
+        assert json.loads(respuesta.get_data()) == [a.to_dict() for a in alumnos]
+    
+    def test_no_ordena_claves(self, app):
+        with app.app_context():
+            cuerpo = app.json.response(_alumnos()[0]).get_data(as_text=True)
+        
+        assert cuerpo.index('"nombre"') < cuerpo.index('"apellido"')
+    
+    def test_fechas_sueltas_en_iso8601(self, app):
+        with app.app_context():
+            datos = json.loads(app.json.response({'timestamp': FECHA}).get_data())
+        
+        assert datos == {'timestamp': FECHA.isoformat()}
+    
+    def test_dumps_con_argumentos_usa_la_stdlib(self, app):
+        with app.app_context():
+            texto = app.json.dumps({'b': 1, 'a': 2}, sort_keys=True)
+        
+        assert texto == '{"a": 2, "b": 1}'
+    
+    def test_tipo_desconocido_falla(self, app):
+        with app.app_context(), pytest.raises(TypeError):
+            app.json.response({'x': object()})
@@ -0,0 +1,221 @@
+# ===========================================================================
+# Tests del Almacen de Claves JWKS
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Fase: 5 - Testing Formal
+# ===========================================================================
+#
+# REGLAS DE TESTING:
+# - Sin red: el JWKS es un archivo temporal generado en cada test
+# - Las claves RSA/EC se generan al vuelo (nada secreto en el repo)
+#
+# ===========================================================================
+
+"""
+Tests unitarios para JWKSKeyStore y la verificacion RS256/ES256.
+
+Verifica la carga por 'kid', el refresco en segundo plano y que la
+verificacion nunca descarga claves.
+"""
+
+import json
+import logging
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import jwt
+
+pytest.importorskip('cryptography')
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+from api.asgi import create_asgi_app
+from api.index import create_app
+from api.middleware import auth
+from domain.exceptions import AuthenticationError
+from infrastructure.jwks_key_store import JWKSKeyStore
+
+
+def _jwk_publica(clave_privada, kid: str, alg: str) -> dict:
+    """Exporta la clave publica como JWK con kid y alg."""
+    if alg == 'RS256':
+        jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(clave_privada.public_key()))
+    else:
+        jwk = json.loads(jwt.algorithms.ECAlgorithm.to_jwk(clave_privada.public_key()))
+    jwk.update(kid=kid, alg=alg, use='sig')
+    return jwk
+
+
+def _escribir_jwks(ruta: Path, *jwks: dict) -> None:
+    """Guarda un documento JWKS en disco."""
+    ruta.write_text(json.dumps({'keys': list(jwks)}), encoding='utf-8')
+
+
+def _firmar(clave_privada, kid: str, alg: str) -> str:
+    """Crea un JWT firmado con la clave privada."""
+    payload = {'sub': 'user-123', 'exp': int(time.time()) + 3600}
+    return jwt.encode(payload, clave_privada, algorithm=alg, headers={'kid': kid})
+
+
+@pytest.fixture
+def rsa_key():
+    """Clave privada RSA de prueba."""
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def ec_key():
+    """Clave privada EC P-256 de prueba."""
+    return ec.generate_private_key(ec.SECP256R1())
+
+
+@pytest.fixture
+def jwks_file(tmp_path, rsa_key, ec_key):
+    """JWKS local con una clave RSA y una EC."""
+    ruta = tmp_path / 'jwks.json'
+    _escribir_jwks(
+        ruta,
+        _jwk_publica(rsa_key, 'rsa-1', 'RS256'),
+        _jwk_publica(ec_key, 'ec-1', 'ES256')
+    )
+    return ruta
+
+
+@pytest.fixture
+def store(jwks_file):
+    """Almacen cargado e instalado en el middleware."""
+    store = JWKSKeyStore(str(jwks_file), intervalo_refresco=0.05)
+    store.cargar()
+    auth.reset_token_cache()
+    auth.set_jwks_store(store)
+    yield store
+    auth.set_jwks_store(None)
+    auth.reset_token_cache()
+
+
+class TestJWKSKeyStore:
+    """Tests de carga y refresco."""
+    
+    def test_carga_claves_por_kid(self, jwks_file):
+        """Verifica que cada clave queda indexada por su kid."""
+        store = JWKSKeyStore(str(jwks_file))
+        
+        assert store.cargar() == 2
+        assert store.get_key('rsa-1').algorithm_name == 'RS256'
+        assert store.get_key('ec-1').algorithm_name == 'ES256'
+        assert store.get_key('otro') is None
+    
+    def test_refresco_en_segundo_plano(self, store, jwks_file, rsa_key):
+        """Verifica que una clave nueva aparece sin llamar a cargar()."""
+        _escribir_jwks(jwks_file, _jwk_publica(rsa_key, 'rsa-2', 'RS256'))
+        
+        store.iniciar_refresco()
+        limite = time.time() + 2
+        while store.get_key('rsa-2') is None and time.time() < limite:
+            time.sleep(0.01)
+        store.detener_refresco()
+        
+        assert store.get_key('rsa-2') is not None
+    
+    def test_refresco_fallido_conserva_claves(self, store, jwks_file):
+        """Verifica que si el JWKS no se puede leer quedan las claves viejas."""
+        jwks_file.write_text('no es json', encoding='utf-8')
+        
+        with pytest.raises(ValueError):
+            store.cargar()
+        
+        assert store.get_key('rsa-1') is not None
+
+
+class TestValidateJwtAsimetrico:
+    """Tests de _validate_jwt con RS256/ES256."""
+    
+    @pytest.mark.parametrize('alg', ['RS256', 'ES256'])
+    def test_token_asimetrico_valido(self, store, rsa_key, ec_key, alg):
+        """Verifica que se acepta un token firmado con una clave del JWKS."""
+        clave, kid = (rsa_key, 'rsa-1') if alg == 'RS256' else (ec_key, 'ec-1')
+        
+        payload = auth._validate_jwt(_firmar(clave, kid, alg))
+        
+        assert payload['sub'] == 'user-123'
+    
+    def test_kid_desconocido_no_descarga(self, store, rsa_key):
+        """Verifica que un kid desconocido se rechaza sin leer el JWKS."""
+        token = _firmar(rsa_key, 'kid-inventado', 'RS256')
+        
+        with patch.object(store, '_leer_documento') as leer:
+            with pytest.raises(AuthenticationError):
+                auth._validate_jwt(token)
+        
+        leer.assert_not_called()
+    
+    def test_firma_con_otra_clave_falla(self, store):
+        """Verifica que un kid valido con firma ajena se rechaza."""
+        otra = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        
+        with pytest.raises(AuthenticationError):
+            auth._validate_jwt(_firmar(otra, 'rsa-1', 'RS256'))
+    
+    def test_sin_jwks_se_rechaza(self, rsa_key):
+        """Verifica que sin JWKS configurado los tokens RS256 fallan."""
+        auth.reset_token_cache()
+        
+        with pytest.raises(AuthenticationError):
+            auth._validate_jwt(_firmar(rsa_key, 'rsa-1', 'RS256'))
+
+
+
+class TestConfigureJwksAlCrearLaApp:
+    """configure_jwks corre fuera del fallback de 'sin .env'."""
+    
+    @pytest.fixture
+    def config(self):
+        config = MagicMock(
+            FLASK_SECRET_KEY='secreto-real',
+            FLASK_DEBUG=False,
+            PREWARM_ON_START=False,
+            SUPABASE_JWKS_URL=None
+        )
+        with patch('infrastructure.config.get_config', return_value=config):
+            yield config
+    
+    def test_flask_configura_jwks_sin_tocar_debug(self, config):
+        with patch('api.middleware.auth.configure_jwks') as configure:
+            app = create_app()
+        
+        configure.assert_called_once_with(config)
+        assert app.config['SECRET_KEY'] == 'secreto-real'
+        assert app.config['DEBUG'] is False
+    
+    def test_flask_error_de_jwks_no_activa_modo_desarrollo(self, config):
+        with patch('api.middleware.auth.configure_jwks', side_effect=ImportError('jwt')):
+            with pytest.raises(ImportError):
+                create_app()
+    
+    def test_carga_fallida_queda_en_el_log(self, tmp_path, caplog):
+        config = MagicMock(SUPABASE_JWKS_URL=str(tmp_path / 'no-existe.json'), JWKS_REFRESH_SECONDS=3600)
+        
+        with caplog.at_level(logging.WARNING, logger='api.middleware.auth'):
+            auth.configure_jwks(config)
+        auth._jwks_store.detener_refresco()
+        auth.set_jwks_store(None)
+        
+        assert caplog.records[0].levelname == 'WARNING'
+        assert 'No se pudo cargar el JWKS' in caplog.text
+    
+    def test_asgi_error_de_jwks_no_activa_modo_desarrollo(self, config):
+        with patch('api.middleware.auth.configure_jwks', side_effect=ImportError('jwt')):
+            with pytest.raises(ImportError):
+                create_asgi_app(MagicMock())
+
+
+# ===========================================================================
+# Ejecucion directa (para debug)
+# ===========================================================================
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
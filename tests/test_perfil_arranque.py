@@ -0,0 +1,59 @@
+# ===========================================================================
+# Tests del Perfil de Arranque
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Fase: 5 - Testing Formal
+# ===========================================================================
+#
+# REGLAS DE TESTING:
+# - El import se mide en un interprete nuevo (subprocess)
+# - No se verifica el tiempo (depende de la maquina), solo que los
+#   modulos pesados sigan siendo lazy
+#
+# ===========================================================================
+
+"""
+Tests de api/perfil_arranque.py y de los imports lazy del arranque.
+"""
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.perfil_arranque import (
+    MODULOS_LAZY,
+    costo_por_paquete,
+    medir_importacion,
+    parsear_importtime
+)
+
+
+SALIDA = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   flask.json
+import time:       300 |        420 | flask
+import time:        50 |        470 | api.index
+"""
+
+
+class TestParseo:
+    """Tests del parseo de -X importtime."""
+    
+    def test_ignora_encabezado(self):
+        filas = parsear_importtime(SALIDA)
+        
+        assert filas[0] == ('flask.json', 120, 120)
+        assert len(filas) == 3
+    
+    def test_agrupa_por_paquete_raiz(self):
+        assert costo_por_paquete(parsear_importtime(SALIDA)) == {'flask': 420, 'api': 50}
+
+
+class TestArranque:
+    """Tests del import real del entry point."""
+    
+    def test_no_importa_modulos_lazy(self):
+        cargados = {nombre for nombre, _, _ in medir_importacion('api.index')}
+        
+        assert 'api.index' in cargados
+        assert [m for m in MODULOS_LAZY if m in cargados] == []
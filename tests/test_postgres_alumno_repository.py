@@ -0,0 +1,232 @@
+# ===========================================================================
+# Tests del Repositorio PostgreSQL
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Fase: 5 - Testing Formal
+# ===========================================================================
+#
+# REGLAS DE TESTING:
+# - Sin BD: un pool falso registra el SQL y devuelve filas preparadas
+# - Con BD: si PG_TEST_DSN apunta a un Postgres con init.sql aplicado
+#   (por ejemplo un contenedor local), corren tambien los tests de integracion
+#
+# ===========================================================================
+
+"""
+Tests unitarios y de integracion para PostgresAlumnoRepository.
+
+Verifica traduccion de errores, decodificacion de filas y COPY.
+"""
+
+import os
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+psycopg = pytest.importorskip('psycopg')
+
+from domain.entities.alumno import Alumno
+from domain.exceptions import (
+    AlumnoNoEncontrado,
+    DNIDuplicado,
+    ModificacionConcurrente,
+    RepositoryError
+)
+from infrastructure.postgres_alumno_repository import SQL_VERSION, PostgresAlumnoRepository
+
+
+AHORA = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _fila(dni='12345678', id=None):
+    """Fila como la devuelve el cursor binario (UUID y datetime nativos)."""
+    return (id or uuid.uuid4(), 'Juan', 'Perez', dni, AHORA, AHORA)
+
+
+class CursorFalso:
+    """Cursor que responde con resultados encolados."""
+    
+    def __init__(self, pool):
+        self._pool = pool
+        self._filas = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        return False
+    
+    def execute(self, consulta, parametros=()):
+        self._pool.ejecutadas.append((consulta, parametros))
+        respuesta = self._pool.respuestas.pop(0)
+        if isinstance(respuesta, Exception):
+            raise respuesta
+        self._filas = respuesta
+    
+    def fetchone(self):
+        return self._filas[0] if self._filas else None
+    
+    def fetchall(self):
+        return list(self._filas)
+    
+    @contextmanager
+    def copy(self, consulta):
+        copia = CopiaFalsa()
+        yield copia
+        self._pool.copiadas.extend(copia.filas)
+
+
+class CopiaFalsa:
+    """Destino de COPY que solo guarda las filas."""
+    
+    def __init__(self):
+        self.filas = []
+    
+    def set_types(self, tipos):
+        pass
+    
+    def write_row(self, fila):
+        self.filas.append(fila)
+
+
+class PoolFalso:
+    """Stand-in de ConnectionPool: una conexion que devuelve CursorFalso."""
+    
+    def __init__(self, *respuestas):
+        self.respuestas = list(respuestas)
+        self.ejecutadas = []
+        self.copiadas = []
+    
+    @contextmanager
+    def connection(self):
+        yield self
+    
+    def cursor(self, binary=False):
+        assert binary, "el repositorio debe pedir resultados binarios"
+        return CursorFalso(self)
+    
+    def close(self):
+        pass
+
+
+class TestConPoolFalso:
+    """Tests sin base de datos."""
+    
+    def test_crear_traduce_unique_violation(self):
+        repo = PostgresAlumnoRepository(pool=PoolFalso(psycopg.errors.UniqueViolation('dup')))
+        
+        with pytest.raises(DNIDuplicado):
+            repo.crear(Alumno(nombre="Juan", apellido="Perez", dni="1"))
+    
+    def test_error_de_bd_es_repository_error(self):
+        repo = PostgresAlumnoRepository(pool=PoolFalso(psycopg.OperationalError('caida')))
+        
+        with pytest.raises(RepositoryError):
+            repo.listar_todos()
+    
+    def test_obtener_por_id_decodifica_fila(self):
+        id = uuid.uuid4()
+        repo = PostgresAlumnoRepository(pool=PoolFalso([_fila(id=id)]))
+        
+        alumno = repo.obtener_por_id(str(id))
+        
+        assert alumno.id == str(id)
+        assert alumno.updated_at == AHORA
+    
+    def test_listar_filas_serializa_uuid_y_fechas(self):
+        id = uuid.uuid4()
+        repo = PostgresAlumnoRepository(pool=PoolFalso([(id, AHORA)]))
+        
+        filas = repo.listar_filas(['id', 'created_at'])
+        
+        assert filas == [{'id': str(id), 'created_at': AHORA.isoformat()}]
+    
+    def test_actualizar_con_precondicion_vieja(self):
+        repo = PostgresAlumnoRepository(pool=PoolFalso([], [_fila()]))
+        alumno = Alumno(nombre="Juan", apellido="Perez", dni="1", id=str(uuid.uuid4()))
+        
+        with pytest.raises(ModificacionConcurrente):
+            repo.actualizar(alumno, AHORA)
+    
+    def test_actualizar_inexistente(self):
+        repo = PostgresAlumnoRepository(pool=PoolFalso([]))
+        alumno = Alumno(nombre="Juan", apellido="Perez", dni="1", id=str(uuid.uuid4()))
+        
+        with pytest.raises(AlumnoNoEncontrado):
+            repo.actualizar(alumno)
+    
+    def test_crear_lote_usa_copy_y_respeta_orden(self):
+        pool = PoolFalso([], [_fila(dni='333'), _fila(dni='111')])
+        repo = PostgresAlumnoRepository(pool=pool)
+        
+        creados = repo.crear_lote([
+            Alumno(nombre="A", apellido="A", dni="111"),
+            Alumno(nombre="B", apellido="B", dni="222"),
+            Alumno(nombre="C", apellido="C", dni="333"),
+        ])
+        
+        assert [fila[3] for fila in pool.copiadas] == ['111', '222', '333']
+        assert [a.dni for a in creados] == ['111', '333']
+    
+    def test_obtener_firma_una_sola_consulta(self):
+        pool = PoolFalso([(3, AHORA)])
+        repo = PostgresAlumnoRepository(pool=pool)
+        
+        assert repo.obtener_firma() == (3, AHORA)
+        assert pool.ejecutadas == [('SELECT count(*), max(updated_at) FROM alumnos', ())]
+    
+    def test_obtener_version_lee_table_versions(self):
+        pool = PoolFalso([(7,)])
+        repo = PostgresAlumnoRepository(pool=pool)
+        
+        assert repo.obtener_version() == 7
+        assert pool.ejecutadas == [(SQL_VERSION, ())]
+    
+    def test_obtener_version_sin_fila(self):
+        assert PostgresAlumnoRepository(pool=PoolFalso([])).obtener_version() is None
+
+
+@pytest.mark.skipif(not os.getenv('PG_TEST_DSN'), reason="PG_TEST_DSN no configurada")
+class TestConPostgres:
+    """Tests de integracion contra un PostgreSQL real."""
+    
+    @pytest.fixture
+    def repo(self):
+        repositorio = PostgresAlumnoRepository(os.environ['PG_TEST_DSN'], max_size=2)
+        with repositorio._pool.connection() as conexion:
+            conexion.execute('TRUNCATE alumnos')
+        yield repositorio
+        repositorio.cerrar()
+    
+    def test_crud_completo(self, repo):
+        creado = repo.crear(Alumno(nombre="Juan", apellido="Perez", dni="12345678"))
+        
+        with pytest.raises(DNIDuplicado):
+            repo.crear(Alumno(nombre="Otro", apellido="Gomez", dni="12345678"))
+        
+        actualizado = repo.actualizar(creado.actualizar(nombre="Juan Carlos"), creado.updated_at)
+        assert actualizado.nombre == "Juan Carlos"
+        
+        with pytest.raises(ModificacionConcurrente):
+            repo.actualizar(creado.actualizar(nombre="Tarde"), creado.updated_at)
+        
+        assert repo.eliminar(creado.id) is True
+        assert repo.obtener_por_id(creado.id) is None
+    
+    def test_crear_lote_y_dnis(self, repo):
+        repo.crear(Alumno(nombre="Ana", apellido="Lopez", dni="111"))
+        
+        creados = repo.crear_lote([
+            Alumno(nombre="Juan", apellido="Perez", dni="222"),
+            Alumno(nombre="Otra", apellido="Lopez", dni="111"),
+        ])
+        
+        assert [a.dni for a in creados] == ["222"]
+        assert repo.existe_dni_many(["111", "222", "999"]) == {"111", "222"}
@@ -0,0 +1,166 @@
+# ===========================================================================
+# Tests de Precalentamiento y Seguridad ante Fork
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Fase: 5 - Testing Formal
+# ===========================================================================
+#
+# REGLAS DE TESTING:
+# - Sin credenciales reales: servicio con MockAlumnoRepository
+# - El fork se simula cambiando el PID; un solo test hace un fork real
+#
+# ===========================================================================
+
+"""
+Tests de api/prewarm.py y del comportamiento despues de un fork de
+ServiceRegistry, supabase_client y JWKSKeyStore.
+"""
+
+import logging
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.index import create_app
+from api.prewarm import precalentar
+from application.alumno_service import AlumnoService
+from application.service_registry import ServiceRegistry
+from domain.repositories.alumno_repository import MockAlumnoRepository
+from infrastructure import supabase_client
+from infrastructure.jwks_key_store import JWKSKeyStore
+
+
+def _registry_mock():
+    """Registro que construye servicios sobre MockAlumnoRepository."""
+    return ServiceRegistry(lambda: AlumnoService(MockAlumnoRepository()))
+
+
+class TestPrecalentar:
+    """Tests de precalentar()."""
+    
+    def test_recorre_todos_los_pasos(self):
+        app = create_app()
+        service = MagicMock()
+        app.extensions['service_registry'].reset(service)
+        
+        with patch('infrastructure.config.get_config'):
+            tiempos = precalentar(app)
+        
+        assert list(tiempos) == ['config', 'jwt', 'servicio', 'conexion']
+        service.listar_alumnos_paginado.assert_called_once_with(limite=1)
+    
+    def test_carga_pyjwt(self):
+        app = create_app()
+        app.extensions['service_registry'].reset(MagicMock())
+        
+        # Simula un worker recien arrancado: jwt todavia sin importar
+        sin_jwt = {k: v for k, v in sys.modules.items() if k != 'jwt' and not k.startswith('jwt.')}
+        with patch.dict(sys.modules, sin_jwt, clear=True), \
+             patch('infrastructure.config.get_config'):
+            precalentar(app)
+            
+            assert 'jwt' in sys.modules
+            assert 'jwt.algorithms' in sys.modules
+    
+    def test_un_error_no_impide_arrancar(self, caplog):
+        app = create_app()
+        service = MagicMock()
+        service.listar_alumnos_paginado.side_effect = ConnectionError("sin BD")
+        app.extensions['service_registry'].reset(service)
+        
+        with patch('infrastructure.config.get_config'), \
+             caplog.at_level(logging.WARNING, logger='api.prewarm'):
+            tiempos = precalentar(app)
+        
+        assert tiempos['error'] == "sin BD"
+        assert 'conexion' not in tiempos
+        assert 'Precalentamiento incompleto: sin BD' in caplog.text
+
+
+class TestServiceRegistryFork:
+    """Tests del registro despues de un fork."""
+    
+    def test_cambio_de_pid_reconstruye_el_servicio(self):
+        registry = _registry_mock()
+        del_padre = registry.get_alumno_service()
+        
+        with patch('application.service_registry.os.getpid', return_value=-1):
+            del_hijo = registry.get_alumno_service()
+            
+            assert del_hijo is not del_padre
+            assert registry.get_alumno_service() is del_hijo
+    
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason="requiere os.fork")
+    def test_fork_real(self):
+        registry = _registry_mock()
+        del_padre = registry.get_alumno_service()
+        
+        pid = os.fork()
+        if pid == 0:
+            # Proceso hijo: el codigo de salida informa el resultado
+            os._exit(0 if registry.get_alumno_service() is not del_padre else 1)
+        
+        _, estado = os.waitpid(pid, 0)
+        
+        assert os.waitstatus_to_exitcode(estado) == 0
+        assert registry.get_alumno_service() is del_padre
+
+
+class TestSupabaseClientFork:
+    """Tests del singleton del cliente despues de un fork."""
+    
+    def test_hijo_descarta_sin_cerrar(self):
+        transporte = MagicMock()
+        
+        with patch.object(supabase_client, '_supabase_client', MagicMock()), \
+             patch.object(supabase_client, '_transporte', transporte), \
+             patch.object(supabase_client, '_pid', -1):
+            supabase_client.reset_client()
+            
+            assert supabase_client._supabase_client is None
+            assert supabase_client.get_pool_stats() is None
+        
+        transporte.close.assert_not_called()
+    
+    def test_mismo_proceso_cierra(self):
+        transporte = MagicMock()
+        
+        with patch.object(supabase_client, '_supabase_client', MagicMock()), \
+             patch.object(supabase_client, '_transporte', transporte), \
+             patch.object(supabase_client, '_pid', os.getpid()):
+            supabase_client.reset_client()
+        
+        transporte.close.assert_called_once()
+
+
+class TestJWKSFork:
+    """Tests del almacen de claves despues de un fork."""
+    
+    def test_relanza_el_refresco(self, tmp_path):
+        archivo = tmp_path / 'jwks.json'
+        archivo.write_text('{"keys": []}')
+        store = JWKSKeyStore(str(archivo), intervalo_refresco=60)
+        store.iniciar_refresco()
+        anterior, detener_anterior = store._thread, store._detener
+        
+        try:
+            store.despues_de_fork()
+            
+            assert store._thread is not anterior
+            assert store._thread.is_alive()
+        finally:
+            store.detener_refresco()
+            detener_anterior.set()
+            anterior.join(timeout=1)
+    
+    def test_sin_refresco_no_lo_inicia(self, tmp_path):
+        store = JWKSKeyStore(str(tmp_path / 'jwks.json'))
+        
+        store.despues_de_fork()
+        
+        assert store._thread is None
@@ -18,6 +18,7 @@ Tests de integracion para los endpoints de la API.
 Usa el test client de Flask para simular peticiones HTTP.
 """
 
+import json
 import pytest
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timezone
@@ -81,6 +82,15 @@ class TestHealthEndpoint:
         
         # Debe funcionar igual
         assert response.status_code == 200
+    
+    def test_health_incluye_pool_http_si_hay_cliente(self, client):
+        """Verifica que health publica las estadisticas del pool HTTP."""
+        stats = {'requests': 3, 'reintentos': 1, 'fallidos': 0}
+        
+        with patch('infrastructure.supabase_client.get_pool_stats', return_value=stats):
+            data = client.get('/api/health').get_json()
+        
+        assert data['http_pool'] == stats
 
 
 class TestConfigEndpoint:
@@ -178,12 +188,15 @@ class TestAlumnosEndpointsConAuthMockeada:
             yield mock
     
     @pytest.fixture
-    def mock_service(self):
-        """Fixture que mockea el servicio de alumnos."""
-        with patch('api.routes.create_alumno_service') as mock:
-            service_mock = MagicMock()
-            mock.return_value = service_mock
-            yield service_mock
+    def mock_service(self, app):
+        """Fixture que inyecta un servicio mock en el registro de la app."""
+        registry = app.extensions['service_registry']
+        service_mock = MagicMock()
+        service_mock.obtener_version_alumnos.return_value = None
+        service_mock.obtener_firma_alumnos.return_value = (0, None)
+        registry.reset(service_mock)
+        yield service_mock
+        registry.reset()
     
     def test_listar_con_auth_mock_retorna_200(self, client, auth_headers, mock_auth, mock_service):
         """Verifica que listar con auth valida retorna 200."""
@@ -204,6 +217,343 @@ class TestAlumnosEndpointsConAuthMockeada:
         data = response.get_json()
         
         assert isinstance(data, list)
+    
+    
+    def test_listar_paginado_retorna_items_y_cursor(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que con limit se retorna el formato paginado."""
+        mock_service.listar_alumnos_paginado.return_value = ([], 'cursor-abc')
+        
+        response = client.get('/api/alumnos?limit=10', headers=auth_headers)
+        data = response.get_json()
+        
+        assert response.status_code == 200
+        assert data == {'items': [], 'next_cursor': 'cursor-abc'}
+        mock_service.listar_alumnos_paginado.assert_called_once_with(
+            limite=10, cursor=None
+        )
+    
+    def test_listar_con_fields_usa_proyeccion(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que fields pide solo esas columnas al servicio."""
+        mock_service.listar_alumnos_campos.return_value = [{'id': '1', 'dni': '1'}]
+        
+        response = client.get('/api/alumnos?fields=id,dni', headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert response.get_json() == [{'id': '1', 'dni': '1'}]
+        mock_service.listar_alumnos_campos.assert_called_once_with(['id', 'dni'])
+        mock_service.listar_alumnos.assert_not_called()
+    
+    def test_listar_limit_no_numerico_retorna_400(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que un limit no numerico retorna 400."""
+        response = client.get('/api/alumnos?limit=abc', headers=auth_headers)
+        
+        assert response.status_code == 400
+        assert response.get_json()['campo'] == 'limit'
+    
+    
+    def test_importar_json_retorna_resumen(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que batch con array JSON retorna resumen y resultados."""
+        from domain.entities.alumno import Alumno
+        from domain.exceptions import DNIDuplicado
+        mock_service.crear_alumnos_lote.return_value = [
+            {'fila': 1, 'estado': 'creado',
+             'alumno': Alumno(id='1', nombre='Ana', apellido='Alvarez', dni='1')},
+            {'fila': 2, 'estado': 'dni_duplicado', 'error': DNIDuplicado('2')},
+        ]
+        
+        response = client.post('/api/alumnos/batch', headers=auth_headers, json=[
+            {'nombre': 'Ana', 'apellido': 'Alvarez', 'dni': '1'},
+            {'nombre': 'Juan', 'apellido': 'Perez', 'dni': '2'},
+        ])
+        data = response.get_json()
+        
+        assert response.status_code == 200
+        assert data['resumen'] == {
+            'total': 2, 'creado': 1, 'dni_duplicado': 1, 'error_validacion': 0
+        }
+        assert data['resultados'][1]['error']['codigo'] == 'DNI_DUPLICADO'
+    
+    def test_importar_csv_envia_filas_al_servicio(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que un CSV se convierte en filas nombre/apellido/dni."""
+        mock_service.crear_alumnos_lote.return_value = []
+        headers = dict(auth_headers, **{'Content-Type': 'text/csv'})
+        
+        response = client.post(
+            '/api/alumnos/batch?chunk_size=100',
+            headers=headers,
+            data='\ufeffNombre,Apellido,DNI\nAna,Alvarez,1\n'.encode('utf-8')
+        )
+        
+        assert response.status_code == 200
+        mock_service.crear_alumnos_lote.assert_called_once_with(
+            [{'nombre': 'Ana', 'apellido': 'Alvarez', 'dni': '1'}],
+            tamano_lote=100
+        )
+    
+    def test_importar_body_invalido_retorna_400(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que un body que no es array ni CSV retorna 400."""
+        response = client.post('/api/alumnos/batch', headers=auth_headers, json={
+            'nombre': 'Ana'
+        })
+        
+        assert response.status_code == 400
+    
+    def test_buscar_pasa_q_y_limit_al_servicio(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que /search delega en service.buscar."""
+        mock_service.buscar.return_value = []
+        
+        response = client.get('/api/alumnos/search?q=per&limit=5', headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert response.get_json() == []
+        mock_service.buscar.assert_called_once_with('per', limite=5)
+    
+    def test_exportar_ndjson_una_linea_por_alumno(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que export en NDJSON escribe una linea por alumno."""
+        from domain.entities.alumno import Alumno
+        mock_service.exportar_alumnos.return_value = iter([
+            Alumno(id='1', nombre='Ana', apellido='Alvarez', dni='1'),
+            Alumno(id='2', nombre='Juan', apellido='Perez', dni='2'),
+        ])
+        
+        response = client.get('/api/alumnos/export', headers=auth_headers)
+        lineas = response.get_data(as_text=True).splitlines()
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        assert [json.loads(l)['id'] for l in lineas] == ['1', '2']
+    
+    def test_exportar_json_array_valido(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que export en formato json produce un array valido."""
+        from domain.entities.alumno import Alumno
+        mock_service.exportar_alumnos.return_value = iter([
+            Alumno(id='1', nombre='Ana', apellido='Alvarez', dni='1'),
+        ])
+        
+        response = client.get('/api/alumnos/export?format=json', headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert [a['id'] for a in json.loads(response.get_data(as_text=True))] == ['1']
+    
+    def test_exportar_formato_invalido_retorna_400(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que un formato no soportado retorna 400."""
+        response = client.get('/api/alumnos/export?format=xml', headers=auth_headers)
+        
+        assert response.status_code == 400
+
+    
+    def test_actualizar_envia_if_match_al_servicio(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que If-Match se pasa como updated_at_esperado."""
+        from domain.entities.alumno import Alumno
+        mock_service.actualizar_alumno.return_value = Alumno(
+            id='1', nombre='Ana', apellido='Alvarez', dni='1'
+        )
+        headers = dict(auth_headers, **{'If-Match': '"2025-01-01T00:00:00+00:00"'})
+        
+        response = client.put('/api/alumnos/1', headers=headers, json={
+            'nombre': 'Ana', 'apellido': 'Alvarez', 'dni': '1'
+        })
+        
+        assert response.status_code == 200
+        kwargs = mock_service.actualizar_alumno.call_args.kwargs
+        assert kwargs['updated_at_esperado'] == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    
+    def test_actualizar_if_match_con_fraccion_corta(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que If-Match acepta el updated_at tal como lo devuelve PostgREST."""
+        from domain.entities.alumno import Alumno
+        mock_service.actualizar_alumno.return_value = Alumno(
+            id='1', nombre='Ana', apellido='Alvarez', dni='1'
+        )
+        headers = dict(auth_headers, **{'If-Match': '"2025-01-01T00:00:00.12Z"'})
+        
+        response = client.put('/api/alumnos/1', headers=headers, json={
+            'nombre': 'Ana', 'apellido': 'Alvarez', 'dni': '1'
+        })
+        
+        assert response.status_code == 200
+        kwargs = mock_service.actualizar_alumno.call_args.kwargs
+        assert kwargs['updated_at_esperado'] == datetime(2025, 1, 1, 0, 0, 0, 120000, tzinfo=timezone.utc)
+    
+    def test_actualizar_modificacion_concurrente_retorna_412(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que ModificacionConcurrente se traduce a 412."""
+        from domain.exceptions import ModificacionConcurrente
+        mock_service.actualizar_alumno.side_effect = ModificacionConcurrente('1')
+        
+        response = client.put('/api/alumnos/1', headers=auth_headers, json={
+            'nombre': 'Ana', 'apellido': 'Alvarez', 'dni': '1',
+            'updated_at': '2025-01-01T00:00:00Z'
+        })
+        
+        assert response.status_code == 412
+        assert response.get_json()['codigo'] == 'PRECONDITION_FAILED'
+
+
+class TestValidadoresHTTP:
+    """Tests de ETag / If-None-Match / Last-Modified en las lecturas."""
+    
+    FECHA = datetime(2025, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+    
+    @pytest.fixture
+    def auth_headers(self):
+        return {'Authorization': 'Bearer mock-token'}
+    
+    @pytest.fixture
+    def mock_auth(self):
+        with patch('api.middleware.auth._validate_jwt') as mock:
+            mock.return_value = {
+                'sub': 'user-123',
+                'exp': datetime.now(timezone.utc).timestamp() + 3600
+            }
+            yield mock
+    
+    @pytest.fixture
+    def mock_service(self, app):
+        registry = app.extensions['service_registry']
+        service_mock = MagicMock()
+        service_mock.obtener_version_alumnos.return_value = None
+        service_mock.obtener_firma_alumnos.return_value = (2, self.FECHA)
+        service_mock.listar_alumnos.return_value = []
+        registry.reset(service_mock)
+        yield service_mock
+        registry.reset()
+    
+    def test_listar_retorna_validadores(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica ETag fuerte, Last-Modified y Cache-Control."""
+        response = client.get('/api/alumnos', headers=auth_headers)
+        
+        etag, debil = response.get_etag()
+        assert etag and not debil
+        assert response.last_modified == self.FECHA.replace(microsecond=0)
+        assert response.headers['Cache-Control'] == 'private, no-cache'
+    
+    def test_listar_if_none_match_retorna_304_sin_leer(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que con el ETag vigente no se lista ni serializa."""
+        etag = client.get('/api/alumnos', headers=auth_headers).headers['ETag']
+        
+        response = client.get('/api/alumnos', headers=dict(auth_headers, **{'If-None-Match': etag}))
+        
+        assert response.status_code == 304
+        assert response.get_data() == b''
+        assert response.headers['ETag'] == etag
+        assert mock_service.listar_alumnos.call_count == 1
+    
+    def test_listar_etag_cambia_con_la_firma(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que eliminar (cambia la cantidad) invalida el ETag."""
+        etag = client.get('/api/alumnos', headers=auth_headers).headers['ETag']
+        mock_service.obtener_firma_alumnos.return_value = (1, self.FECHA)
+        
+        response = client.get('/api/alumnos', headers=dict(auth_headers, **{'If-None-Match': etag}))
+        
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+    
+    def test_listar_con_version_no_pide_la_firma(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que con table_versions no hay COUNT(*), ni siquiera en el 304."""
+        mock_service.obtener_version_alumnos.return_value = 7
+        etag = client.get('/api/alumnos', headers=auth_headers).headers['ETag']
+        
+        response = client.get('/api/alumnos', headers=dict(auth_headers, **{'If-None-Match': etag}))
+        
+        assert response.status_code == 304
+        assert 'Last-Modified' not in response.headers
+        mock_service.obtener_firma_alumnos.assert_not_called()
+    
+    def test_listar_pasa_la_version_al_servicio(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que el listado reutiliza la version del ETag (una lectura por request)."""
+        mock_service.obtener_version_alumnos.return_value = 7
+        
+        client.get('/api/alumnos', headers=auth_headers)
+        
+        mock_service.listar_alumnos.assert_called_once_with(7)
+        mock_service.obtener_version_alumnos.assert_called_once_with()
+    
+    def test_listar_etag_cambia_con_la_version(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que cada escritura (sube la version) invalida el ETag."""
+        mock_service.obtener_version_alumnos.return_value = 7
+        etag = client.get('/api/alumnos', headers=auth_headers).headers['ETag']
+        mock_service.obtener_version_alumnos.return_value = 8
+        
+        response = client.get('/api/alumnos', headers=dict(auth_headers, **{'If-None-Match': etag}))
+        
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+    
+    def test_listar_etag_depende_de_los_parametros(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que fields cambia el ETag (otro cuerpo, misma tabla)."""
+        mock_service.listar_alumnos_campos.return_value = []
+        
+        completo = client.get('/api/alumnos', headers=auth_headers).headers['ETag']
+        proyectado = client.get('/api/alumnos?fields=id', headers=auth_headers).headers['ETag']
+        
+        assert completo != proyectado
+    
+    def test_listar_ignora_if_modified_since(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que la fecha sola no alcanza (un DELETE no la cambia)."""
+        headers = dict(auth_headers, **{'If-Modified-Since': 'Wed, 01 Jan 2025 12:00:00 GMT'})
+        
+        response = client.get('/api/alumnos', headers=headers)
+        
+        assert response.status_code == 200
+    
+    def test_obtener_etag_es_updated_at(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica que el ETag del alumno sirve tal cual para If-Match."""
+        from domain.entities.alumno import Alumno
+        mock_service.obtener_alumno.return_value = Alumno(
+            id='1', nombre='Ana', apellido='Alvarez', dni='1',
+            created_at=self.FECHA, updated_at=self.FECHA
+        )
+        
+        response = client.get('/api/alumnos/1', headers=auth_headers)
+        
+        assert response.headers['ETag'] == f'"{self.FECHA.isoformat()}"'
+    
+    def test_obtener_revalida_con_etag_o_fecha(self, client, auth_headers, mock_auth, mock_service):
+        """Verifica 304 con If-None-Match y con If-Modified-Since."""
+        from domain.entities.alumno import Alumno
+        mock_service.obtener_alumno.return_value = Alumno(
+            id='1', nombre='Ana', apellido='Alvarez', dni='1',
+            created_at=self.FECHA, updated_at=self.FECHA
+        )
+        etag = client.get('/api/alumnos/1', headers=auth_headers).headers['ETag']
+        
+        por_etag = client.get('/api/alumnos/1', headers=dict(auth_headers, **{'If-None-Match': etag}))
+        por_fecha = client.get('/api/alumnos/1', headers=dict(
+            auth_headers, **{'If-Modified-Since': 'Wed, 01 Jan 2025 12:00:00 GMT'}
+        ))
+        vieja = client.get('/api/alumnos/1', headers=dict(
+            auth_headers, **{'If-Modified-Since': 'Wed, 01 Jan 2025 11:59:59 GMT'}
+        ))
+        
+        assert por_etag.status_code == 304
+        assert por_fecha.status_code == 304
+        assert vieja.status_code == 200
+
+
+class TestServiceRegistry:
+    """Tests del registro de servicios de la app."""
+    
+    def test_servicio_se_construye_una_vez(self, app):
+        """Verifica que todas las requests comparten el mismo servicio."""
+        from domain.repositories.alumno_repository import MockAlumnoRepository
+        from application.alumno_service import AlumnoService
+        from application.service_registry import ServiceRegistry
+        
+        construcciones = []
+        
+        def factory():
+            construcciones.append(1)
+            return AlumnoService(MockAlumnoRepository())
+        
+        registry = ServiceRegistry(factory)
+        
+        assert registry.get_alumno_service() is registry.get_alumno_service()
+        assert len(construcciones) == 1
+    
+    def test_app_registra_service_registry(self, app):
+        """Verifica que create_app registra el ServiceRegistry."""
+        from application.service_registry import ServiceRegistry
+        
+        assert isinstance(app.extensions['service_registry'], ServiceRegistry)
 
 
 class TestFormatosDeRespuesta:
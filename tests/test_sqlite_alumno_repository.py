@@ -0,0 +1,204 @@
+# ===========================================================================
+# Tests del Repositorio SQLite
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Fase: 5 - Testing Formal
+# ===========================================================================
+#
+# REGLAS DE TESTING:
+# - Cada test usa un archivo SQLite nuevo en tmp_path
+# - Mismo contrato que MockAlumnoRepository y SupabaseAlumnoRepository
+#
+# ===========================================================================
+
+"""
+Tests unitarios para SqliteAlumnoRepository.
+
+Verifica CRUD, lotes, paginacion keyset, busqueda y concurrencia.
+"""
+
+import pytest
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from domain.entities.alumno import Alumno
+from domain.exceptions import DNIDuplicado, ModificacionConcurrente, AlumnoNoEncontrado
+from infrastructure.sqlite_alumno_repository import SqliteAlumnoRepository
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repositorio sobre un archivo SQLite temporal."""
+    repositorio = SqliteAlumnoRepository(str(tmp_path / 'alumnos.db'))
+    yield repositorio
+    repositorio.cerrar()
+
+
+def _alumno(nombre, apellido, dni):
+    return Alumno(nombre=nombre, apellido=apellido, dni=dni)
+
+
+class TestCrud:
+    """Tests de las operaciones basicas."""
+    
+    def test_crear_asigna_id_y_timestamps(self, repo):
+        creado = repo.crear(_alumno("Juan", "Perez", "12345678"))
+        
+        assert creado.id is not None
+        assert creado.created_at is not None
+        assert repo.obtener_por_id(creado.id) == creado
+    
+    def test_crear_dni_duplicado(self, repo):
+        repo.crear(_alumno("Juan", "Perez", "12345678"))
+        
+        with pytest.raises(DNIDuplicado):
+            repo.crear(_alumno("Otro", "Gomez", "12345678"))
+    
+    def test_obtener_por_dni_normaliza(self, repo):
+        repo.crear(_alumno("Juan", "Perez", "ab123"))
+        
+        assert repo.obtener_por_dni(" ab123 ").dni == "AB123"
+    
+    def test_actualizar_y_eliminar(self, repo):
+        creado = repo.crear(_alumno("Juan", "Perez", "12345678"))
+        
+        actualizado = repo.actualizar(creado.actualizar(nombre="Juan Carlos"))
+        assert actualizado.nombre == "Juan Carlos"
+        
+        assert repo.eliminar(creado.id) is True
+        assert repo.eliminar(creado.id) is False
+        assert repo.obtener_por_id(creado.id) is None
+    
+    def test_actualizar_inexistente(self, repo):
+        fantasma = Alumno(nombre="Juan", apellido="Perez", dni="1", id="no-existe")
+        
+        with pytest.raises(AlumnoNoEncontrado):
+            repo.actualizar(fantasma)
+    
+    def test_actualizar_con_precondicion_vieja(self, repo):
+        creado = repo.crear(_alumno("Juan", "Perez", "12345678"))
+        repo.actualizar(creado.actualizar(nombre="Primero"))
+        
+        with pytest.raises(ModificacionConcurrente):
+            repo.actualizar(creado.actualizar(nombre="Segundo"), creado.updated_at)
+    
+    def test_actualizar_a_dni_ajeno(self, repo):
+        repo.crear(_alumno("Ana", "Lopez", "111"))
+        otro = repo.crear(_alumno("Juan", "Perez", "222"))
+        
+        with pytest.raises(DNIDuplicado):
+            repo.actualizar(otro.actualizar(dni="111"))
+    
+    def test_existe_dni_excluye_id(self, repo):
+        creado = repo.crear(_alumno("Juan", "Perez", "12345678"))
+        
+        assert repo.existe_dni("12345678") is True
+        assert repo.existe_dni("12345678", excluir_id=creado.id) is False
+
+
+class TestLotes:
+    """Tests de los caminos masivos."""
+    
+    def test_crear_lote_omite_duplicados(self, repo):
+        repo.crear(_alumno("Ana", "Lopez", "111"))
+        
+        creados = repo.crear_lote([
+            _alumno("Juan", "Perez", "222"),
+            _alumno("Otra", "Lopez", "111"),
+            _alumno("Luis", "Diaz", "333"),
+        ])
+        
+        assert [a.dni for a in creados] == ["222", "333"]
+        assert len(repo.listar_todos()) == 3
+    
+    def test_consultas_por_muchos_dnis(self, repo):
+        repo.crear_lote([_alumno("N", "A", str(i)) for i in range(1200)])
+        
+        dnis = [str(i) for i in range(0, 1300, 2)]
+        
+        assert len(repo.obtener_por_dni_many(dnis)) == 600
+        assert repo.existe_dni_many(["5", "1500"]) == {"5"}
+
+
+class TestListados:
+    """Tests de orden, paginacion, proyeccion y busqueda."""
+    
+    def test_paginacion_keyset(self, repo):
+        for apellido in ["Gomez", "Alvarez", "Perez", "Diaz"]:
+            repo.crear(_alumno("Juan", apellido, apellido.upper()))
+        
+        primera = repo.listar_pagina(2)
+        ultimo = primera[-1]
+        segunda = repo.listar_pagina(2, (ultimo.apellido, ultimo.nombre, ultimo.id))
+        
+        assert [a.apellido for a in primera + segunda] == ["Alvarez", "Diaz", "Gomez", "Perez"]
+    
+    def test_listar_filas_proyecta(self, repo):
+        creado = repo.crear(_alumno("Juan", "Perez", "1"))
+        
+        assert repo.listar_filas(['id', 'dni']) == [{'id': creado.id, 'dni': '1'}]
+        assert repo.obtener_fila_por_id(creado.id, ['nombre']) == {'nombre': 'Juan'}
+    
+    def test_buscar_prioriza_prefijo_de_apellido(self, repo):
+        repo.crear(_alumno("Martinez", "Lopez", "1"))
+        repo.crear(_alumno("Ana", "Martinez", "2"))
+        repo.crear(_alumno("Ana", "Gomez", "3"))
+        
+        resultado = repo.buscar("mart", 10)
+        
+        assert [a.dni for a in resultado] == ["2", "1"]
+    
+    def test_buscar_escapa_comodines(self, repo):
+        repo.crear(_alumno("Ana", "Gomez", "1"))
+        
+        assert repo.buscar("%", 10) == []
+    
+    def test_firma_cambia_con_cada_escritura(self, repo):
+        assert repo.obtener_firma() == (0, None)
+        
+        creado = repo.crear(_alumno("Ana", "Gomez", "1"))
+        otro = repo.crear(_alumno("Juan", "Perez", "2"))
+        assert repo.obtener_firma() == (2, otro.updated_at)
+        
+        repo.eliminar(creado.id)
+        assert repo.obtener_firma() == (1, otro.updated_at)
+    
+    def test_version_crece_con_cada_escritura(self, repo):
+        assert repo.obtener_version() == 0
+        
+        creado = repo.crear(_alumno("Ana", "Gomez", "1"))
+        despues_de_crear = repo.obtener_version()
+        repo.actualizar(creado.actualizar(nombre="Ana Maria"))
+        despues_de_actualizar = repo.obtener_version()
+        repo.eliminar(creado.id)
+        
+        assert 0 < despues_de_crear < despues_de_actualizar < repo.obtener_version()
+
+
+class TestConcurrencia:
+    """Tests de acceso desde varios threads."""
+    
+    def test_escrituras_desde_varios_threads(self, repo):
+        def crear(i):
+            return repo.crear(_alumno("N", f"A{i:03d}", f"D{i}"))
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(crear, range(80)))
+        
+        assert len(repo.listar_todos()) == 80
+    
+    def test_threads_terminados_no_acumulan_conexiones(self, repo):
+        """Un thread por request (servidor threaded de Flask) no deja conexiones abiertas."""
+        for _ in range(50):
+            thread = threading.Thread(target=repo.listar_todos)
+            thread.start()
+            thread.join()
+        
+        # El thread principal (fixture) y, como mucho, el ultimo terminado
+        assert len(repo._conexiones) <= 2
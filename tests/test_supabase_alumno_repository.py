@@ -0,0 +1,330 @@
+# ===========================================================================
+# Tests del Repositorio Supabase
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Fase: 5 - Testing Formal
+# ===========================================================================
+#
+# REGLAS DE TESTING:
+# - Sin Supabase: un cliente falso registra la cadena de llamadas del
+#   query builder (table().select().eq()...) y devuelve respuestas preparadas
+# - Se verifica el request que arma el repositorio y como traduce la respuesta
+#
+# ===========================================================================
+
+"""
+Tests unitarios para SupabaseAlumnoRepository.
+
+Verifica traduccion de errores, filtros de PostgREST y mapeo de filas.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from domain.entities.alumno import Alumno
+from domain.exceptions import (
+    AlumnoNoEncontrado,
+    DNIDuplicado,
+    ModificacionConcurrente,
+    RepositoryError
+)
+from infrastructure.supabase_alumno_repository import SupabaseAlumnoRepository, _quote
+
+
+FILA = {
+    'id': 'a1', 'nombre': 'Juan', 'apellido': 'Perez', 'dni': '12345678',
+    'created_at': '2024-03-01T12:00:00+00:00',
+    'updated_at': '2024-03-02T08:30:00.5+00:00'
+}
+
+
+class RespuestaFalsa:
+    """Stand-in de APIResponse de postgrest."""
+    
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class ErrorPostgrest(Exception):
+    """Como postgrest.APIError: el SQLSTATE en .code."""
+    
+    def __init__(self, code, mensaje):
+        super().__init__(mensaje)
+        self.code = code
+
+
+class ConsultaFalsa:
+    """Query builder falso: registra cada metodo encadenado."""
+    
+    def __init__(self, cliente, origen):
+        self._cliente = cliente
+        self.origen = origen
+        self.llamadas = []
+    
+    def __getattr__(self, metodo):
+        if metodo.startswith('_'):
+            raise AttributeError(metodo)
+        
+        def registrar(*args, **kwargs):
+            self.llamadas.append((metodo, args, kwargs))
+            return self
+        return registrar
+    
+    def execute(self):
+        respuesta = self._cliente.respuestas.pop(0)
+        if isinstance(respuesta, Exception):
+            raise respuesta
+        if isinstance(respuesta, RespuestaFalsa):
+            return respuesta
+        return RespuestaFalsa(respuesta)
+    
+    def metodos(self):
+        return [metodo for metodo, _, _ in self.llamadas]
+    
+    def argumentos(self, metodo):
+        """(args, kwargs) de la primera llamada a ese metodo."""
+        return next((a, k) for m, a, k in self.llamadas if m == metodo)
+
+
+class ClienteFalso:
+    """Stand-in del cliente Supabase: cada respuesta se consume con execute()."""
+    
+    def __init__(self, *respuestas):
+        self.respuestas = list(respuestas)
+        self.consultas = []
+    
+    def table(self, nombre):
+        consulta = ConsultaFalsa(self, nombre)
+        self.consultas.append(consulta)
+        return consulta
+    
+    def rpc(self, funcion, parametros):
+        consulta = ConsultaFalsa(self, f'rpc:{funcion}')
+        consulta.llamadas.append(('rpc', (parametros,), {}))
+        self.consultas.append(consulta)
+        return consulta
+
+
+def _repo(*respuestas):
+    """Repositorio con el cliente falso ya inyectado."""
+    repo = SupabaseAlumnoRepository()
+    repo._client = ClienteFalso(*respuestas)
+    return repo
+
+
+def _nuevo(dni="12345678"):
+    return Alumno(nombre="Juan", apellido="Perez", dni=dni)
+
+
+class TestCrear:
+    """Tests del INSERT unico y la traduccion de 23505."""
+    
+    def test_un_solo_insert_y_mapea_la_fila(self):
+        repo = _repo([FILA])
+        
+        creado = repo.crear(_nuevo())
+        
+        consulta, = repo.client.consultas
+        assert consulta.metodos() == ['insert']
+        assert consulta.argumentos('insert')[0] == (
+            {'nombre': 'Juan', 'apellido': 'Perez', 'dni': '12345678'},
+        )
+        assert creado.id == 'a1'
+        assert creado.updated_at == datetime(2024, 3, 2, 8, 30, 0, 500000, tzinfo=timezone.utc)
+    
+    def test_codigo_23505_es_dni_duplicado(self):
+        repo = _repo(ErrorPostgrest('23505', 'duplicate key'))
+        
+        with pytest.raises(DNIDuplicado):
+            repo.crear(_nuevo())
+    
+    def test_mensaje_duplicate_key_es_dni_duplicado(self):
+        error = Exception('duplicate key value violates unique constraint "alumnos_dni_key"')
+        
+        with pytest.raises(DNIDuplicado):
+            _repo(error).crear(_nuevo())
+    
+    def test_mensaje_con_sqlstate_es_dni_duplicado(self):
+        with pytest.raises(DNIDuplicado):
+            _repo(Exception("{'code': '23505'}")).crear(_nuevo())
+    
+    def test_otro_error_es_repository_error(self):
+        with pytest.raises(RepositoryError):
+            _repo(ErrorPostgrest('23514', 'check violation')).crear(_nuevo())
+    
+    def test_respuesta_vacia_es_repository_error(self):
+        with pytest.raises(RepositoryError):
+            _repo([]).crear(_nuevo())
+
+
+class TestCrearLote:
+    """Tests del INSERT ... ON CONFLICT DO NOTHING."""
+    
+    def test_upsert_ignora_duplicados(self):
+        repo = _repo([FILA])
+        
+        creados = repo.crear_lote([_nuevo(), _nuevo("87654321")])
+        
+        args, kwargs = repo.client.consultas[0].argumentos('upsert')
+        assert len(args[0]) == 2
+        assert kwargs == {'on_conflict': 'dni', 'ignore_duplicates': True}
+        assert [a.id for a in creados] == ['a1']
+    
+    def test_lote_vacio_no_consulta(self):
+        repo = _repo()
+        
+        assert repo.crear_lote([]) == []
+        assert repo.client.consultas == []
+
+
+class TestLotesIn:
+    """Tests del particionado de in_() en las busquedas masivas."""
+    
+    def test_dnis_normalizados_sin_repetir_y_en_lotes(self):
+        repo = _repo([{'dni': 'A1'}], [], [{'dni': 'C3'}])
+        repo.TAMANO_LOTE_IN = 2
+        
+        existentes = repo.existe_dni_many(['c3', 'a1', ' b2 ', 'A1', 'd4', 'E5'])
+        
+        lotes = [c.argumentos('in_')[0] for c in repo.client.consultas]
+        assert lotes == [('dni', ['A1', 'B2']), ('dni', ['C3', 'D4']), ('dni', ['E5'])]
+        assert existentes == {'A1', 'C3'}
+
+
+class TestKeyset:
+    """Tests del filtro or_() de la paginacion keyset."""
+    
+    def test_quote_escapa_comillas_y_barras(self):
+        assert _quote('a,b') == '"a,b"'
+        assert _quote('O"Neil\\') == '"O\\"Neil\\\\"'
+    
+    def test_cursor_con_caracteres_de_postgrest(self):
+        repo = _repo([FILA])
+        
+        repo.listar_pagina(10, ('Perez, (h)', 'Ana.Maria', 'id-1'))
+        
+        consulta = repo.client.consultas[0]
+        (filtro,), _ = consulta.argumentos('or_')
+        assert filtro == (
+            'apellido.gt."Perez, (h)",'
+            'and(apellido.eq."Perez, (h)",nombre.gt."Ana.Maria"),'
+            'and(apellido.eq."Perez, (h)",nombre.eq."Ana.Maria",id.gt."id-1")'
+        )
+        assert consulta.metodos() == ['select', 'or_', 'order', 'order', 'order', 'limit']
+    
+    def test_primera_pagina_sin_filtro(self):
+        repo = _repo([])
+        
+        repo.listar_pagina(10)
+        
+        assert 'or_' not in repo.client.consultas[0].metodos()
+
+
+class TestActualizar:
+    """Tests del UPDATE condicional (412 vs 404)."""
+    
+    ESPERADO = datetime(2024, 3, 2, 8, 30, tzinfo=timezone.utc)
+    
+    def _alumno(self):
+        return Alumno(id='a1', nombre="Juan", apellido="Perez", dni="12345678")
+    
+    def test_precondicion_va_en_el_where(self):
+        repo = _repo([FILA])
+        
+        repo.actualizar(self._alumno(), self.ESPERADO)
+        
+        consulta, = repo.client.consultas
+        filtros = [a for m, a, _ in consulta.llamadas if m == 'eq']
+        assert filtros == [('id', 'a1'), ('updated_at', self.ESPERADO.isoformat())]
+    
+    def test_existe_pero_cambio_es_modificacion_concurrente(self):
+        repo = _repo([], [FILA])
+        
+        with pytest.raises(ModificacionConcurrente):
+            repo.actualizar(self._alumno(), self.ESPERADO)
+    
+    def test_no_existe_con_precondicion_es_no_encontrado(self):
+        repo = _repo([], [])
+        
+        with pytest.raises(AlumnoNoEncontrado):
+            repo.actualizar(self._alumno(), self.ESPERADO)
+    
+    def test_no_existe_sin_precondicion_no_relee(self):
+        repo = _repo([])
+        
+        with pytest.raises(AlumnoNoEncontrado):
+            repo.actualizar(self._alumno())
+        
+        assert len(repo.client.consultas) == 1
+    
+    def test_dni_de_otro_alumno_es_dni_duplicado(self):
+        with pytest.raises(DNIDuplicado):
+            _repo(ErrorPostgrest('23505', 'duplicate key')).actualizar(self._alumno())
+
+
+class TestFirmaYVersion:
+    """Tests de obtener_firma y obtener_version."""
+    
+    def test_firma_con_count_y_ultima_fecha(self):
+        repo = _repo(RespuestaFalsa([{'updated_at': FILA['updated_at']}], count=3))
+        
+        cantidad, ultima = repo.obtener_firma()
+        
+        consulta = repo.client.consultas[0]
+        assert consulta.argumentos('select') == (('updated_at',), {'count': 'exact'})
+        assert consulta.argumentos('order') == (('updated_at',), {'desc': True})
+        assert (cantidad, ultima) == (3, datetime(2024, 3, 2, 8, 30, 0, 500000, tzinfo=timezone.utc))
+    
+    def test_firma_tabla_vacia(self):
+        assert _repo(RespuestaFalsa([], count=0)).obtener_firma() == (0, None)
+    
+    def test_version_lee_una_fila_de_table_versions(self):
+        repo = _repo([{'version': 42}])
+        
+        assert repo.obtener_version() == 42
+        
+        consulta = repo.client.consultas[0]
+        assert consulta.origen == 'table_versions'
+        assert consulta.argumentos('eq') == (('tabla', 'alumnos'), {})
+    
+    def test_version_sin_fila_es_none(self):
+        assert _repo([]).obtener_version() is None
+    
+    def test_version_con_error_es_repository_error(self):
+        with pytest.raises(RepositoryError):
+            _repo(ErrorPostgrest('42P01', 'relation does not exist')).obtener_version()
+
+
+
+class TestCerrar:
+    """Tests del apagado (cierra el pool httpx del singleton)."""
+    
+    def test_cierra_el_cliente_usado(self):
+        repo = _repo()
+        
+        with patch('infrastructure.supabase_alumno_repository.reset_client') as reset:
+            repo.cerrar()
+            repo.cerrar()
+        
+        reset.assert_called_once_with()
+    
+    def test_sin_cliente_no_hace_nada(self):
+        with patch('infrastructure.supabase_alumno_repository.reset_client') as reset:
+            SupabaseAlumnoRepository().cerrar()
+        
+        reset.assert_not_called()
+
+
+# ===========================================================================
+# Ejecucion directa (para debug)
+# ===========================================================================
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,149 @@
+# ===========================================================================
+# Tests del Cache de Tokens Verificados
+# ===========================================================================
+# Proyecto: App Didactica CRUD de Alumnos
+# Fase: 5 - Testing Formal
+# ===========================================================================
+#
+# REGLAS DE TESTING:
+# - Sin credenciales reales: los JWT se firman con un secreto de prueba
+# - Reloj inyectado: los tests de vencimiento no usan sleep
+#
+# ===========================================================================
+
+"""
+Tests unitarios para TokenCache y su uso en _validate_jwt.
+
+Verifica hits/misses, vencimiento por 'exp', LRU y que un token
+vencido siga lanzando SessionExpiredError.
+"""
+
+import time
+import pytest
+from unittest.mock import patch, MagicMock
+
+# Configuracion de path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import jwt
+
+from api.middleware import auth
+from api.middleware.token_cache import TokenCache
+from domain.exceptions import SessionExpiredError
+
+
+SECRETO = 'secreto-de-prueba-de-32-bytes-min'
+
+
+class RelojFalso:
+    """Reloj controlable para probar vencimientos."""
+    
+    def __init__(self):
+        self.ahora = 1000.0
+    
+    def __call__(self) -> float:
+        return self.ahora
+
+
+@pytest.fixture
+def reloj():
+    """Fixture con un reloj controlable."""
+    return RelojFalso()
+
+
+@pytest.fixture
+def cache(reloj):
+    """Fixture con un cache chico."""
+    return TokenCache(max_size=2, reloj=reloj)
+
+
+@pytest.fixture
+def config_falsa():
+    """Fixture que reemplaza la configuracion y limpia el cache global."""
+    config = MagicMock(SUPABASE_JWT_SECRET=SECRETO, JWT_CACHE_MAX_SIZE=16)
+    auth.reset_token_cache()
+    with patch('infrastructure.config.get_config', return_value=config):
+        yield config
+    auth.reset_token_cache()
+
+
+def _firmar(exp: float) -> str:
+    """Crea un JWT HS256 de prueba."""
+    return jwt.encode({'sub': 'user-123', 'exp': int(exp)}, SECRETO, algorithm='HS256')
+
+
+class TestTokenCache:
+    """Tests del cache en si."""
+    
+    def test_segunda_lectura_es_hit(self, cache):
+        """Verifica que un token guardado se sirve desde cache."""
+        cache.put('token', {'sub': 'u', 'exp': 2000})
+        
+        assert cache.get('token') == {'sub': 'u', 'exp': 2000}
+        assert cache.estadisticas()['hits'] == 1
+    
+    def test_token_vencido_es_miss(self, cache, reloj):
+        """Verifica que pasado el 'exp' la entrada se descarta."""
+        cache.put('token', {'sub': 'u', 'exp': 2000})
+        reloj.ahora = 2000
+        
+        assert cache.get('token') is None
+        stats = cache.estadisticas()
+        assert stats['evictions'] == 1
+        assert stats['size'] == 0
+    
+    def test_lru_respeta_tamano_maximo(self, cache):
+        """Verifica que el cache no supera max_size."""
+        for i in range(3):
+            cache.put(f'token-{i}', {'exp': 2000})
+        
+        assert cache.get('token-0') is None
+        assert cache.estadisticas()['size'] == 2
+    
+    def test_payload_devuelto_es_copia(self, cache):
+        """Verifica que modificar el payload no altera el cache."""
+        cache.put('token', {'sub': 'u', 'exp': 2000})
+        
+        cache.get('token')['sub'] = 'otro'
+        
+        assert cache.get('token')['sub'] == 'u'
+    
+    def test_token_sin_exp_no_se_guarda(self, cache):
+        """Verifica que sin 'exp' no se cachea."""
+        cache.put('token', {'sub': 'u'})
+        
+        assert cache.estadisticas()['size'] == 0
+
+
+class TestValidateJwtConCache:
+    """Tests de _validate_jwt usando el cache global."""
+    
+    def test_token_repetido_no_se_vuelve_a_verificar(self, config_falsa):
+        """Verifica que la segunda validacion no llama a jwt.decode."""
+        token = _firmar(time.time() + 3600)
+        auth._validate_jwt(token)
+        
+        with patch('jwt.decode') as decode:
+            payload = auth._validate_jwt(token)
+        
+        decode.assert_not_called()
+        assert payload['sub'] == 'user-123'
+        assert auth.get_token_cache().estadisticas()['hit_rate'] == 0.5
+    
+    def test_token_vencido_lanza_session_expired(self, config_falsa):
+        """Verifica que un token vencido sigue fallando."""
+        token = _firmar(time.time() - 10)
+        
+        with pytest.raises(SessionExpiredError):
+            auth._validate_jwt(token)
+        
+        assert auth.get_token_cache().estadisticas()['size'] == 0
+
+
+# ===========================================================================
+# Ejecucion directa (para debug)
+# ===========================================================================
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])